@@ -86,9 +86,10 @@ async def discover_dpp(request: DiscoverDppRequest, background_tasks: Background
             governance=request.governance
         )
         
-        return DiscoverDppResponse(
+        # Every field is set right here, so the response is built without validation
+        return DiscoverDppResponse.model_construct(
             taskId=task_id,
-            status=DiscoveryStatus(
+            status=DiscoveryStatus.model_construct(
                 status="in_progress",
                 step="parsing",
                 message="Discovery task started",
@@ -130,9 +131,11 @@ async def get_discovery_status(task_id: str):
     
     task = discovery_manager.task_manager.get_task(task_id)
     
-    return DiscoverDppResponse(
+    # Status is polled by clients, so the response is built without validation:
+    # the task manager only stores the typed values set through update_task
+    return DiscoverDppResponse.model_construct(
         taskId=task_id,
-        status=DiscoveryStatus(
+        status=DiscoveryStatus.model_construct(
             status=task["status"],
             step=task["step"],
             message=task["message"],
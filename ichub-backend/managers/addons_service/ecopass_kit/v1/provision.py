@@ -274,25 +274,24 @@ class ProvisionManager:
         if not db_catalog_part.legal_entity:
             return None
 
-        # Get DPP data
-        aspect_data = self.submodel_service_manager.get_twin_aspect_document(
-            submodel_id=dpp_aspect.submodel_id,
-            semantic_id=dpp_aspect.semantic_id
-        )
-
-        # Extract passport ID from metadata
-        passport_id = (
-            aspect_data.get("metadata", {}).get("passportId")
-            or aspect_data.get("passportId")
-            or ""
-        )
-
-        # If no passport ID in metadata, construct from part data
-        if not passport_id:
-            manufacturer_part_id = db_catalog_part.manufacturer_part_id or ""
-            # For catalog parts, partInstanceId is from the DPP ID
-            part_instance_id = dpp_id.split(":")[-1] if ":" in dpp_id else ""
-            passport_id = f"CX:{manufacturer_part_id}:{part_instance_id}"
+        # Construct the passport ID from part data first;
+        # for catalog parts, partInstanceId is from the DPP ID
+        manufacturer_part_id = db_catalog_part.manufacturer_part_id or ""
+        part_instance_id = dpp_id.rsplit(":", 1)[-1] if ":" in dpp_id else ""
+        passport_id = f"CX:{manufacturer_part_id}:{part_instance_id}"
+
+        # Only fetch the DPP document when the DB columns do not already identify it,
+        # to check for a passport ID override in the metadata
+        if passport_id != dpp_id:
+            aspect_data = self.submodel_service_manager.get_twin_aspect_document(
+                submodel_id=dpp_aspect.submodel_id,
+                semantic_id=dpp_aspect.semantic_id
+            )
+            passport_id = (
+                aspect_data.get("metadata", {}).get("passportId")
+                or aspect_data.get("passportId")
+                or ""
+            )
 
         # Check if this matches the requested DPP ID
         if passport_id == dpp_id:
@@ -385,24 +384,23 @@ class ProvisionManager:
         if not partner_catalog_part or not partner_catalog_part.catalog_part:
             return None
 
-        # Get DPP data
-        aspect_data = self.submodel_service_manager.get_twin_aspect_document(
-            submodel_id=dpp_aspect.submodel_id,
-            semantic_id=dpp_aspect.semantic_id
-        )
-
-        # Extract passport ID from metadata
-        passport_id = (
-            aspect_data.get("metadata", {}).get("passportId")
-            or aspect_data.get("passportId")
-            or ""
-        )
-
-        # If no passport ID in metadata, construct from part data
-        if not passport_id:
-            manufacturer_part_id = partner_catalog_part.catalog_part.manufacturer_part_id or ""
-            part_instance_id = db_serialized_part.part_instance_id or ""
-            passport_id = f"CX:{manufacturer_part_id}:{part_instance_id}"
+        # Construct the passport ID from part data first
+        manufacturer_part_id = partner_catalog_part.catalog_part.manufacturer_part_id or ""
+        part_instance_id = db_serialized_part.part_instance_id or ""
+        passport_id = f"CX:{manufacturer_part_id}:{part_instance_id}"
+
+        # Only fetch the DPP document when the DB columns do not already identify it,
+        # to check for a passport ID override in the metadata
+        if passport_id != dpp_id:
+            aspect_data = self.submodel_service_manager.get_twin_aspect_document(
+                submodel_id=dpp_aspect.submodel_id,
+                semantic_id=dpp_aspect.semantic_id
+            )
+            passport_id = (
+                aspect_data.get("metadata", {}).get("passportId")
+                or aspect_data.get("passportId")
+                or ""
+            )
 
         # Check if this matches the requested DPP ID
         if passport_id == dpp_id:
@@ -23,6 +23,7 @@
 
 """Custom submodel adapters for Industry Core Hub."""
 
-from .http_submodel_adapter import HttpSubmodelAdapter
+from .http_submodel_adapter import BaseHttpSubmodelAdapter, HttpSubmodelAdapter
+from .async_http_submodel_adapter import AsyncHttpSubmodelAdapter
 
-__all__ = ["HttpSubmodelAdapter"]
+__all__ = ["BaseHttpSubmodelAdapter", "HttpSubmodelAdapter", "AsyncHttpSubmodelAdapter"]
@@ -0,0 +1,330 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+from typing import Dict, Any, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import httpx
+
+from managers.enablement_services.adapters.http_submodel_adapter import (
+    BaseHttpSubmodelAdapter,
+    DEFAULT_MAX_RETRIES,
+)
+from tools.exceptions import ServiceUnavailableError
+
+# Default number of in-flight requests for the batch operations
+DEFAULT_BATCH_CONCURRENCY = 20
+
+
+class AsyncHttpSubmodelAdapter(BaseHttpSubmodelAdapter):
+    """
+    Asynchronous HTTP adapter for external submodel services.
+
+    Exposes the same semantic-aware operations as HttpSubmodelAdapter as
+    coroutines backed by a single httpx.AsyncClient, so that callers can
+    dispatch many submodel operations concurrently (e.g. with asyncio.gather)
+    over a shared connection pool.
+
+    The adapter must be closed with aclose(), or used as an async context manager:
+
+        async with AsyncHttpSubmodelAdapter(base_url=...) as adapter:
+            await adapter.read_submodel(semantic_id, submodel_id)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_path: str = "",
+        auth_type: str = "apikey",
+        auth_token: Optional[str] = None,
+        auth_key_name: Optional[str] = None,
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        max_retries: int = DEFAULT_MAX_RETRIES
+    ):
+        """
+        Initialize the asynchronous HTTP submodel adapter.
+
+        Args:
+            base_url: Base URL of the external submodel service (e.g., "https://external-ichub.com")
+            api_path: Optional API path prefix (e.g., "/api/v1")
+            auth_type: Authentication type - "bearer" or "apikey" (default: "apikey")
+            auth_token: Authentication token/key value
+            auth_key_name: Header name for API key (e.g., "X-Api-Key"), required when auth_type="apikey"
+            timeout: Request timeout in seconds (default: 30)
+            verify_ssl: Whether to verify SSL certificates (default: True)
+            max_retries: Maximum retries for transient failures (default: 5)
+        """
+        super().__init__(
+            base_url=base_url,
+            api_path=api_path,
+            auth_type=auth_type,
+            auth_token=auth_token,
+            auth_key_name=auth_key_name,
+            timeout=timeout,
+            verify_ssl=verify_ssl,
+            max_retries=max_retries
+        )
+
+        # Initialize async HTTP client
+        self.client = httpx.AsyncClient(**self._get_client_options())
+
+        self.logger.info(f"AsyncHttpSubmodelAdapter initialized for {self.base_url}")
+        if self.auth_type != "none":
+            self.logger.info(f"Authentication type: {self.auth_type}")
+
+    async def _request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send an HTTP request, retrying transient failures with backoff.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional arguments passed to httpx.AsyncClient.request
+
+        Returns:
+            The last HTTP response received
+
+        Raises:
+            httpx.RequestError: If the request still fails after all retries
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if not self._should_retry(method, attempt, error=e):
+                    raise
+                delay = self._get_retry_delay(attempt)
+                self._log_retry(method, url, attempt, delay, e)
+            else:
+                if not self._should_retry(method, attempt, response=response):
+                    return response
+                delay = self._get_retry_delay(attempt, response)
+                self._log_retry(method, url, attempt, delay, f"status {response.status_code}")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send an HTTP request through the circuit breaker.
+
+        Raises:
+            ServiceUnavailableError: If the circuit breaker is open (no request is sent)
+            httpx.RequestError: If the request still fails after all retries
+        """
+        self._breaker.before_call()
+        try:
+            response = await self._request_with_retry(method, url, **kwargs)
+        except httpx.RequestError:
+            self._breaker.record_failure()
+            raise
+        except BaseException:
+            # e.g. a cancelled task: without this, a cancelled probe would leave the breaker half-open
+            self._breaker.record_abort()
+            raise
+        self._record_response(response)
+        return response
+    
+    async def read_submodel(self, semantic_id: str, submodel_id: UUID) -> Dict[str, Any]:
+        """
+        Retrieve a submodel from the external service.
+
+        Args:
+            semantic_id: Original semantic ID
+            submodel_id: Submodel UUID
+
+        Returns:
+            Submodel content as dictionary
+
+        Raises:
+            NotFoundError: If submodel doesn't exist
+            RuntimeError: On connection or server errors
+        """
+        url = self._build_url(semantic_id, submodel_id)
+        self.logger.info("GET %s", url)
+
+        cached = self._get_cached_validator(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        try:
+            response = await self._request("GET", url, headers=headers)
+            return self._handle_read_response(url, response, cached)
+        except httpx.RequestError as e:
+            error_msg = f"Connection error while reading submodel: {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+
+    async def write_submodel(
+        self,
+        semantic_id: str,
+        submodel_id: UUID,
+        content: Dict[str, Any]
+    ) -> None:
+        """
+        Upload/create a submodel in the external service.
+
+        Args:
+            semantic_id: Original semantic ID
+            submodel_id: Submodel UUID
+            content: Submodel data to upload
+
+        Raises:
+            InvalidError: If content is invalid
+            RuntimeError: On connection or server errors
+        """
+        url = self._build_url(semantic_id, submodel_id)
+        self.logger.info("POST %s", url)
+
+        try:
+            response = await self._request(
+                "POST",
+                url,
+                content=self._encode_json(content)
+            )
+            self._handle_response(response, "POST")
+            self.logger.info("Submodel %s uploaded successfully", submodel_id)
+        except httpx.RequestError as e:
+            error_msg = f"Connection error while writing submodel: {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+        finally:
+            # Invalidate once the request is done, so that a concurrent read cannot
+            # re-cache the old state while the change is still in flight
+            self._invalidate_cached_response(url)
+
+    async def delete_submodel(self, semantic_id: str, submodel_id: UUID) -> None:
+        """
+        Delete a submodel from the external service.
+
+        Args:
+            semantic_id: Original semantic ID
+            submodel_id: Submodel UUID
+
+        Raises:
+            NotFoundError: If submodel doesn't exist
+            RuntimeError: On connection or server errors
+        """
+        url = self._build_url(semantic_id, submodel_id)
+        self.logger.info("DELETE %s", url)
+
+        try:
+            response = await self._request("DELETE", url)
+            self._handle_response(response, "DELETE")
+            self.logger.info("Submodel %s deleted successfully", submodel_id)
+        except httpx.RequestError as e:
+            error_msg = f"Connection error while deleting submodel: {e}"
+            self.logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+        finally:
+            self._invalidate_cached_response(url)
+
+    async def exists_submodel(self, semantic_id: str, submodel_id: UUID) -> bool:
+        """
+        Check if a submodel exists in the external service.
+
+        Args:
+            semantic_id: Original semantic ID
+            submodel_id: Submodel UUID
+
+        Returns:
+            True if submodel exists, False otherwise
+        """
+        url = self._build_url(semantic_id, submodel_id)
+        self.logger.debug("HEAD %s", url)
+
+        cached_exists = self._get_cached_exists(url)
+        if cached_exists is not None:
+            self.logger.debug("Submodel exists check (cached): %s", cached_exists)
+            return cached_exists
+
+        try:
+            response = await self._request("HEAD", url)
+            exists = self._handle_exists_response(url, response)
+            self.logger.debug("Submodel exists check: %s", exists)
+            return exists
+        except (httpx.RequestError, ServiceUnavailableError) as e:
+            self.logger.warning("Failed to check submodel existence: %s", e)
+            return False
+
+    async def exists_many(
+        self,
+        pairs: List[Tuple[str, UUID]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> List[bool]:
+        """
+        Check the existence of many submodels concurrently.
+
+        Args:
+            pairs: List of (semantic_id, submodel_id) tuples
+            concurrency: Maximum number of requests in flight (default: 20)
+
+        Returns:
+            List of existence flags, in the same order as the input pairs
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def check(semantic_id: str, submodel_id: UUID) -> bool:
+            async with semaphore:
+                return await self.exists_submodel(semantic_id, submodel_id)
+
+        return await asyncio.gather(*(check(semantic_id, submodel_id) for semantic_id, submodel_id in pairs))
+
+    async def read_many(
+        self,
+        pairs: List[Tuple[str, UUID]],
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve many submodels concurrently.
+
+        Args:
+            pairs: List of (semantic_id, submodel_id) tuples
+            concurrency: Maximum number of requests in flight (default: 20)
+
+        Returns:
+            List of submodel contents, in the same order as the input pairs
+
+        Raises:
+            NotFoundError: If any of the submodels doesn't exist
+            RuntimeError: On connection or server errors
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def read(semantic_id: str, submodel_id: UUID) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.read_submodel(semantic_id, submodel_id)
+
+        return await asyncio.gather(*(read(semantic_id, submodel_id) for semantic_id, submodel_id in pairs))
+
+    async def aclose(self) -> None:
+        """Close the underlying async HTTP client. Safe to call more than once."""
+        if not self.client.is_closed:
+            await self.client.aclose()
+            self.logger.debug("Async HTTP client closed")
+
+    async def __aenter__(self) -> "AsyncHttpSubmodelAdapter":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
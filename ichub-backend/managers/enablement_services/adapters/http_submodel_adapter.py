@@ -23,27 +23,90 @@
 
 # TODO: Move to Tractus-X SDK if it can be generalized for any HTTP-based submodel service
 
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, Type
 from uuid import UUID
 from urllib.parse import quote
+import json
+import logging
+import random
+import threading
+import time
 import httpx
 
 from tractusx_sdk.industry.adapters import SubmodelAdapter
 from managers.config.log_manager import LoggingManager
-from tools.exceptions import InvalidError, NotFoundError
+from tools.circuit_breaker import CircuitBreaker
+from tools.exceptions import InvalidError, NotFoundError, ServiceUnavailableError
 from tools.constants import JSON_EXTENSION
 
+# Retry policy for transient HTTP failures (exponential backoff with full jitter)
+DEFAULT_MAX_RETRIES = 5
+RETRY_BACKOFF_BASE = 0.1
+RETRY_BACKOFF_CAP = 10.0
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+# Transport errors raised before the request reached the server, safe to retry for any method
+PRE_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+# Methods that are safe to repeat after the server may have processed the request
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "DELETE"})
 
-class HttpSubmodelAdapter(SubmodelAdapter):
+# Connection pool shared by all requests of an adapter, so bursts reuse keep-alive
+# connections instead of paying a new TCP/TLS handshake per request
+MAX_CONNECTIONS = 200
+MAX_KEEPALIVE_CONNECTIONS = 50
+KEEPALIVE_EXPIRY = 60.0
+CONNECT_TIMEOUT = 5.0
+
+# Circuit breaker: consecutive failed requests before failing fast, and cooldown in seconds
+CIRCUIT_BREAKER_FAIL_MAX = 5
+CIRCUIT_BREAKER_RESET_TIMEOUT = 30.0
+
+# Maximum number of semantic_id mappings kept for path-based operations
+DEFAULT_SEMANTIC_ID_CACHE_SIZE = 10_000
+
+# Status code handling: success codes and mapping of client errors to ICHub exceptions
+SUCCESS_STATUS_CODES = frozenset({200, 201, 204})
+ERROR_STATUS_HANDLERS: Dict[int, Tuple[Type[Exception], str]] = {
+    404: (NotFoundError, "Submodel not found"),
+    400: (InvalidError, "Invalid request"),
+    422: (InvalidError, "Invalid request"),
+    401: (PermissionError, "Authentication/Authorization failed"),
+    403: (PermissionError, "Authentication/Authorization failed"),
+}
+
+# Number of body bytes included in error messages of non-JSON error responses
+ERROR_PREVIEW_BYTES = 200
+
+# Response caches: ETag validated submodel bodies and short-lived existence checks
+RESPONSE_CACHE_SIZE = 1024
+EXISTS_CACHE_TTL = 5.0
+
+
+@lru_cache(maxsize=4096)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, memoized since the same submodel paths are hit repeatedly."""
+    return UUID(value)
+
+
+@lru_cache(maxsize=8192)
+def _build_submodel_url(url_prefix: str, semantic_id: str, submodel_id: UUID) -> str:
+    """Build and memoize a submodel URL, since quoting walks every character of the semantic ID."""
+    # URL structure: {base_url}{api_path}/{semantic_id}/{submodel_id}/submodel
+    # The canonical UUID string only contains URL-safe characters, so it is not quoted
+    encoded_semantic_id = quote(str(semantic_id), safe="")
+    return f"{url_prefix}/{encoded_semantic_id}/{submodel_id}/submodel"
+
+
+class BaseHttpSubmodelAdapter:
     """
-    HTTP adapter for external submodel services.
+    Shared configuration and helpers for HTTP-based submodel adapters.
     
-    This adapter connects to external ICHub-compatible services that expose
-    submodels via REST API. It implements the SubmodelAdapter interface from
-    the Tractus-X SDK to provide seamless integration.
-    
-    The adapter provides both path-based methods (required by the interface)
-    and semantic-aware methods (recommended for HTTP operations).
+    Holds the connection settings, authentication headers, URL building and
+    the mapping of HTTP status codes to ICHub exceptions, so that the
+    synchronous and asynchronous adapters only differ in how the requests
+    are issued.
     """
     
     logger = LoggingManager.get_logger(__name__)
@@ -56,10 +119,11 @@ class HttpSubmodelAdapter(SubmodelAdapter):
         auth_token: Optional[str] = None,
         auth_key_name: Optional[str] = None,
         timeout: int = 30,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        max_retries: int = DEFAULT_MAX_RETRIES
     ):
         """
-        Initialize the HTTP submodel adapter.
+        Initialize the HTTP submodel adapter configuration.
         
         Args:
             base_url: Base URL of the external submodel service (e.g., "https://external-ichub.com")
@@ -69,6 +133,7 @@ class HttpSubmodelAdapter(SubmodelAdapter):
             auth_key_name: Header name for API key (e.g., "X-Api-Key"), required when auth_type="apikey"
             timeout: Request timeout in seconds (default: 30)
             verify_ssl: Whether to verify SSL certificates (default: True)
+            max_retries: Maximum retries for transient failures (default: 5)
         """
         self.base_url = base_url.rstrip('/')
         self.api_path = api_path.rstrip('/') if api_path else ""
@@ -77,6 +142,19 @@ class HttpSubmodelAdapter(SubmodelAdapter):
         self.auth_key_name = auth_key_name
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.max_retries = max_retries
+        
+        # Validate the service URL once, so that requests only need string formatting
+        try:
+            parsed_base_url = httpx.URL(self.base_url)
+        except httpx.InvalidURL as e:
+            raise ValueError(f"Invalid base_url: {self.base_url}. {e}") from e
+        if parsed_base_url.scheme not in ("http", "https") or not parsed_base_url.host:
+            raise ValueError(
+                f"Invalid base_url: {self.base_url}. "
+                f"Expected an absolute http(s) URL"
+            )
+        self._url_prefix = f"{self.base_url}{self.api_path}"
         
         # Validate authentication configuration
         if self.auth_type not in ["bearer", "apikey", "none"]:
@@ -90,22 +168,8 @@ class HttpSubmodelAdapter(SubmodelAdapter):
                 "auth_key_name is required when auth_type='apikey'"
             )
         
-        # Initialize HTTP client
-        self.client = httpx.Client(
-            timeout=timeout,
-            verify=verify_ssl,
-            follow_redirects=True
-        )
-        
-        self.logger.info(f"HttpSubmodelAdapter initialized for {self.base_url}")
-        if self.auth_type != "none":
-            self.logger.info(f"Authentication type: {self.auth_type}")
-        
-        # Cache for semantic_id mapping (SHA256 hash -> original semantic_id)
-        self._semantic_id_cache: Dict[str, str] = {}
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """Build HTTP headers including authentication if configured."""
+        # Headers never change after initialization, so they are built once
+        # and set on the HTTP client instead of being rebuilt for every request
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json"
@@ -117,7 +181,167 @@ class HttpSubmodelAdapter(SubmodelAdapter):
             elif self.auth_type == "apikey" and self.auth_key_name:
                 headers[self.auth_key_name] = self.auth_token
         
-        return headers
+        self._headers = httpx.Headers(headers)
+        
+        # Fail fast instead of waiting for the timeout while the external service is down
+        self._breaker = CircuitBreaker(
+            name=self.base_url,
+            fail_max=CIRCUIT_BREAKER_FAIL_MAX,
+            reset_timeout=CIRCUIT_BREAKER_RESET_TIMEOUT
+        )
+        
+        # LRU caches keyed by submodel URL: (ETag, raw body) for conditional reads
+        # and (exists, expires_at) for existence checks
+        self._etag_cache: OrderedDict[str, Tuple[str, bytes]] = OrderedDict()
+        self._exists_cache: OrderedDict[str, Tuple[bool, float]] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+    
+    def _get_client_options(self) -> Dict[str, Any]:
+        """Get the options shared by the synchronous and asynchronous HTTP clients."""
+        return {
+            "timeout": httpx.Timeout(self.timeout, connect=min(CONNECT_TIMEOUT, self.timeout)),
+            "verify": self.verify_ssl,
+            "follow_redirects": True,
+            "headers": self._headers,
+            "limits": httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            ),
+        }
+    
+    def _get_retry_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """
+        Compute the delay before the next retry attempt.
+        
+        Honors the Retry-After header (in seconds) on 429/503 responses, otherwise
+        applies exponential backoff with full jitter.
+        
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            response: Response of the failed attempt, if any
+            
+        Returns:
+            Delay in seconds, never above RETRY_BACKOFF_CAP
+        """
+        if response is not None and response.status_code in RETRY_AFTER_STATUS_CODES:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return min(RETRY_BACKOFF_CAP, max(0.0, float(retry_after)))
+                except ValueError:
+                    pass
+        return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt))
+    
+    def _should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        error: Optional[httpx.TransportError] = None
+    ) -> bool:
+        """
+        Decide whether a failed attempt should be retried.
+        
+        Non-idempotent methods (POST) are only retried when the request never
+        reached the server; idempotent methods are also retried on timeouts,
+        other transport errors and transient status codes.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if error is not None:
+            return method in IDEMPOTENT_METHODS or isinstance(error, PRE_REQUEST_ERRORS)
+        return (
+            response is not None
+            and method in IDEMPOTENT_METHODS
+            and response.status_code in RETRYABLE_STATUS_CODES
+        )
+    
+    def _log_retry(self, method: str, url: str, attempt: int, delay: float, reason: Any) -> None:
+        """Log a retry attempt with its number and delay."""
+        self.logger.warning(
+            "%s %s failed (%s), retry %d/%d in %.2fs",
+            method, url, reason, attempt + 1, self.max_retries, delay
+        )
+    
+    @staticmethod
+    def _encode_json(content: Any) -> bytes:
+        """Serialize a request body as compact UTF-8 JSON (no whitespace after separators)."""
+        return json.dumps(content, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    
+    def _record_response(self, response: httpx.Response) -> None:
+        """Report the outcome of a request to the circuit breaker (5xx counts as failure)."""
+        if response.status_code >= 500:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+    
+    def _cache_response(self, cache: OrderedDict, url: str, value: Tuple) -> None:
+        """Store a value in one of the bounded response caches, evicting the least recently used entry."""
+        with self._response_cache_lock:
+            cache[url] = value
+            cache.move_to_end(url)
+            if len(cache) > RESPONSE_CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    def _invalidate_cached_response(self, url: str) -> None:
+        """Drop the cached body and existence check of a submodel after it was modified."""
+        with self._response_cache_lock:
+            self._etag_cache.pop(url, None)
+            self._exists_cache.pop(url, None)
+    
+    def _get_cached_validator(self, url: str) -> Optional[Tuple[str, bytes]]:
+        """Get the (ETag, raw body) cached for a submodel URL, if any."""
+        with self._response_cache_lock:
+            cached = self._etag_cache.get(url)
+            if cached is not None:
+                self._etag_cache.move_to_end(url)
+            return cached
+    
+    def _get_cached_exists(self, url: str) -> Optional[bool]:
+        """Get a cached existence check result if it has not expired yet."""
+        with self._response_cache_lock:
+            cached = self._exists_cache.get(url)
+        if cached is None or cached[1] < time.monotonic():
+            return None
+        return cached[0]
+    
+    def _handle_read_response(
+        self,
+        url: str,
+        response: httpx.Response,
+        cached: Optional[Tuple[str, bytes]]
+    ) -> Any:
+        """
+        Handle a GET response, serving 304 Not Modified from the ETag cache.
+        
+        Args:
+            url: Submodel URL, used as cache key
+            response: HTTP response object
+            cached: The (ETag, raw body) sent as If-None-Match validator, if any
+            
+        Returns:
+            Response JSON content
+        """
+        if response.status_code == 304 and cached is not None:
+            self.logger.info("HTTP GET not modified, using cached submodel")
+            return json.loads(cached[1])
+        
+        if response.status_code == 404:
+            self._invalidate_cached_response(url)
+        
+        result = self._handle_response(response, "GET")
+        etag = response.headers.get("ETag")
+        if etag and result is not None:
+            self._cache_response(self._etag_cache, url, (etag, response.content))
+        return result
+    
+    def _handle_exists_response(self, url: str, response: httpx.Response) -> bool:
+        """Evaluate a HEAD response, caching definitive answers (200/404) for a short time."""
+        exists = response.status_code == 200
+        if response.status_code in (200, 404):
+            self._cache_response(self._exists_cache, url, (exists, time.monotonic() + EXISTS_CACHE_TTL))
+        return exists
     
     def _build_url(self, semantic_id: str, submodel_id: UUID) -> str:
         """
@@ -130,14 +354,7 @@ class HttpSubmodelAdapter(SubmodelAdapter):
         Returns:
             Full URL for the submodel endpoint
         """
-        # URL structure: {base_url}{api_path}/{semantic_id}/{submodel_id}/submodel
-        encoded_semantic_id = quote(str(semantic_id), safe="")
-        encoded_submodel_id = quote(str(submodel_id), safe="")
-        url = (
-            f"{self.base_url}{self.api_path}/{encoded_semantic_id}/"
-            f"{encoded_submodel_id}/submodel"
-        )
-        return url
+        return _build_submodel_url(self._url_prefix, semantic_id, submodel_id)
     
     def _handle_response(self, response: httpx.Response, operation: str) -> Any:
         """
@@ -159,37 +376,151 @@ class HttpSubmodelAdapter(SubmodelAdapter):
         status = response.status_code
         
         # Success cases
-        if status in (200, 201, 204):
-            self.logger.info(f"HTTP {operation} successful: {status}")
+        if status in SUCCESS_STATUS_CODES:
+            self.logger.info("HTTP %s successful: %s", operation, status)
             if status == 204 or not response.content:
                 return None
             try:
-                return response.json()
-            except Exception as e:
-                self.logger.warning(f"Failed to parse JSON response: {e}")
+                return json.loads(response.content)
+            except ValueError as e:
+                self.logger.warning("Failed to parse JSON response: %s", e)
                 return None
         
         # Error cases - map to ICHub exceptions
         error_msg = f"HTTP {operation} failed with status {status}"
         try:
-            error_detail = response.json()
+            error_detail = json.loads(response.content)
             error_msg += f": {error_detail}"
-        except Exception:
-            error_msg += f": {response.text[:200]}"
+        except ValueError:
+            # Decode only the preview bytes instead of the whole (possibly large) body
+            preview = response.content[:ERROR_PREVIEW_BYTES].decode("utf-8", errors="replace")
+            error_msg += f": {preview}"
         
         self.logger.error(error_msg)
         
-        if status == 404:
-            raise NotFoundError(f"Submodel not found: {error_msg}")
-        elif status in (400, 422):
-            raise InvalidError(f"Invalid request: {error_msg}")
-        elif status in (401, 403):
-            raise PermissionError(f"Authentication/Authorization failed: {error_msg}")
-        elif status >= 500:
+        handler = ERROR_STATUS_HANDLERS.get(status)
+        if handler is not None:
+            exception_class, reason = handler
+            raise exception_class(f"{reason}: {error_msg}")
+        if status >= 500:
             raise RuntimeError(f"Server error: {error_msg}. Please retry later.")
-        else:
-            raise RuntimeError(f"Unexpected error: {error_msg}")
+        raise RuntimeError(f"Unexpected error: {error_msg}")
+
+
+class HttpSubmodelAdapter(BaseHttpSubmodelAdapter, SubmodelAdapter):
+    """
+    HTTP adapter for external submodel services.
+    
+    This adapter connects to external ICHub-compatible services that expose
+    submodels via REST API. It implements the SubmodelAdapter interface from
+    the Tractus-X SDK to provide seamless integration.
+    
+    The adapter provides both path-based methods (required by the interface)
+    and semantic-aware methods (recommended for HTTP operations).
+    """
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_path: str = "",
+        auth_type: str = "apikey",
+        auth_token: Optional[str] = None,
+        auth_key_name: Optional[str] = None,
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        semantic_id_cache_size: int = DEFAULT_SEMANTIC_ID_CACHE_SIZE
+    ):
+        """
+        Initialize the HTTP submodel adapter.
+        
+        Args:
+            base_url: Base URL of the external submodel service (e.g., "https://external-ichub.com")
+            api_path: Optional API path prefix (e.g., "/api/v1")
+            auth_type: Authentication type - "bearer" or "apikey" (default: "apikey")
+            auth_token: Authentication token/key value
+            auth_key_name: Header name for API key (e.g., "X-Api-Key"), required when auth_type="apikey"
+            timeout: Request timeout in seconds (default: 30)
+            verify_ssl: Whether to verify SSL certificates (default: True)
+            max_retries: Maximum retries for transient failures (default: 5)
+            semantic_id_cache_size: Maximum number of cached semantic_id mappings (default: 10000)
+        """
+        super().__init__(
+            base_url=base_url,
+            api_path=api_path,
+            auth_type=auth_type,
+            auth_token=auth_token,
+            auth_key_name=auth_key_name,
+            timeout=timeout,
+            verify_ssl=verify_ssl,
+            max_retries=max_retries
+        )
+        
+        # Initialize HTTP client
+        self.client = httpx.Client(**self._get_client_options())
+        
+        self.logger.info(f"HttpSubmodelAdapter initialized for {self.base_url}")
+        if self.auth_type != "none":
+            self.logger.info(f"Authentication type: {self.auth_type}")
+        
+        # LRU cache for semantic_id mapping (SHA256 hash -> original semantic_id)
+        self._semantic_id_cache: OrderedDict[str, str] = OrderedDict()
+        self._semantic_id_cache_size = semantic_id_cache_size
+        self._semantic_id_cache_lock = threading.Lock()
 
+    def _request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send an HTTP request, retrying transient failures with backoff.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Additional arguments passed to httpx.Client.request
+            
+        Returns:
+            The last HTTP response received
+            
+        Raises:
+            httpx.RequestError: If the request still fails after all retries
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if not self._should_retry(method, attempt, error=e):
+                    raise
+                delay = self._get_retry_delay(attempt)
+                self._log_retry(method, url, attempt, delay, e)
+            else:
+                if not self._should_retry(method, attempt, response=response):
+                    return response
+                delay = self._get_retry_delay(attempt, response)
+                self._log_retry(method, url, attempt, delay, f"status {response.status_code}")
+            time.sleep(delay)
+            attempt += 1
+
+    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send an HTTP request through the circuit breaker.
+        
+        Raises:
+            ServiceUnavailableError: If the circuit breaker is open (no request is sent)
+            httpx.RequestError: If the request still fails after all retries
+        """
+        self._breaker.before_call()
+        try:
+            response = self._request_with_retry(method, url, **kwargs)
+        except httpx.RequestError:
+            self._breaker.record_failure()
+            raise
+        except BaseException:
+            # e.g. a cancelled task: without this, a cancelled probe would leave the breaker half-open
+            self._breaker.record_abort()
+            raise
+        self._record_response(response)
+        return response
+    
     def read_submodel(self, semantic_id: str, submodel_id: UUID) -> Dict[str, Any]:
         """
         Retrieve a submodel from the external service.
@@ -206,11 +537,14 @@ class HttpSubmodelAdapter(SubmodelAdapter):
             RuntimeError: On connection or server errors
         """
         url = self._build_url(semantic_id, submodel_id)
-        self.logger.info(f"GET {url}")
+        self.logger.info("GET %s", url)
+        
+        cached = self._get_cached_validator(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
         
         try:
-            response = self.client.get(url, headers=self._get_headers())
-            return self._handle_response(response, "GET")
+            response = self._request("GET", url, headers=headers)
+            return self._handle_read_response(url, response, cached)
         except httpx.RequestError as e:
             error_msg = f"Connection error while reading submodel: {e}"
             self.logger.error(error_msg)
@@ -235,20 +569,24 @@ class HttpSubmodelAdapter(SubmodelAdapter):
             RuntimeError: On connection or server errors
         """
         url = self._build_url(semantic_id, submodel_id)
-        self.logger.info(f"POST {url}")
+        self.logger.info("POST %s", url)
         
         try:
-            response = self.client.post(
+            response = self._request(
+                "POST",
                 url,
-                json=content,
-                headers=self._get_headers()
+                content=self._encode_json(content)
             )
             self._handle_response(response, "POST")
-            self.logger.info(f"Submodel {submodel_id} uploaded successfully")
+            self.logger.info("Submodel %s uploaded successfully", submodel_id)
         except httpx.RequestError as e:
             error_msg = f"Connection error while writing submodel: {e}"
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
+        finally:
+            # Invalidate once the request is done, so that a concurrent read cannot
+            # re-cache the old state while the change is still in flight
+            self._invalidate_cached_response(url)
     
     def delete_submodel(self, semantic_id: str, submodel_id: UUID) -> None:
         """
@@ -263,16 +601,18 @@ class HttpSubmodelAdapter(SubmodelAdapter):
             RuntimeError: On connection or server errors
         """
         url = self._build_url(semantic_id, submodel_id)
-        self.logger.info(f"DELETE {url}")
+        self.logger.info("DELETE %s", url)
         
         try:
-            response = self.client.delete(url, headers=self._get_headers())
+            response = self._request("DELETE", url)
             self._handle_response(response, "DELETE")
-            self.logger.info(f"Submodel {submodel_id} deleted successfully")
+            self.logger.info("Submodel %s deleted successfully", submodel_id)
         except httpx.RequestError as e:
             error_msg = f"Connection error while deleting submodel: {e}"
             self.logger.error(error_msg)
             raise RuntimeError(error_msg) from e
+        finally:
+            self._invalidate_cached_response(url)
     
     def exists_submodel(self, semantic_id: str, submodel_id: UUID) -> bool:
         """
@@ -286,65 +626,102 @@ class HttpSubmodelAdapter(SubmodelAdapter):
             True if submodel exists, False otherwise
         """
         url = self._build_url(semantic_id, submodel_id)
-        self.logger.debug(f"HEAD {url}")
+        self.logger.debug("HEAD %s", url)
+        
+        cached_exists = self._get_cached_exists(url)
+        if cached_exists is not None:
+            self.logger.debug("Submodel exists check (cached): %s", cached_exists)
+            return cached_exists
         
         try:
             # Try HEAD request first (more efficient)
-            response = self.client.head(url, headers=self._get_headers())
-            exists = response.status_code == 200
-            self.logger.debug(f"Submodel exists check: {exists}")
+            response = self._request("HEAD", url)
+            exists = self._handle_exists_response(url, response)
+            self.logger.debug("Submodel exists check: %s", exists)
             return exists
-        except httpx.RequestError as e:
-            self.logger.warning(f"Failed to check submodel existence: {e}")
+        except (httpx.RequestError, ServiceUnavailableError) as e:
+            self.logger.warning("Failed to check submodel existence: %s", e)
             return False
     
-    def read(self, path: str) -> Dict[str, Any]:
+    def _parse_path(self, path: str) -> Tuple[str, UUID]:
         """
-        Read a submodel using path-based access.
+        Split a submodel path into its SHA256 semantic_id hash and submodel UUID.
         
         Path format: {sha256_semantic_id}/{submodel_id}.json
         
-        Note: This method requires semantic_id to be cached or path must contain
-        the original semantic_id. Use read_submodel() for direct HTTP operations.
-        
         Args:
             path: Path to the submodel file
             
         Returns:
-            Submodel content
+            Tuple of (sha256_semantic_id, submodel_id)
             
         Raises:
-            InvalidError: If semantic_id cannot be resolved from path
-            NotFoundError: If submodel doesn't exist
+            InvalidError: If the path or the submodel ID is malformed
         """
-        self.logger.warning(
-            f"Using path-based read() method. Consider using read_submodel() "
-            f"for better HTTP adapter support. Path: {path}"
-        )
-        
-        # Extract sha256_semantic_id and submodel_id from path
-        # Path format: {sha256_semantic_id}/{submodel_id}.json
-        parts = path.split('/')
-        if len(parts) < 2:
+        sha256_semantic_id, separator, remainder = path.partition('/')
+        if not separator:
             raise InvalidError(f"Invalid path format: {path}")
         
-        sha256_semantic_id = parts[0]
-        submodel_filename = parts[1]
+        submodel_filename = remainder.partition('/')[0]
         submodel_id_str = submodel_filename.replace(JSON_EXTENSION, '')
         
         try:
-            submodel_id = UUID(submodel_id_str)
+            submodel_id = _parse_uuid(submodel_id_str)
         except ValueError:
             raise InvalidError(f"Invalid submodel ID in path: {submodel_id_str}")
         
-        # Try to get original semantic_id from cache
-        semantic_id = self._semantic_id_cache.get(sha256_semantic_id)
+        return sha256_semantic_id, submodel_id
+    
+    def _resolve_path(self, path: str, semantic_method: str) -> Tuple[str, UUID]:
+        """
+        Resolve a submodel path into the original semantic_id and submodel UUID.
+        
+        Args:
+            path: Path to the submodel file
+            semantic_method: Name of the semantic-aware method suggested in the error message
+            
+        Returns:
+            Tuple of (semantic_id, submodel_id)
+            
+        Raises:
+            InvalidError: If the path is malformed or the semantic_id is not cached
+        """
+        sha256_semantic_id, submodel_id = self._parse_path(path)
+        
+        semantic_id = self._resolve_semantic_id(sha256_semantic_id)
         if not semantic_id:
             raise InvalidError(
                 f"Cannot resolve semantic_id for SHA256 hash: {sha256_semantic_id}. "
-                f"Use read_submodel() method instead or ensure semantic_id is cached."
+                f"Use {semantic_method}() method instead or ensure semantic_id is cached."
             )
         
+        return semantic_id, submodel_id
+    
+    def read(self, path: str) -> Dict[str, Any]:
+        """
+        Read a submodel using path-based access.
+        
+        Path format: {sha256_semantic_id}/{submodel_id}.json
+        
+        Note: This method requires semantic_id to be cached or path must contain
+        the original semantic_id. Use read_submodel() for direct HTTP operations.
+        
+        Args:
+            path: Path to the submodel file
+            
+        Returns:
+            Submodel content
+            
+        Raises:
+            InvalidError: If semantic_id cannot be resolved from path
+            NotFoundError: If submodel doesn't exist
+        """
+        self.logger.warning(
+            "Using path-based read() method. Consider using read_submodel() "
+            "for better HTTP adapter support. Path: %s", path
+        )
+        
+        semantic_id, submodel_id = self._resolve_path(path, "read_submodel")
         return self.read_submodel(semantic_id, submodel_id)
     
     def write(self, path: str, content: Dict[str, Any]) -> None:
@@ -364,31 +741,11 @@ class HttpSubmodelAdapter(SubmodelAdapter):
             InvalidError: If semantic_id cannot be resolved from path
         """
         self.logger.warning(
-            f"Using path-based write() method. Consider using write_submodel() "
-            f"for better HTTP adapter support. Path: {path}"
+            "Using path-based write() method. Consider using write_submodel() "
+            "for better HTTP adapter support. Path: %s", path
         )
         
-        # Extract components from path
-        parts = path.split('/')
-        if len(parts) < 2:
-            raise InvalidError(f"Invalid path format: {path}")
-        
-        sha256_semantic_id = parts[0]
-        submodel_filename = parts[1]
-        submodel_id_str = submodel_filename.replace(JSON_EXTENSION, '')
-        
-        try:
-            submodel_id = UUID(submodel_id_str)
-        except ValueError:
-            raise InvalidError(f"Invalid submodel ID in path: {submodel_id_str}")
-        
-        # Try to get original semantic_id from cache
-        semantic_id = self._semantic_id_cache.get(sha256_semantic_id)
-        if not semantic_id:
-            raise InvalidError(
-                f"Cannot resolve semantic_id for SHA256 hash: {sha256_semantic_id}. "
-                f"Use write_submodel() method instead or ensure semantic_id is cached."
-            )
+        semantic_id, submodel_id = self._resolve_path(path, "write_submodel")
         
         self.write_submodel(semantic_id, submodel_id, content)
     
@@ -409,31 +766,11 @@ class HttpSubmodelAdapter(SubmodelAdapter):
             NotFoundError: If submodel doesn't exist
         """
         self.logger.warning(
-            f"Using path-based delete() method. Consider using delete_submodel() "
-            f"for better HTTP adapter support. Path: {path}"
+            "Using path-based delete() method. Consider using delete_submodel() "
+            "for better HTTP adapter support. Path: %s", path
         )
         
-        # Extract components from path
-        parts = path.split('/')
-        if len(parts) < 2:
-            raise InvalidError(f"Invalid path format: {path}")
-        
-        sha256_semantic_id = parts[0]
-        submodel_filename = parts[1]
-        submodel_id_str = submodel_filename.replace(JSON_EXTENSION, '')
-        
-        try:
-            submodel_id = UUID(submodel_id_str)
-        except ValueError:
-            raise InvalidError(f"Invalid submodel ID in path: {submodel_id_str}")
-        
-        # Try to get original semantic_id from cache
-        semantic_id = self._semantic_id_cache.get(sha256_semantic_id)
-        if not semantic_id:
-            raise InvalidError(
-                f"Cannot resolve semantic_id for SHA256 hash: {sha256_semantic_id}. "
-                f"Use delete_submodel() method instead or ensure semantic_id is cached."
-            )
+        semantic_id, submodel_id = self._resolve_path(path, "delete_submodel")
         
         self.delete_submodel(semantic_id, submodel_id)
     
@@ -452,37 +789,12 @@ class HttpSubmodelAdapter(SubmodelAdapter):
         Returns:
             True if submodel exists, False otherwise
         """
-        self.logger.debug(f"Checking existence for path: {path}")
-        
-        # Extract components from path
-        parts = path.split('/')
-        if len(parts) < 2:
-            self.logger.warning(f"Invalid path format: {path}")
-            return False
-        
-        sha256_semantic_id = parts[0]
-        
-        # For directory check (only sha256 hash)
-        if len(parts) == 1:
-            # HTTP adapter doesn't have directory concept
-            # Return True assuming semantic_id exists
-            return True
-        
-        submodel_filename = parts[1]
-        submodel_id_str = submodel_filename.replace(JSON_EXTENSION, '')
+        self.logger.debug("Checking existence for path: %s", path)
         
         try:
-            submodel_id = UUID(submodel_id_str)
-        except ValueError:
-            self.logger.warning(f"Invalid submodel ID in path: {submodel_id_str}")
-            return False
-        
-        # Try to get original semantic_id from cache
-        semantic_id = self._semantic_id_cache.get(sha256_semantic_id)
-        if not semantic_id:
-            self.logger.warning(
-                f"Cannot resolve semantic_id for SHA256 hash: {sha256_semantic_id}"
-            )
+            semantic_id, submodel_id = self._resolve_path(path, "exists_submodel")
+        except InvalidError as e:
+            self.logger.warning(str(e))
             return False
         
         return self.exists_submodel(semantic_id, submodel_id)
@@ -497,27 +809,65 @@ class HttpSubmodelAdapter(SubmodelAdapter):
         Args:
             path: Directory path (ignored)
         """
-        self.logger.debug(f"create_directory called (no-op for HTTP): {path}")
+        self.logger.debug("create_directory called (no-op for HTTP): %s", path)
+    
+    def _resolve_semantic_id(self, sha256_hash: str) -> Optional[str]:
+        """
+        Look up the original semantic_id for a SHA256 hash, marking it as recently used.
+        
+        Args:
+            sha256_hash: SHA256 hash of semantic_id
+            
+        Returns:
+            The cached semantic_id, or None if it is not cached
+        """
+        semantic_id = self._semantic_id_cache.get(sha256_hash)
+        if semantic_id is not None:
+            try:
+                self._semantic_id_cache.move_to_end(sha256_hash)
+            except KeyError:
+                # Evicted concurrently, the resolved value is still valid
+                pass
+        return semantic_id
     
     def cache_semantic_id(self, sha256_hash: str, semantic_id: str) -> None:
         """
         Cache semantic_id mapping for path-based operations.
         
         This allows the adapter to resolve original semantic_id from SHA256 hash
-        when using path-based methods.
+        when using path-based methods. The least recently used mapping is evicted
+        once the cache is full.
         
         Args:
             sha256_hash: SHA256 hash of semantic_id
             semantic_id: Original semantic_id string
         """
-        self._semantic_id_cache[sha256_hash] = semantic_id
-        self.logger.debug(f"Cached semantic_id mapping: {sha256_hash[:16]}... -> {semantic_id}")
+        if self._semantic_id_cache.get(sha256_hash) == semantic_id:
+            # Already cached, only refresh its LRU position
+            try:
+                self._semantic_id_cache.move_to_end(sha256_hash)
+                return
+            except KeyError:
+                # Evicted concurrently, insert it again
+                pass
+        
+        with self._semantic_id_cache_lock:
+            self._semantic_id_cache[sha256_hash] = semantic_id
+            self._semantic_id_cache.move_to_end(sha256_hash)
+            if len(self._semantic_id_cache) > self._semantic_id_cache_size:
+                self._semantic_id_cache.popitem(last=False)
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Cached semantic_id mapping: %s... -> %s", sha256_hash[:16], semantic_id)
     
-    def __del__(self):
-        """Cleanup HTTP client on adapter destruction."""
-        try:
-            if hasattr(self, 'client'):
-                self.client.close()
-                self.logger.debug("HTTP client closed")
-        except Exception as e:
-            self.logger.warning(f"Error closing HTTP client: {e}")
+    def close(self) -> None:
+        """Close the underlying HTTP client. Safe to call more than once."""
+        if not self.client.is_closed:
+            self.client.close()
+            self.logger.debug("HTTP client closed")
+    
+    def __enter__(self) -> "HttpSubmodelAdapter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
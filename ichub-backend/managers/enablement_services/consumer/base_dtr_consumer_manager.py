@@ -91,9 +91,11 @@ class BaseDtrConsumerManager(ABC):
         Return the policy list from a DCAT dataset, supporting both
         Saturn (``hasPolicy``) and Jupiter (``odrl:hasPolicy``) key formats.
         """
-        value = dataset.get(self.SATURN_ODRL_HAS_POLICY_KEY) or dataset.get(self.ODRL_HAS_POLICY_KEY, [])
+        value = dataset.get(self.SATURN_ODRL_HAS_POLICY_KEY) or dataset.get(self.ODRL_HAS_POLICY_KEY)
+        if not value:
+            return []
         if not isinstance(value, list):
-            return [value] if value else []
+            return [value]
         return value
 
     @abstractmethod
@@ -23,7 +23,7 @@
 
 import threading
 import hashlib
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, Dict, Tuple, TYPE_CHECKING
 import json
 from datetime import datetime
 from sqlmodel import select, delete, Session, SQLModel
@@ -73,23 +73,21 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         DynamicKnownDtrs.metadata.create_all(engine)
         self._load_from_db()
 
-    def add_dtr(self, bpn: str, connector_url: str, asset_id: str, policies: List[str]) -> None:
+    def add_dtrs_batch(self, bpn: str, connector_url: str, dtrs: List[Tuple[str, List]]) -> None:
         """
-        Add DTR to the cache for a specific Business Partner Number (BPN).
+        Add several DTRs found in the same connector to the cache and persist them.
         
-        This method should store the provided DTR data associated with the given BPN,
-        implementing appropriate caching logic including expiration handling.
+        add_dtr delegates to this method, so single additions are persisted as well.
         
         Args:
-            bpn (str): The Business Partner Number to associate DTR with
-            edc_url (str): URL of the EDC where the DTR is stored
-            asset_id (str): Asset ID of the DTR
-            policies (List[str]): List of policies for this DTR
+            bpn (str): The Business Partner Number to associate the DTRs with
+            connector_url (str): URL of the EDC where the DTRs are stored
+            dtrs (List[Tuple[str, List]]): (asset_id, policies) pairs of the DTRs to add
             
         Returns:
             None
         """
-        super().add_dtr(bpn, connector_url, asset_id, policies)  # Call the base class method to handle in-memory caching
+        super().add_dtrs_batch(bpn, connector_url, dtrs)  # Call the base class method to handle in-memory caching
         self._trigger_save()
 
     def delete_dtr(self, bpn: str, asset_id: str) -> Dict:
@@ -103,9 +101,9 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         Returns:
             Dict: Updated cache state after deletion
         """
-        super().delete_dtr(bpn, asset_id)
+        known_dtrs = super().delete_dtr(bpn, asset_id)
         self._trigger_save()
-        return self.known_dtrs
+        return known_dtrs
 
     
     def purge_bpn(self, bpn: str) -> None:
@@ -150,19 +148,14 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         """
         Reload known_dtrs from the DB and restore them to memory.
         """
-        self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (load_from_db)")
-        with self._dtrs_lock:
-            self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (load_from_db)")
+        with self._all_dtrs_locked():
             try:
                 loaded_dtrs = 0
                 with Session(self.engine) as session:
                     result = session.exec(select(self.KnownDtrsModel)).all()
                     
-                    # Store current state to compare for changes
-                    old_dtrs = self.known_dtrs.copy()
-                    
                     # Clear current known_dtrs
-                    self.known_dtrs = {}
+                    self._clear_dtrs()
                     
                     for row in result:
                         bpn = row.bpnl
@@ -174,27 +167,16 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
                         # Convert datetime back to timestamp for the SDK
                         timestamp = expires_at.timestamp()
 
-                        # Initialize BPN structure if it doesn't exist
-                        if bpn not in self.known_dtrs:
-                            self.known_dtrs[bpn] = {
-                                self.REFRESH_INTERVAL_KEY: timestamp,
-                                self.DTR_DATA_KEY: {}
-                            }
-                        
                         # Update refresh interval to the latest timestamp
-                        if timestamp > self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY]:
-                            self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY] = timestamp
+                        if bpn not in self._refresh_intervals or timestamp > self._refresh_intervals[bpn]:
+                            self._set_refresh_interval(bpn, timestamp)
                         
-                        # Add DTR using asset_id as key
-                        self.known_dtrs[bpn][self.DTR_DATA_KEY][asset_id] = {
-                            self.DTR_CONNECTOR_URL_KEY: edc_url,
-                            self.DTR_ASSET_ID_KEY: asset_id,
-                            self.DTR_POLICIES_KEY: policies
-                        }
+                        # Add DTR using (bpn, asset_id) as key
+                        self._store_dtr(bpn, asset_id, self._create_dtr_cache_entry(connector_url=edc_url, asset_id=asset_id, policies=policies))
                         loaded_dtrs += 1
 
                 # Only log if there's a change in the data
-                new_hash = hashlib.sha256(json.dumps(self.known_dtrs, sort_keys=True, default=str).encode()).hexdigest()
+                new_hash = hashlib.sha256(json.dumps(self.get_known_dtrs(), sort_keys=True, default=str).encode()).hexdigest()
                 if self.logger and self.verbose and (self._last_saved_hash is None or new_hash != self._last_saved_hash):
                     self.logger.info(f"[DtrConsumerPostgresMemoryManager] Loaded {loaded_dtrs} DTR entries from the database.")
                     
@@ -202,16 +184,14 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             except SQLAlchemyError as e:
                 if self.logger and self.verbose:
                     self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error loading from db: {e}")
-        self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (load_from_db)")
           
     def _save_to_db(self):
         """
         Persist current in-memory known_dtrs to the DB only if changes are detected.
         """
-        self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Trying to acquire lock (save_to_db)")
         with self._dtrs_lock:
-            self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Acquired lock (save_to_db)")
-            current_hash = hashlib.sha256(json.dumps(self.known_dtrs, sort_keys=True, default=str).encode()).hexdigest()
+            known_dtrs = self.get_known_dtrs()
+            current_hash = hashlib.sha256(json.dumps(known_dtrs, sort_keys=True, default=str).encode()).hexdigest()
             if current_hash == self._last_saved_hash:
                 return
             try:
@@ -221,25 +201,22 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
                     session.exec(delete(self.KnownDtrsModel))
                     
                     # Save each BPN's DTR data
-                    for bpn, bpn_data in self.known_dtrs.items():
-                        if self.DTR_DATA_KEY in bpn_data and self.REFRESH_INTERVAL_KEY in bpn_data:
-                            # Convert timestamp to datetime object instead of using the formatted string
-                            timestamp = bpn_data[self.REFRESH_INTERVAL_KEY]
-                            expires_at = datetime.fromtimestamp(timestamp)
-                            dtr_dict = bpn_data[self.DTR_DATA_KEY]
-                            
-                            # Iterate through all DTRs for this BPN (now a dictionary keyed by asset_id)
-                            if isinstance(dtr_dict, dict):
-                                for asset_id, dtr_data in dtr_dict.items():
-                                    if dtr_data is not None:
-                                        session.add(self.KnownDtrsModel(
-                                            bpnl=bpn,
-                                            edc_url=dtr_data[self.DTR_CONNECTOR_URL_KEY],
-                                            asset_id=dtr_data[self.DTR_ASSET_ID_KEY],
-                                            policies=dtr_data[self.DTR_POLICIES_KEY],
-                                            expires_at=expires_at
-                                        ))
-                                        saved_dtrs += 1
+                    # (get_known_dtrs always provides both keys for every BPN)
+                    for bpn, bpn_data in known_dtrs.items():
+                        # Convert timestamp to datetime object instead of using the formatted string
+                        timestamp = bpn_data[self.REFRESH_INTERVAL_KEY]
+                        expires_at = datetime.fromtimestamp(timestamp)
+                        
+                        # Iterate through all DTRs for this BPN (a dictionary keyed by asset_id)
+                        for dtr_data in bpn_data[self.DTR_DATA_KEY].values():
+                            session.add(self.KnownDtrsModel(
+                                bpnl=bpn,
+                                edc_url=dtr_data[self.DTR_CONNECTOR_URL_KEY],
+                                asset_id=dtr_data[self.DTR_ASSET_ID_KEY],
+                                policies=dtr_data[self.DTR_POLICIES_KEY],
+                                expires_at=expires_at
+                            ))
+                            saved_dtrs += 1
                                     
                     session.commit()
                     self._last_saved_hash = current_hash
@@ -248,7 +225,6 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
             except SQLAlchemyError as e:
                 if self.logger and self.verbose:
                     self.logger.error(f"[DtrConsumerPostgresMemoryManager] Error saving to db: {e}")
-        self.logger.debug(f"[DtrConsumerPostgresMemoryManager] [{threading.get_ident()}] Released lock (save_to_db)")
 
     def stop(self):
         """
@@ -257,3 +233,4 @@ class DtrConsumerPostgresMemoryManager(DtrConsumerMemoryManager):
         if self._save_thread:
             self._save_thread.join()
         self._save_to_db()
+        self.close()
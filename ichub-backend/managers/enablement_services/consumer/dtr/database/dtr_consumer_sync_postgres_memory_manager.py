@@ -78,3 +78,4 @@ class DtrConsumerSyncPostgresMemoryManager(DtrConsumerPostgresMemoryManager):
             self._save_thread.join()
         self._stop_event.set()
         self._save_to_db()
+        self.close()
@@ -23,15 +23,25 @@
 
 ## This file was created using an LLM (Claude Sonnet 4) and reviewed by a human committer
 
-import copy
 import hashlib
 import logging
+import sys
 import threading
 import time
 import json
 import base64
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
+import random
+import re
+from collections import OrderedDict
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from urllib.parse import urlencode
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Union, Any
 from tractusx_sdk.dataspace.tools import op
 from sqlmodel import Session
 from tractusx_sdk.dataspace.services.connector import BaseConnectorConsumerService
@@ -40,6 +50,147 @@ from managers.enablement_services.consumer.dtr.pagination_manager import Paginat
 if TYPE_CHECKING:
     from managers.enablement_services.connector_manager import BaseConnectorConsumerManager
 from tractusx_sdk.dataspace.tools import HttpTools
+from tools.circuit_breaker import CircuitBreaker
+from tools.exceptions import ServiceUnavailableError
+from tools.log_capture import propagate_policy_log_capture
+
+# Upper bound for the shared pool used to fan out DTR HTTP requests
+MAX_FETCH_WORKERS = 32
+# Maximum number of DTRs queried in parallel by discover_shells. Kept in its own pool,
+# because each DTR task submits its shell descriptor fetches to the fetch pool.
+MAX_DTR_WORKERS = 8
+# Upper bound for the shared pool used to negotiate submodel assets. Negotiations hold
+# their thread through the DSP handshake, so they get a pool of their own.
+MAX_NEGOTIATION_WORKERS = 64
+# Maximum number of assets a single request negotiates at once, so that one request
+# with many assets cannot take the whole negotiation pool
+MAX_NEGOTIATIONS_PER_CALL = 10
+# Dataplane hosts with a connection pool in the shared session
+HTTP_POOL_HOSTS = 32
+# Keep-alive connections kept per dataplane host, enough for every worker of both pools
+HTTP_POOL_SIZE = MAX_FETCH_WORKERS + MAX_DTR_WORKERS
+# Seconds to wait for a dataplane to connect or send data, so a hung provider cannot
+# hold a pooled worker (and its keep-alive connection) forever
+DATAPLANE_REQUEST_TIMEOUT = 30
+
+# Backoff between DTR retry attempts: exponential, capped, with +/-50% jitter so
+# parallel DTR workers do not retry a degraded connector in lockstep
+DTR_RETRY_BACKOFF_BASE = 1.0
+DTR_RETRY_BACKOFF_CAP = 30.0
+# Client errors that may succeed on a later attempt; any other 4xx is final
+RETRYABLE_CLIENT_ERRORS = frozenset({408, 425, 429})
+# Network failures worth another attempt: the SDK raises the builtin ConnectionError and
+# TimeoutError for failed EDC calls, the dataplane requests the requests exceptions.
+# Any other error (no matching policy, malformed response, ...) is final.
+RECOVERABLE_DTR_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+# Skip a connector after consecutive failures instead of paying its timeouts again for every DTR
+DTR_CIRCUIT_BREAKER_FAIL_MAX = 3
+DTR_CIRCUIT_BREAKER_RESET_TIMEOUT = 30.0
+# Wait before renegotiating a purged EDR of a submodel: exponential from 0.5s, capped at 5s,
+# plus up to 0.5s of jitter. Retries are not waited for once the fetch deadline has passed.
+SUBMODEL_RETRY_BACKOFF_BASE = 0.5
+SUBMODEL_RETRY_BACKOFF_CAP = 5.0
+SUBMODEL_FETCH_DEADLINE = 60.0
+# Seconds a refused asset negotiation (no token, no matching policy, ...) is answered from memory
+# instead of repeating the DSP round trip. Network failures are never remembered.
+FAILED_NEGOTIATION_TTL = 60.0
+# Seconds to wait before retrying a background DTR refresh that found nothing, while the
+# expired DTRs keep being served
+DTR_REFRESH_RETRY_INTERVAL = 60.0
+# Seconds past their expiry that DTRs may be served while they cannot be refreshed. After
+# that, the BPN is purged and get_dtrs waits for a fresh discovery again.
+MAX_STALE_DTR_AGE = 15 * 60.0
+# Maximum number of discovered shell descriptors kept, least recently stored are evicted first
+SHELL_DESCRIPTORS_CACHE_SIZE = 10_000
+# JSON-LD metadata stripped from the catalog policies of a DTR before they are cached
+POLICY_METADATA_KEYS = frozenset(("@id", "@type"))
+
+@lru_cache(maxsize=4096)
+def _encode_id(identifier: str) -> str:
+    """
+    Base64-encode a shell or submodel ID for use in a DTR API path.
+    
+    Shell IDs repeat across pages, retries and submodel lookups, so the
+    encodings are memoized.
+    """
+    return base64.b64encode(identifier.encode('utf-8')).decode('utf-8')
+
+# json.dumps builds a new encoder for every call with non-default options, this one is reused.
+# Produces exactly the output of json.dumps(value, sort_keys=True).
+_sorted_json_encoder = json.JSONEncoder(sort_keys=True)
+
+@lru_cache(maxsize=1024)
+def _encode_semantic_id(semantic_id_json: str) -> str:
+    """
+    Base64-encode the canonical JSON of a submodel semantic ID.
+    
+    Submodels of the same aspect model share their semantic ID across all
+    shells, so the encodings are memoized.
+    """
+    return base64.b64encode(semantic_id_json.encode('utf-8')).decode('utf-8')
+
+def _response_json(response: requests.Response) -> Any:
+    """
+    Parse the JSON body of a dataplane response from its raw bytes.
+    
+    json.loads detects the UTF encoding of the bytes itself, which skips the
+    charset guessing and str decoding that response.json() does first.
+    """
+    return json.loads(response.content)
+
+# (type, value) pair of a semantic ID key, extracted in C instead of two Python-level lookups
+_semantic_key_pair = itemgetter("type", "value")
+
+# key=value pairs of a ";"-separated subprotocolBody, e.g. "id=<asset-id>;dspEndpoint=<url>".
+# Values may contain "=", keys may not; segments without "=" are skipped.
+_SUBPROTOCOL_PAIR_RE = re.compile(r'([^=;]+)=([^;]*)')
+
+def _run_inline(fn, *args) -> Future:
+    """
+    Run fn on the calling thread and return its outcome as an already completed Future.
+    
+    Used in place of executor.submit when there is nothing to overlap with, so the
+    result handling stays the same as for pooled work.
+    """
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+@lru_cache(maxsize=1024)
+def _sha3_checksum(value_repr: str) -> str:
+    """
+    SHA3-256 hex digest of a string.
+    
+    The same governance policies and asset filters are hashed for every submodel
+    of a batch and on every retry, so the digests are memoized.
+    """
+    return hashlib.sha3_256(value_repr.encode('utf-8')).hexdigest()
+
+@dataclass(frozen=True, slots=True)
+class DtrCacheEntry:
+    """A cached DTR. Entries are immutable once stored in the cache."""
+    connector_url: str
+    asset_id: str
+    policies: List[Union[str, Dict[str, Any]]]
+
+@dataclass(frozen=True, slots=True)
+class SubmodelFetch:
+    """A submodel queued for data fetching, with what is needed to negotiate access to its asset."""
+    submodel_id: str
+    semantic_id: Optional[str]
+    policies: List[Dict]
+    asset_id: str
+    connector_url: str
+    href: str
 
 class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     """
@@ -48,10 +199,17 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     This class provides in-memory caching of DTR information with
     time-based expiration for Business Partner Numbers (BPNs). Extends
     the base DTR consumer manager interface.
+    
+    Reads never take a lock. Writers take a lock per BPN, so discoveries
+    for different BPNs do not block each other; purge_cache and bulk
+    reloads take every BPN lock at once. The shared maps are only changed
+    through single set/pop operations, and each BPN's asset ID index is an
+    immutable tuple that writers replace rather than mutate, so readers
+    always iterate a consistent snapshot.
     """ 
     
     ## Declare variables
-    known_dtrs: Dict
+    known_dtrs: Dict[Tuple[str, str], DtrCacheEntry]
     logger: logging.Logger
     verbose: bool
 
@@ -64,15 +222,177 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             expiration_time (int, optional): Cache expiration time in minutes. Defaults to 60.
         """
         super().__init__(connector_consumer_manager, expiration_time, dct_type_id=dct_type_id, dct_type_key=dct_type_key, operator=operator, dct_type=dct_type)
-        self.known_dtrs = {}
-        self.shell_descriptors = {}  # Central storage for shell descriptors by shell ID
+        self.known_dtrs = {}  # DTR entries keyed by (bpn, asset_id)
+        self._refresh_intervals: Dict[str, float] = {}  # Next refresh timestamp per BPN (wall clock, for reporting)
+        self._refreshing_bpns: Set[str] = set()  # BPNs whose expired DTRs are being rediscovered in the background
+        self._refresh_retry_deadlines: Dict[str, float] = {}  # BPNs whose last background refresh found nothing, with the time to retry
+        self._refreshing_lock = threading.Lock()  # Guards _refreshing_bpns and _refresh_retry_deadlines
+        self._refresh_deadlines: Dict[str, float] = {}  # Next refresh per BPN on the time.monotonic() clock
+        self._bpn_index: Dict[str, Tuple[str, ...]] = {}  # Asset IDs per BPN, in insertion order
+        self._connectors_by_bpn: Dict[str, Tuple[str, ...]] = {}  # Connector URLs with cached DTRs, per BPN
+        self._by_connector: Dict[Tuple[str, str], Tuple[str, ...]] = {}  # Asset IDs per (bpn, connector_url)
+        self.shell_descriptors: OrderedDict[str, Dict] = OrderedDict()  # Bounded LRU of shell descriptors by shell ID
         self.logger = logger if logger else None
         self.verbose = verbose
         # Use separate locks for different data structures to reduce contention
-        self._dtrs_lock = threading.RLock()  # Only for known_dtrs modifications
-        self._shells_lock = threading.RLock()  # Only for shell_descriptors modifications
-        self._list_lock = threading.RLock()  # Only for thread-safe list operations
+        self._dtrs_lock = threading.Lock()  # Only for operations on the whole DTR cache (readers never lock)
+        self._bpn_locks: Dict[str, threading.Lock] = {}  # One lock per BPN for DTR modifications
+        self._bpn_locks_meta = threading.Lock()  # Guards creation of the per-BPN locks
+        self._shells_lock = threading.Lock()  # Guards shell_descriptors
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}  # One breaker per (counter_party_id, connector_url)
+        self._breakers_lock = threading.Lock()  # Guards creation of the breakers
+        # Asset negotiations in progress, so concurrent requests for the same asset share one negotiation
+        self._inflight_negotiations: Dict[Tuple[str, str, str, str], Future] = {}
+        # Recently refused negotiations, with the time they expire and the type and message of the error they raised (None for no token)
+        self._failed_negotiations: Dict[Tuple[str, str, str, str], Tuple[float, Optional[Tuple[type, str]]]] = {}
+        self._negotiations_lock = threading.Lock()  # Only held to register or remove a negotiation, never during one
+        # Shared pool for HTTP fan-out, created on first use and reused across calls
+        self._fetch_executor: Optional[ThreadPoolExecutor] = None
+        self._dtr_executor: Optional[ThreadPoolExecutor] = None
+        self._negotiation_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Shared HTTP session so dataplane calls reuse keep-alive connections instead of new TLS handshakes
+        self._session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create the pooled HTTP session used for the DTR dataplane requests.
+        
+        Retries are left to _process_dtr_with_retry, so the adapter itself never retries.
+        
+        Returns:
+            requests.Session: Session with a connection pool mounted for http and https
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_SIZE, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _get_fetch_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the shared thread pool used for parallel DTR requests, creating it on first use.
+        
+        Returns:
+            ThreadPoolExecutor: The shared, bounded thread pool
+        """
+        if self._fetch_executor is None:
+            with self._executor_lock:
+                if self._fetch_executor is None:
+                    self._fetch_executor = ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS, thread_name_prefix="dtr-fetch")
+        return self._fetch_executor
+
+    def _get_dtr_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool used to query DTRs in parallel, creating it on first use.
+        
+        Returns:
+            ThreadPoolExecutor: The bounded DTR thread pool
+        """
+        if self._dtr_executor is None:
+            with self._executor_lock:
+                if self._dtr_executor is None:
+                    self._dtr_executor = ThreadPoolExecutor(max_workers=MAX_DTR_WORKERS, thread_name_prefix="dtr-query")
+        return self._dtr_executor
+
+    def _get_negotiation_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool used to negotiate submodel assets in parallel, creating it on first use.
+        
+        Returns:
+            ThreadPoolExecutor: The bounded negotiation thread pool
+        """
+        if self._negotiation_executor is None:
+            with self._executor_lock:
+                if self._negotiation_executor is None:
+                    self._negotiation_executor = ThreadPoolExecutor(max_workers=MAX_NEGOTIATION_WORKERS, thread_name_prefix="dtr-negotiation")
+        return self._negotiation_executor
+
+    @cached_property
+    def _dtr_filter_expression(self) -> Dict:
+        """
+        Catalog filter expression that selects DTR assets.
+        
+        Built from instance-constant settings, so it is computed once on first use
+        instead of on every discovery call.
+        """
+        return self.connector_consumer_manager.connector_service.get_filter_expression(
+            key=self.dct_type_key, operator=self.operator, value=self.dct_type
+        )
+
+    def close(self) -> None:
+        """
+        Shut down the shared thread pools and HTTP session. Safe to call more than once.
+        """
+        with self._executor_lock:
+            if self._dtr_executor is not None:
+                self._dtr_executor.shutdown(wait=True)
+                self._dtr_executor = None
+            if self._negotiation_executor is not None:
+                self._negotiation_executor.shutdown(wait=True)
+                self._negotiation_executor = None
+            if self._fetch_executor is not None:
+                self._fetch_executor.shutdown(wait=True)
+                self._fetch_executor = None
+        self._session.close()
+        
+    def _breaker_for(self, counter_party_id: str, connector_url: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker of a counter party's connector, creating it on first use.
+        
+        Args:
+            counter_party_id (str): The Business Partner Number
+            connector_url (str): The connector URL
+            
+        Returns:
+            CircuitBreaker: The breaker guarding calls to the connector
+        """
+        key = (counter_party_id, connector_url)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._breakers_lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(
+                    name=f"{counter_party_id} at {connector_url}",
+                    fail_max=DTR_CIRCUIT_BREAKER_FAIL_MAX,
+                    reset_timeout=DTR_CIRCUIT_BREAKER_RESET_TIMEOUT
+                ))
+        return breaker
+
+    def _lock_for(self, bpn: str) -> threading.Lock:
+        """
+        Get the lock guarding the DTRs of a BPN, creating it on first use.
+        
+        Args:
+            bpn (str): The Business Partner Number
+            
+        Returns:
+            threading.Lock: The lock of the BPN
+        """
+        lock = self._bpn_locks.get(bpn)
+        if lock is None:
+            with self._bpn_locks_meta:
+                lock = self._bpn_locks.setdefault(bpn, threading.Lock())
+        return lock
+
+    @contextmanager
+    def _all_dtrs_locked(self) -> Iterator[None]:
+        """
+        Block every DTR writer, for operations that replace the whole cache.
         
+        Holds the meta lock for the whole duration, so no lock can be created
+        for a new BPN, and takes every existing BPN lock.
+        """
+        with self._dtrs_lock, self._bpn_locks_meta:
+            locks = list(self._bpn_locks.values())
+            for lock in locks:
+                lock.acquire()
+            try:
+                yield
+            finally:
+                for lock in reversed(locks):
+                    lock.release()
+
     def add_dtr(self, bpn: str, connector_url: str, asset_id: str, policies: List[str]) -> None:
         """
         Add DTR to the in-memory cache for a specific BPN.
@@ -85,36 +405,150 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             asset_id (str): Asset ID of the DTR (used as unique key)
             policies (List[str]): List of policies for this DTR
         """
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (add_dtr)")
-        with self._dtrs_lock:
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (add_dtr)")
-            if bpn not in self.known_dtrs:
-                self.known_dtrs[bpn] = {}
+        self.add_dtrs_batch(bpn=bpn, connector_url=connector_url, dtrs=[(asset_id, policies)])
 
-            # Always update the refresh interval timestamp
-            self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY] = op.get_future_timestamp(minutes=self.expiration_time)
-            
-            # Initialize DTR dictionary if it doesn't exist
-            if self.DTR_DATA_KEY not in self.known_dtrs[bpn]:
-                self.known_dtrs[bpn][self.DTR_DATA_KEY] = {}
-            
-            # Check if this specific DTR already exists (avoid duplicates)
-            if asset_id in self.known_dtrs[bpn][self.DTR_DATA_KEY]:
-                if(self.logger and self.verbose):
-                    self.logger.debug(f"[DTR Manager] [{bpn}] DTR with asset ID [{asset_id}] already cached, skipping duplicate")
-                return
+    def add_dtrs_batch(self, bpn: str, connector_url: str, dtrs: List[Tuple[str, List[Union[str, Dict[str, Any]]]]]) -> None:
+        """
+        Add several DTRs found in the same connector to the in-memory cache.
+        
+        Takes the BPN lock and computes the refresh interval once for the whole
+        batch instead of once per DTR.
+        
+        Args:
+            bpn (str): The Business Partner Number to associate the DTRs with
+            connector_url (str): URL of the EDC where the DTRs are stored
+            dtrs (List[Tuple[str, List]]): (asset_id, policies) pairs of the DTRs to add
+        """
+        if not dtrs:
+            return
+        
+        bpn = sys.intern(bpn)
+        with self._lock_for(bpn):
+            # Always update the refresh interval timestamp, once for the whole batch
+            refresh_interval = op.get_future_timestamp(minutes=self.expiration_time)
+            self._set_refresh_interval(bpn, refresh_interval)
+            
+            # Bind the per-DTR lookups once, and only format the refresh time if it is logged
+            log_verbose = bool(self.logger and self.verbose)
+            next_refresh = op.timestamp_to_datetime(refresh_interval) if log_verbose else None
+            known_dtrs = self.known_dtrs
+            store_dtr = self._store_dtr
+            create_entry = self._create_dtr_cache_entry
+            
+            for asset_id, policies in dtrs:
+                # Check if this specific DTR already exists (avoid duplicates)
+                if (bpn, asset_id) in known_dtrs:
+                    if(log_verbose):
+                        self.logger.debug("[DTR Manager] [%s] DTR with asset ID [%s] already cached, skipping duplicate", bpn, asset_id)
+                    continue
+                
+                # Add the new DTR using (bpn, asset_id) as key
+                store_dtr(bpn, asset_id, create_entry(connector_url=connector_url, asset_id=asset_id, policies=policies))
+
+                if(log_verbose):
+                    total_dtrs = len(self._bpn_index[bpn])
+                    self.logger.info(f"[DTR Manager] [{bpn}] Added DTR to the cache! Asset ID: [{asset_id}] (Total DTRs: {total_dtrs}) Next refresh at [{next_refresh}] UTC")
+
+    def _set_refresh_interval(self, bpn: str, refresh_interval: float) -> None:
+        """
+        Set the next refresh of a BPN.
+        
+        The wall-clock timestamp is kept for reporting and persistence, while
+        expiry is checked against a monotonic deadline, so clock adjustments
+        do not extend or cut short the cache lifetime.
+        
+        The caller must hold the lock of the BPN.
+        
+        Args:
+            bpn (str): The Business Partner Number
+            refresh_interval (float): Wall-clock timestamp of the next refresh
+        """
+        self._refresh_deadlines[bpn] = time.monotonic() + (refresh_interval - time.time())
+        self._refresh_intervals[bpn] = refresh_interval
+
+    def _store_dtr(self, bpn: str, asset_id: str, entry: DtrCacheEntry) -> None:
+        """
+        Store a DTR cache entry and register it in the per-BPN indexes.
+        
+        The caller must hold the lock of the BPN.
+        
+        Args:
+            bpn (str): The Business Partner Number
+            asset_id (str): Asset ID of the DTR
+            entry (DtrCacheEntry): Cache entry created by _create_dtr_cache_entry
+        """
+        # Key the cache and indexes with the interned strings of the entry
+        bpn = sys.intern(bpn)
+        asset_id = entry.asset_id
+        # Replacing a DTR unregisters the old entry first (a single pop when it is new)
+        self._remove_dtr(bpn, asset_id)
+        self.known_dtrs[(bpn, asset_id)] = entry
+        # Publish new index objects instead of mutating the ones readers may be iterating
+        self._bpn_index[bpn] = self._bpn_index.get(bpn, ()) + (asset_id,)
+        connector_key = (bpn, entry.connector_url)
+        connector_asset_ids = self._by_connector.get(connector_key, ())
+        if not connector_asset_ids:
+            self._connectors_by_bpn[bpn] = self._connectors_by_bpn.get(bpn, ()) + (entry.connector_url,)
+        self._by_connector[connector_key] = connector_asset_ids + (asset_id,)
+
+    def _remove_dtr(self, bpn: str, asset_id: str) -> Optional[DtrCacheEntry]:
+        """
+        Remove a DTR cache entry and unregister it from the per-BPN indexes.
+        
+        The caller must hold the lock of the BPN.
+        
+        Args:
+            bpn (str): The Business Partner Number
+            asset_id (str): Asset ID of the DTR
             
-            # Add the new DTR using asset_id as key
-            self.known_dtrs[bpn][self.DTR_DATA_KEY][asset_id] = self._create_dtr_cache_entry(connector_url=connector_url, asset_id=asset_id, policies=policies)
+        Returns:
+            Optional[DtrCacheEntry]: The removed entry, or None if it was not cached
+        """
+        entry = self.known_dtrs.pop((bpn, asset_id), None)
+        if entry is None:
+            return None
+        self._bpn_index[bpn] = tuple(cached_id for cached_id in self._bpn_index[bpn] if cached_id != asset_id)
+        connector_key = (bpn, entry.connector_url)
+        connector_asset_ids = tuple(cached_id for cached_id in self._by_connector[connector_key] if cached_id != asset_id)
+        if connector_asset_ids:
+            self._by_connector[connector_key] = connector_asset_ids
+        else:
+            self._by_connector.pop(connector_key, None)
+            self._connectors_by_bpn[bpn] = tuple(
+                connector_url for connector_url in self._connectors_by_bpn[bpn] if connector_url != entry.connector_url
+            )
+        return entry
 
-            if(self.logger and self.verbose):
-                total_dtrs = len(self.known_dtrs[bpn][self.DTR_DATA_KEY])
-                self.logger.info(f"[DTR Manager] [{bpn}] Added DTR to the cache! Asset ID: [{asset_id}] (Total DTRs: {total_dtrs}) Next refresh at [{op.timestamp_to_datetime(self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (add_dtr)")    
+    def _clear_dtrs(self) -> None:
+        """
+        Remove every DTR, index and refresh interval from the cache.
         
-        return
+        The caller must hold every DTR lock (see _all_dtrs_locked).
+        """
+        self.known_dtrs = {}
+        self._bpn_index = {}
+        self._connectors_by_bpn = {}
+        self._by_connector = {}
+        self._refresh_intervals = {}
+        self._refresh_deadlines = {}
 
-    def _create_dtr_cache_entry(self, connector_url: str, asset_id: str, policies: List[Union[str, Dict[str, Any]]]) -> dict:
+    def _iter_bpn_dtrs(self, bpn: str) -> Iterator[DtrCacheEntry]:
+        """
+        Iterate over the cached DTR entries of a BPN, in insertion order.
+        
+        Args:
+            bpn (str): The Business Partner Number
+            
+        Yields:
+            DtrCacheEntry: The cache entries of the BPN
+        """
+        known_dtrs = self.known_dtrs
+        for asset_id in self._bpn_index.get(bpn, ()):
+            entry = known_dtrs.get((bpn, asset_id))
+            if entry is not None:
+                yield entry
+
+    def _create_dtr_cache_entry(self, connector_url: str, asset_id: str, policies: List[Union[str, Dict[str, Any]]]) -> DtrCacheEntry:
         """
         Create a new DTR cache entry for a specific BPN.
         
@@ -123,13 +557,30 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             connector_url (str): URL of the EDC where the DTR is stored
             asset_id (str): Asset ID of the DTR
             policies (List[Union[str, Dict[str, Any]]]): List of policies for this DTR (cleaned of @id and @type)
+        
+        Note:
+            Entries are never mutated after insertion, so readers convert them
+            with _dtr_to_dict instead of deep copying them. Connector URLs and
+            asset IDs are interned, as they repeat across entries and index keys.
         """
 
+        return DtrCacheEntry(connector_url=sys.intern(connector_url), asset_id=sys.intern(asset_id), policies=list(policies))
+
+    def _dtr_to_dict(self, entry: DtrCacheEntry) -> Dict:
+        """
+        Convert a cache entry to the DTR dictionary returned by the public methods.
+        
+        Args:
+            entry (DtrCacheEntry): The cache entry
+            
+        Returns:
+            Dict: DTR data containing connector_url, asset_id and policies
+        """
         return {
-                    self.DTR_CONNECTOR_URL_KEY: connector_url,
-                    self.DTR_ASSET_ID_KEY: asset_id,
-                    self.DTR_POLICIES_KEY: policies
-                }
+            self.DTR_CONNECTOR_URL_KEY: entry.connector_url,
+            self.DTR_ASSET_ID_KEY: entry.asset_id,
+            self.DTR_POLICIES_KEY: entry.policies
+        }
 
     def is_dtr_known(self, bpn: str, asset_id: str) -> bool:
         """
@@ -143,17 +594,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             bool: True if the DTR is known for the BPN, False otherwise
         """
         # Read operation - no lock needed for simple lookups
-        if bpn not in self.known_dtrs:
-            return False
-        
-        if self.DTR_DATA_KEY not in self.known_dtrs[bpn]:
-            return False
-            
-        dtr_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-        if not isinstance(dtr_dict, dict):
-            return False
-            
-        return asset_id in dtr_dict
+        return (bpn, asset_id) in self.known_dtrs
 
     def get_dtr_by_asset_id(self, bpn: str, asset_id: str) -> Optional[Dict]:
         """
@@ -167,30 +608,25 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             Optional[Dict]: The DTR data if found, None otherwise
         """
         # Read operation - no lock needed for simple lookups
-        if bpn not in self.known_dtrs:
-            return None
-        
-        if self.DTR_DATA_KEY not in self.known_dtrs[bpn]:
-            return None
-            
-        dtr_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-        if not isinstance(dtr_dict, dict):
-            return None
-            
-        if asset_id in dtr_dict:
-            return copy.deepcopy(dtr_dict[asset_id])
-        
-        return None
+        dtr = self.known_dtrs.get((bpn, asset_id))
+        return self._dtr_to_dict(dtr) if dtr is not None else None
 
     def get_known_dtrs(self) -> Dict:
         """
         Retrieve all known DTRs from the cache.
         
         Returns:
-            Dict: Complete cache dictionary containing all BPNs and their associated DTRs
+            Dict: Complete cache dictionary containing all BPNs and their associated DTRs,
+                  in the form {bpn: {refresh_interval: float, dtr_data: {asset_id: dtr}}}
         """
-        # Read operation - return a deep copy of the current state
-        return copy.deepcopy(self.known_dtrs)
+        # Read operation - build a copy of the current state (entries are never mutated in place)
+        return {
+            bpn: {
+                self.REFRESH_INTERVAL_KEY: refresh_interval,
+                self.DTR_DATA_KEY: {dtr.asset_id: self._dtr_to_dict(dtr) for dtr in self._iter_bpn_dtrs(bpn)}
+            }
+            for bpn, refresh_interval in list(self._refresh_intervals.items())
+        }
 
     def delete_dtr(self, bpn: str, asset_id: str) -> Dict:
         """
@@ -203,19 +639,13 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             Dict: Updated cache state after deletion
         """
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (delete_dtr)")
-        with self._dtrs_lock:
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (delete_dtr)")
-            if bpn in self.known_dtrs and self.DTR_DATA_KEY in self.known_dtrs[bpn]:
-                dtr_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-                if isinstance(dtr_dict, dict) and asset_id in dtr_dict:
-                    del dtr_dict[asset_id]
-                    if(self.logger and self.verbose):
-                        remaining_dtrs = len(dtr_dict)
-                        self.logger.info(f"[DTR Manager] [{bpn}] Deleted DTR with asset ID [{asset_id}] from cache (Remaining DTRs: {remaining_dtrs})")
+        with self._lock_for(bpn):
+            if self._remove_dtr(bpn, asset_id) is not None:
+                if(self.logger and self.verbose):
+                    remaining_dtrs = len(self._bpn_index[bpn])
+                    self.logger.info(f"[DTR Manager] [{bpn}] Deleted DTR with asset ID [{asset_id}] from cache (Remaining DTRs: {remaining_dtrs})")
             
             return self.get_known_dtrs()
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (delete_dtr)")
 
     def purge_bpn(self, bpn: str) -> None:
         """
@@ -224,14 +654,18 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Args:
             bpn (str): The Business Partner Number to purge from cache
         """
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (purge_bpn)")
-        with self._dtrs_lock:
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (purge_bpn)")
-            if bpn in self.known_dtrs:
-                del self.known_dtrs[bpn]
+        with self._lock_for(bpn):
+            if bpn in self._refresh_intervals:
+                for asset_id in self._bpn_index.pop(bpn, ()):
+                    self.known_dtrs.pop((bpn, asset_id), None)
+                for connector_url in self._connectors_by_bpn.pop(bpn, ()):
+                    self._by_connector.pop((bpn, connector_url), None)
+                self._refresh_intervals.pop(bpn, None)
+                self._refresh_deadlines.pop(bpn, None)
+                with self._refreshing_lock:
+                    self._refresh_retry_deadlines.pop(bpn, None)
                 if(self.logger and self.verbose):
                     self.logger.info(f"[DTR Manager] [{bpn}] Purged all DTRs from cache")
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (purge_bpn)")
 
     def purge_cache(self) -> None:
         """
@@ -240,19 +674,14 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         This method removes all cached DTRs for all BPNs and all shell descriptors,
         effectively resetting the cache to an empty state.
         """
-        # Need both locks since we're clearing everything
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire locks (purge_cache)")
-        with self._dtrs_lock:
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired locks (purge_cache)")
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (purge_cache - shells)")
-            with self._shells_lock:
-                self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (purge_cache - shells)")
-                self.known_dtrs.clear()
-                self.shell_descriptors.clear()
-                if(self.logger and self.verbose):
-                    self.logger.info("[DTR Manager] Purged entire DTR cache and shell descriptors")
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (purge_cache - shells)")        
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released locks (purge_cache)")
+        # DTRs and shell descriptors are independent, so the two locks are taken
+        # one after the other instead of nested (no lock ordering to get wrong)
+        with self._all_dtrs_locked():
+            self._clear_dtrs()
+        with self._shells_lock:
+            self.shell_descriptors = OrderedDict()
+        if(self.logger and self.verbose):
+            self.logger.info("[DTR Manager] Purged entire DTR cache and shell descriptors")
 
     def get_dtrs_by_connector(self, bpn: str, connector_url: str) -> List[Dict]:
         """
@@ -265,21 +694,14 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             List[Dict]: List of DTR data from the specified connector
         """
-        # Read operation - no lock needed for lookups
-        if bpn not in self.known_dtrs or self.DTR_DATA_KEY not in self.known_dtrs[bpn]:
-            return []
-            
-        dtr_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-        if not isinstance(dtr_dict, dict):
-            return []
-            
-        # Filter DTRs by connector URL
-        filtered_dtrs = [
-            copy.deepcopy(dtr) for dtr in dtr_dict.values()
-            if dtr.get(self.DTR_CONNECTOR_URL_KEY) == connector_url
-        ]
-        
-        return filtered_dtrs
+        # Read operation - no lock needed, served from the (bpn, connector_url) index
+        known_dtrs = self.known_dtrs
+        dtrs = []
+        for asset_id in self._by_connector.get((bpn, connector_url), ()):
+            dtr = known_dtrs.get((bpn, asset_id))
+            if dtr is not None:
+                dtrs.append(self._dtr_to_dict(dtr))
+        return dtrs
 
     def get_dtr_count(self, bpn: str) -> int:
         """
@@ -292,14 +714,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             int: Number of DTRs cached for the BPN
         """
         # Read operation - no lock needed
-        if bpn not in self.known_dtrs or self.DTR_DATA_KEY not in self.known_dtrs[bpn]:
-            return 0
-            
-        dtr_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-        if isinstance(dtr_dict, dict):
-            return len(dtr_dict)
-        
-        return 0
+        return len(self._bpn_index.get(bpn, ()))
 
     def get_all_connector_urls(self, bpn: str) -> List[str]:
         """
@@ -311,22 +726,8 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             List[str]: List of unique connector URLs
         """
-        # Read operation - no lock needed
-        if bpn not in self.known_dtrs or self.DTR_DATA_KEY not in self.known_dtrs[bpn]:
-            return []
-            
-        dtr_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-        if not isinstance(dtr_dict, dict):
-            return []
-            
-        # Extract unique connector URLs
-        connector_urls = set()
-        for dtr in dtr_dict.values():
-            connector_url = dtr.get(self.DTR_CONNECTOR_URL_KEY)
-            if connector_url:
-                connector_urls.add(connector_url)
-        
-        return list(connector_urls)
+        # Read operation - no lock needed, served from the maintained connector index
+        return [connector_url for connector_url in self._connectors_by_bpn.get(bpn, ()) if connector_url]
 
     def get_all_asset_ids(self, bpn: str) -> List[str]:
         """
@@ -339,22 +740,17 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             List[str]: List of asset IDs
         """
         # Read operation - no lock needed
-        if bpn not in self.known_dtrs or self.DTR_DATA_KEY not in self.known_dtrs[bpn]:
-            return []
-            
-        dtr_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-        if isinstance(dtr_dict, dict):
-            return list(dtr_dict.keys())
-        
-        return []
+        return list(self._bpn_index.get(bpn, ()))
 
     def get_dtrs(self, bpn: str, timeout:int=30) -> List[Dict]:
         """
         Retrieve DTRs for a specific BPN, with automatic discovery if not cached.
         
-        This method first checks the cache for existing DTRs. If cache is empty
-        or expired, it uses the connector manager to get connectors for the BPN,
-        then queries each connector's catalog to find DTR assets.
+        This method first checks the cache for existing DTRs. If the cache is empty,
+        it uses the connector manager to get connectors for the BPN, then queries
+        each connector's catalog to find DTR assets. Expired DTRs are still returned
+        while they are rediscovered in the background, so callers never wait for
+        the refresh of a BPN they already know.
         
         Args:
             bpn (str): The Business Partner Number to get DTRs for
@@ -363,20 +759,74 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             List[Dict]: List of DTR data for the BPN, each containing connector_url, asset_id, and policies
         """
-        # Check if we have cached data that hasn't expired (read operation - no lock needed)
-        if bpn in self.known_dtrs and not self._is_cache_expired(bpn):
-            if self.DTR_DATA_KEY in self.known_dtrs[bpn] and isinstance(self.known_dtrs[bpn][self.DTR_DATA_KEY], dict):
-                cached_dtrs_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-                if len(cached_dtrs_dict) > 0:
-                    if(self.logger and self.verbose):
-                        self.logger.debug(f"[DTR Manager] [{bpn}] Returning {len(cached_dtrs_dict)} DTRs from cache. Next refresh at [{op.timestamp_to_datetime(self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY])}] UTC")
-                    # Return list of DTR values
-                    return [copy.deepcopy(dtr) for dtr in cached_dtrs_dict.values()]
+        # Check if we have cached data (read operation - no lock needed).
+        # A single lookup serves both the existence and the expiry check.
+        refresh_deadline = self._refresh_deadlines.get(bpn)
+        if refresh_deadline is not None:
+            stale_for = time.monotonic() - refresh_deadline
+            if stale_for > MAX_STALE_DTR_AGE:
+                # Could not be refreshed for too long, stop serving the stale DTRs
+                if(self.logger and self.verbose):
+                    self.logger.warning(f"[DTR Manager] [{bpn}] Cached DTRs could not be refreshed for {int(stale_for)}s, discovering them again")
+                self.purge_bpn(bpn)
+                return self._discover_dtrs(bpn, timeout)
+            cached_dtrs_list = [self._dtr_to_dict(dtr) for dtr in self._iter_bpn_dtrs(bpn)]
+            if len(cached_dtrs_list) > 0:
+                if stale_for >= 0:
+                    # Serve the stale DTRs, only the first caller starts the rediscovery
+                    self._refresh_dtrs_in_background(bpn, timeout)
+                # Only format the refresh time when the debug line is actually emitted
+                elif(self.logger and self.verbose and self.logger.isEnabledFor(logging.DEBUG)):
+                    self.logger.debug("[DTR Manager] [%s] Returning %s DTRs from cache. Next refresh at [%s] UTC", bpn, len(cached_dtrs_list), op.timestamp_to_datetime(self._refresh_intervals.get(bpn, 0)))
+                return cached_dtrs_list
+        
+        return self._discover_dtrs(bpn, timeout)
+
+    def _refresh_dtrs_in_background(self, bpn: str, timeout: int) -> None:
+        """
+        Rediscover the DTRs of a BPN on a daemon thread, unless a refresh of the BPN is already running.
         
+        A refresh that adds nothing (no connectors, failed catalogs or an error) leaves
+        the DTRs expired, so the next one is only started after DTR_REFRESH_RETRY_INTERVAL.
         
-        # Cache is expired or doesn't exist, discover DTRs
+        Args:
+            bpn (str): The Business Partner Number whose DTRs expired
+            timeout (int): Timeout for catalog requests
+        """
+        with self._refreshing_lock:
+            if bpn in self._refreshing_bpns or time.monotonic() < self._refresh_retry_deadlines.get(bpn, 0.0):
+                return
+            self._refreshing_bpns.add(bpn)
+        
+        if(self.logger and self.verbose):
+            self.logger.info(f"[DTR Manager] [{bpn}] Cached DTRs expired, serving them while they are rediscovered in the background")
+        
+        def refresh() -> None:
+            try:
+                self._discover_dtrs(bpn, timeout)
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing_bpns.discard(bpn)
+                    if self._is_cache_expired(bpn):
+                        self._refresh_retry_deadlines[bpn] = time.monotonic() + DTR_REFRESH_RETRY_INTERVAL
+                    else:
+                        self._refresh_retry_deadlines.pop(bpn, None)
+        
+        threading.Thread(target=refresh, name=f"dtr-refresh-{bpn}", daemon=True).start()
+
+    def _discover_dtrs(self, bpn: str, timeout: int) -> List[Dict]:
+        """
+        Discover the DTRs of a BPN in its connectors' catalogs and add them to the cache.
+        
+        Args:
+            bpn (str): The Business Partner Number to discover DTRs for
+            timeout (int): Timeout for catalog requests
+            
+        Returns:
+            List[Dict]: List of DTR data for the BPN, each containing connector_url, asset_id, and policies
+        """
         if(self.logger and self.verbose):
-            self.logger.info(f"[DTR Manager] No cached DTRs were found, discovering DTRs for bpn [{bpn}]...")
+            self.logger.info(f"[DTR Manager] Discovering DTRs for bpn [{bpn}]...")
             
         # Get connectors from the connector manager
         try:
@@ -387,7 +837,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 return []
             
             if(self.logger and self.verbose):
-                self.logger.debug(f"[DTR Manager] [{bpn}] Found {len(connectors)} connectors, searching for DTR assets")
+                self.logger.debug("[DTR Manager] [%s] Found %s connectors, searching for DTR assets", bpn, len(connectors))
             
             # Search for DTR assets in each connector's catalog
             connector_service:BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
@@ -409,36 +859,15 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             # Iterate over catalogs and extract DTR information
             for connector_url, catalog in catalogs.items():
                 if catalog and not catalog.get("error"):
-                    # Get datasets from the catalog — supports both Jupiter
-                    # ("dcat:dataset") and Saturn ("dataset") key formats.
-                    datasets = self._get_catalog_datasets(catalog)
-                    
-                    for dataset in datasets:
-                        if self._is_dtr_asset(dataset):
-                            # Extract asset ID
-                            asset_id = dataset.get(self.ID_KEY, "")
-                            if not asset_id:
-                                continue
-                            
-                            # Extract policies
-                            policies = self._extract_policies(dataset)
-                            
-                            # Create DTR data structure
-                            self.add_dtr(bpn=bpn, connector_url=connector_url, asset_id=asset_id, policies=policies)
-
-                            if(self.logger and self.verbose):
-                                self.logger.info(f"[DTR Manager] [{bpn}] Found DTR asset [{asset_id}] in connector [{connector_url}] added to cache")
+                    # Add all DTRs of this connector to the cache at once
+                    self.add_dtrs_batch(bpn=bpn, connector_url=connector_url, dtrs=list(self._iter_dtr_datasets(bpn, connector_url, catalog)))
             
             # Return the cached DTRs for this BPN
-            if bpn in self.known_dtrs and self.DTR_DATA_KEY in self.known_dtrs[bpn]:
-                cached_dtrs_dict = self.known_dtrs[bpn][self.DTR_DATA_KEY]
-                if isinstance(cached_dtrs_dict, dict):
-                    cached_dtrs_list = list(cached_dtrs_dict.values())
-                    if(self.logger and self.verbose):
-                        self.logger.info(f"[DTR Manager] [{bpn}] Discovery complete. Found {len(cached_dtrs_list)} DTR(s) total")
-                    return [copy.deepcopy(dtr) for dtr in cached_dtrs_list]
-                else:
-                    return []
+            if bpn in self._bpn_index:
+                cached_dtrs_list = [self._dtr_to_dict(dtr) for dtr in self._iter_bpn_dtrs(bpn)]
+                if(self.logger and self.verbose):
+                    self.logger.info(f"[DTR Manager] [{bpn}] Discovery complete. Found {len(cached_dtrs_list)} DTR(s) total")
+                return cached_dtrs_list
             else:
                 if(self.logger and self.verbose):
                     self.logger.info(f"[DTR Manager] [{bpn}] No DTR assets found in any connector catalogs")
@@ -490,28 +919,44 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         dtr_results = []
         connector_service = self.connector_consumer_manager.connector_service
         
-        # Calculate per-DTR limit
-        active_dtrs = len([dtr for dtr in dtrs if not current_page.dtr_states.get(dtr.get(self.DTR_ASSET_ID_KEY), DtrPaginationState("")).exhausted])
-        per_dtr_limit = PaginationManager.distribute_limit(limit or 50, active_dtrs) if limit else None
-        
-        # Process DTRs
+        # Split the DTRs in one pass: exhausted ones keep their state, the rest are queried
         new_dtr_states = {}
+        active_dtrs = []
         for dtr in dtrs:
             asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
-            dtr_state = current_page.dtr_states.get(asset_id, DtrPaginationState(asset_id))
+            dtr_state = current_page.dtr_states.get(asset_id)
             
-            if dtr_state.exhausted:
+            if dtr_state is not None and dtr_state.exhausted:
                 new_dtr_states[asset_id] = dtr_state
                 continue
             
-            dtr = self._process_dtr_with_retry(
+            active_dtrs.append((asset_id, dtr, dtr_state.cursor if dtr_state is not None else None))
+        
+        # Calculate per-DTR limit
+        per_dtr_limit = PaginationManager.distribute_limit(limit or 50, len(active_dtrs)) if limit else None
+        
+        # Query all non-exhausted DTRs in parallel, keeping the policy logs of the
+        # negotiations visible to the caller's log capture
+        executor = self._get_dtr_executor()
+        process_dtr = propagate_policy_log_capture(self._process_dtr_with_retry)
+        futures = [
+            (asset_id, executor.submit(
+                process_dtr,
                 connector_service, counter_party_id, dtr, query_spec, dtr_policies,
-                limit=per_dtr_limit, cursor=dtr_state.cursor
-            )
+                limit=per_dtr_limit, cursor=dtr_cursor
+            ))
+            for asset_id, dtr, dtr_cursor in active_dtrs
+        ]
+        
+        # Collect results in DTR order, so pages are stable regardless of which DTR answers first
+        page_shells: Dict[str, Dict] = {}
+        for index, (asset_id, future) in enumerate(futures):
+            dtr, fetched_shells = future.result()
             
             dtr_results.append(dtr)
             shells = dtr.get("shells", [])
             all_shells.extend(shells)
+            page_shells.update(fetched_shells)
             
             # Update DTR state
             paging_metadata = dtr.get("paging_metadata", {})
@@ -522,9 +967,12 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 exhausted=not new_cursor
             )
             
-            # Stop if we've reached the total limit
+            # Stop if we've reached the total limit, dropping the DTR queries that did not start yet
             if limit and len(all_shells) >= limit:
                 all_shells = all_shells[:limit]
+                page_shells = {shell_id: page_shells[shell_id] for shell_id in all_shells if shell_id in page_shells}
+                for _, pending in futures[index + 1:]:
+                    pending.cancel()
                 break
         
         # Create new page state with reference to current page as previous
@@ -535,8 +983,8 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             previous_state=current_page  # Store current page as previous state
         )
         
-        # Get shell descriptors
-        shell_descriptors = [self.shell_descriptors.get(shell_id) for shell_id in all_shells if shell_id in self.shell_descriptors]
+        # The descriptors of the page come straight from the DTR results, already in lookup order
+        shell_descriptors = list(page_shells.values())
         
         # Generate pagination tokens - only include pagination if limit or cursor was provided
         pagination_enabled = limit is not None or cursor is not None
@@ -579,17 +1027,14 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         return response
 
-    def _process_dtr_parallel(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, dtr_results: List = None, limit: Optional[int] = None, cursor: Optional[str] = None) -> None:
-        """Process a single DTR in parallel and append result to shared list."""
-        dtr = self._process_dtr_with_retry(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=limit, cursor=cursor)
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (_process_dtr_parallel)")
-        with self._list_lock:  # Thread-safe append to shared list
-            self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (_process_dtr_parallel)")
-            dtr_results.append(dtr)
-        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (_process_dtr_parallel)")
-
-    def _process_dtr_with_retry(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, max_retries: int = 2, limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict:
-        """Process a single DTR with retry mechanism."""
+    def _process_dtr_with_retry(self, connector_service, counter_party_id: str, dtr: Dict, query_spec: List[Dict], dtr_policies: Optional[List[Dict]] = None, max_retries: int = 2, limit: Optional[int] = None, cursor: Optional[str] = None) -> Tuple[Dict, Dict[str, Dict]]:
+        """
+        Process a single DTR with retry mechanism.
+        
+        Returns:
+            Tuple[Dict, Dict[str, Dict]]: The DTR result, and the shell descriptors fetched from it
+                                          keyed by shell ID, in the order of the lookup response
+        """
         connector_url = dtr.get(self.DTR_CONNECTOR_URL_KEY)
         asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
         
@@ -606,17 +1051,33 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         if not policies_to_use:
             dtr["error"] = "No DTR policies provided and no cached policies available"
-            return dtr
+            return dtr, {}
         
-        filter_expression = connector_service.get_filter_expression(
-            key=self.dct_type_key, operator=self.operator, value=self.dct_type
-        )
+        filter_expression = self._dtr_filter_expression
+        breaker = self._breaker_for(counter_party_id, connector_url)
+        policies_checksum = None  # Only hashed if a failed connection has to be deleted, then reused across attempts
+        
+        # The paging parameters are the same for every attempt, only the dataplane URL may change
+        query_params = {}
+        if limit is not None:
+            query_params["limit"] = limit
+        if cursor is not None:
+            query_params["cursor"] = cursor
+        lookup_path = f"/lookup/shellsByAssetLink?{urlencode(query_params)}" if query_params else "/lookup/shellsByAssetLink"
         
         for attempt in range(max_retries + 1):
             if attempt > 0:
-                self.logger.info(f"[DTR Manager] [{counter_party_id}] Retrying DTR [{asset_id}] at [{connector_url}] (attempt {attempt + 1}/{max_retries + 1})...")
+                self.logger.info("[DTR Manager] [%s] Retrying DTR [%s] at [%s] (attempt %s/%s)...", counter_party_id, asset_id, connector_url, attempt + 1, max_retries + 1)
             try:
-                # Establish connection
+                breaker.before_call()
+            except ServiceUnavailableError as e:
+                # The connector keeps failing, skip it without negotiating
+                dtr["error"] = str(e)
+                return dtr, {}
+            try:
+                # Establish connection. The SDK connection manager already reuses the
+                # negotiated EDR for the same (policies, filter) checksums, so only the
+                # attempts after a _delete_connection negotiate again.
                 dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
                     bpnl=counter_party_id,
                     counter_party_address=connector_url,
@@ -624,32 +1085,27 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                     filter_expression=filter_expression
                 )
                 
-                # Search for shells
-                url = f"{dataplane_url}/lookup/shellsByAssetLink"
-                if limit is not None or cursor is not None:
-                    query_params = []
-                    if limit is not None:
-                        query_params.append(f"limit={limit}")
-                    if cursor is not None:
-                        query_params.append(f"cursor={cursor}")
-                    url += "?" + "&".join(query_params)
+                # One headers dict for the lookup and every shell fetch of this attempt
+                headers = {"Authorization": access_token}
                 
-                response = HttpTools.do_post(
-                    url=url,
-                    headers={"Authorization": f"{access_token}"},
+                # Search for shells
+                response = HttpTools.do_post_with_session(
+                    url=dataplane_url + lookup_path,
+                    session=self._session,
+                    timeout=DATAPLANE_REQUEST_TIMEOUT,
+                    headers=headers,
                     json=query_spec
                 )
                 
                 if response.status_code == 200:
-                    response_data = response.json()
+                    breaker.record_success()
+                    response_data = _response_json(response)
                     shell_ids = self._extract_shell_ids(response_data)
-                    shells = self._fetch_shell_descriptors(response_data, dataplane_url, access_token)
+                    shells = self._fetch_shell_descriptors(response_data, dataplane_url, headers)
+                    fetched_shells = {shell["id"]: shell for shell in shells if shell.get("id")}
                     
-                    # Store shell descriptors in central memory
-                    for shell in shells:
-                        shell_id = shell.get("id")
-                        if shell_id:
-                            self.shell_descriptors[shell_id] = shell
+                    # Store shell descriptors in the bounded central cache
+                    self._cache_shell_descriptors(fetched_shells)
                     
                     dtr.update({
                         "status": "connected",
@@ -657,62 +1113,154 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                         "shells": shell_ids,  # Store just IDs in DTR info
                         "paging_metadata": response_data.get("paging_metadata", {})
                     })
-                    return dtr
+                    return dtr, fetched_shells
                 else:
                     # Delete failed connection for retry
-                    self._delete_connection(connector_service, counter_party_id, connector_url, policies_to_use, filter_expression, counter_party_id, asset_id)
-
+                    policies_checksum = policies_checksum or self._connection_checksum(policies_to_use)
+                    self._delete_connection(connector_service, counter_party_id, connector_url, policies_checksum, self._dtr_filter_checksum, asset_id)
+
+                    if 400 <= response.status_code < 500 and response.status_code not in RETRYABLE_CLIENT_ERRORS:
+                        # The request itself was rejected, repeating it will not help.
+                        # The connector did answer, so this does not count against its breaker.
+                        breaker.record_success()
+                        dtr["error"] = f"HTTP {response.status_code}"
+                        return dtr, {}
+                    breaker.record_failure()
                     if attempt == max_retries:
                         dtr["error"] = f"HTTP {response.status_code} after {max_retries + 1} attempts"
-                    else:
-                        self.logger.warning(f"[DTR Manager] [{counter_party_id}] DTR [{asset_id}] returned HTTP {response.status_code}, will retry ({attempt + 1}/{max_retries + 1})...")
+                        return dtr, {}
+                    self.logger.warning("[DTR Manager] [%s] DTR [%s] returned HTTP %s, will retry (%s/%s)...", counter_party_id, asset_id, response.status_code, attempt + 1, max_retries + 1)
 
             except Exception as e:
                 # Delete failed connection for retry
-                self._delete_connection(connector_service, counter_party_id, connector_url, policies_to_use, filter_expression, counter_party_id, asset_id)
+                policies_checksum = policies_checksum or self._connection_checksum(policies_to_use)
+                self._delete_connection(connector_service, counter_party_id, connector_url, policies_checksum, self._dtr_filter_checksum, asset_id)
 
+                if not isinstance(e, RECOVERABLE_DTR_ERRORS):
+                    # Not a network failure, another attempt would fail the same way
+                    breaker.record_success()
+                    dtr["error"] = str(e)
+                    return dtr, {}
+                breaker.record_failure()
                 if attempt == max_retries:
                     dtr["error"] = str(e)
-                else:
-                    self.logger.warning(f"[DTR Manager] [{counter_party_id}] DTR [{asset_id}] attempt {attempt + 1}/{max_retries + 1} failed with exception: {e}, will retry...")
+                    return dtr, {}
+                self.logger.warning("[DTR Manager] [%s] DTR [%s] attempt %s/%s failed with exception: %s, will retry...", counter_party_id, asset_id, attempt + 1, max_retries + 1, e)
+            
+            time.sleep(self._get_retry_delay(attempt))
+        
+        return dtr, {}
+
+    def _cache_shell_descriptors(self, shells: Dict[str, Dict]) -> None:
+        """Store fetched shell descriptors, evicting the least recently stored ones beyond the cache size."""
+        with self._shells_lock:
+            shell_descriptors = self.shell_descriptors
+            # Drop the refreshed shells first so that a single update appends the
+            # whole batch in order, without a per-shell move_to_end
+            for shell_id in shells.keys() & shell_descriptors.keys():
+                del shell_descriptors[shell_id]
+            shell_descriptors.update(shells)
+            while len(shell_descriptors) > SHELL_DESCRIPTORS_CACHE_SIZE:
+                shell_descriptors.popitem(last=False)
+
+    @staticmethod
+    def _get_retry_delay(attempt: int) -> float:
+        """
+        Compute the delay before retrying a DTR.
         
-        return dtr
+        Args:
+            attempt (int): Zero-based number of the attempt that just failed
+            
+        Returns:
+            float: Exponential backoff capped at DTR_RETRY_BACKOFF_CAP, with +/-50% jitter
+        """
+        return min(DTR_RETRY_BACKOFF_CAP, DTR_RETRY_BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+    
+    @staticmethod
+    def _get_submodel_retry_delay(attempt: int, deadline: float) -> float:
+        """
+        Compute the delay before renegotiating a submodel asset.
+        
+        Args:
+            attempt (int): Zero-based number of the retry about to be made
+            deadline (float): time.monotonic() deadline of the submodel fetch
+            
+        Returns:
+            float: Exponential backoff with jitter, cut to the time left before the deadline (0 once it passed)
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return 0.0
+        delay = min(SUBMODEL_RETRY_BACKOFF_CAP, SUBMODEL_RETRY_BACKOFF_BASE * 2 ** attempt)
+        return min(remaining, delay + random.uniform(0, SUBMODEL_RETRY_BACKOFF_BASE))
     
-    def _fetch_shell_descriptor(self, shell_uuid: str, dataplane_url: str, access_token: str) -> Dict:
-        """Fetch single shell descriptor by UUID."""
-        encoded_uuid = base64.b64encode(shell_uuid.encode('utf-8')).decode('utf-8')
-        response = HttpTools.do_get(
+    def _fetch_shell_descriptor(self, shell_uuid: str, dataplane_url: str, headers: Dict[str, str]) -> Dict:
+        """Fetch single shell descriptor by UUID, with the (shared, read-only) authorization headers."""
+        encoded_uuid = _encode_id(shell_uuid)
+        response = HttpTools.do_get_with_session(
             url=f"{dataplane_url}/shell-descriptors/{encoded_uuid}",
-            headers={"Authorization": f"{access_token}"}
+            session=self._session,
+            timeout=DATAPLANE_REQUEST_TIMEOUT,
+            headers=headers
         )
         if response.status_code == 200:
-            return response.json()
+            return _response_json(response)
         return None
     
-    def _fetch_submodel_descriptor(self, shell_id: str, submodel_id: str, dataplane_url: str, access_token: str) -> Optional[Dict]:
+    def _fetch_submodel_descriptor(self, shell_id: str, submodel_id: str, dataplane_url: str, headers: Dict[str, str]) -> Optional[Dict]:
         """Fetch single submodel descriptor by shell ID and submodel ID.
         
         Args:
             shell_id: The shell ID
             submodel_id: The submodel ID
             dataplane_url: The dataplane URL for API calls
-            access_token: The access token for authentication
+            headers: The authorization headers for the dataplane
             
         Returns:
             Optional[Dict]: The submodel descriptor if found, None otherwise
         """
-        encoded_shell_id = base64.b64encode(shell_id.encode('utf-8')).decode('utf-8')
-        encoded_submodel_id = base64.b64encode(submodel_id.encode('utf-8')).decode('utf-8')
+        encoded_shell_id = _encode_id(shell_id)
+        encoded_submodel_id = _encode_id(submodel_id)
         
-        response = HttpTools.do_get(
+        response = HttpTools.do_get_with_session(
             url=f"{dataplane_url}/shell-descriptors/{encoded_shell_id}/submodel-descriptors/{encoded_submodel_id}",
-            headers={"Authorization": f"{access_token}"}
+            session=self._session,
+            timeout=DATAPLANE_REQUEST_TIMEOUT,
+            headers=headers
         )
         
         if response.status_code == 200:
-            return response.json()
+            return _response_json(response)
         return None
     
+    def _describe_submodel(self, submodel_descriptor: Dict, submodel_id: str) -> Dict:
+        """
+        Flatten a submodel descriptor into the fields of its response descriptor, in one pass.
+        
+        Args:
+            submodel_descriptor: The submodel descriptor data
+            submodel_id: The submodel ID
+            
+        Returns:
+            Dict: Response descriptor without status
+        """
+        asset_id, connector_url, href = self._extract_submodel_endpoint_info(submodel_descriptor)
+        return {
+            "submodelId": submodel_id,
+            "semanticId": self._extract_semantic_id(submodel_descriptor),
+            "semanticIdKeys": self._create_semantic_ids_base64(submodel_descriptor),
+            "assetId": asset_id,
+            "connectorUrl": connector_url,
+            "href": href,
+        }
+
+    @staticmethod
+    def _set_submodel_status(descriptor: Dict, status: str) -> None:
+        """Set the status of a response descriptor, explaining errors caused by a missing semantic ID."""
+        descriptor["status"] = status
+        if status == "error" and not descriptor["semanticId"]:
+            descriptor["error"] = "No semantic ID found in submodel descriptor"
+
     def _process_submodel_descriptor(self, submodel_descriptor: Dict, submodel_id: str, governance: Optional[List[Dict]], connector_url: str, asset_id: str, counter_party_id: str = None) -> Dict:
         """Process a submodel descriptor and create response structure.
         
@@ -728,24 +1276,9 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             Dict: Response with submodel descriptor, data, and DTR info
         """
         # Extract information from submodel descriptor
-        current_semantic_id = self._extract_semantic_id(submodel_descriptor)
-        asset_id_sub, connector_url_sub, href = self._extract_submodel_endpoint_info(submodel_descriptor)
-        semantic_ids_base64 = self._create_semantic_ids_base64(submodel_descriptor)
-        
-        # Determine status and prepare descriptor
-        descriptor = {
-            "submodelId": submodel_id,
-            "semanticId": current_semantic_id,
-            "semanticIdKeys": semantic_ids_base64,
-            "assetId": asset_id_sub,
-            "connectorUrl": connector_url_sub,
-            "href": href,
-            "status": self._determine_single_submodel_status(current_semantic_id, governance)
-        }
-        
-        # Add error message if needed
-        if descriptor["status"] == "error" and not current_semantic_id:
-            descriptor["error"] = "No semantic ID found in submodel descriptor"
+        descriptor = self._describe_submodel(submodel_descriptor, submodel_id)
+        current_semantic_id = descriptor["semanticId"]
+        self._set_submodel_status(descriptor, self._determine_single_submodel_status(current_semantic_id, governance))
         
         response = {
             "submodelDescriptor": descriptor,
@@ -758,50 +1291,52 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         # Fetch submodel data if governance policies are available and counter_party_id is provided
         if counter_party_id and governance and descriptor["status"] == "pending":
-            submodel_info = {
-                "submodel_id": submodel_id,
-                "semantic_id": current_semantic_id,
-                "policies": governance,
-                "assetId": asset_id_sub,
-                "connectorUrl": connector_url_sub,
-                "href": href
-            }
+            submodel_info = SubmodelFetch(
+                submodel_id=submodel_id,
+                semantic_id=current_semantic_id,
+                policies=governance,
+                asset_id=descriptor["assetId"],
+                connector_url=descriptor["connectorUrl"],
+                href=descriptor["href"]
+            )
             response = self._fetch_single_submodel_data(counter_party_id, submodel_info, response)
         
         return response
     
-    def _fetch_shell_descriptors(self, shells_response: Dict, dataplane_url: str, access_token: str) -> List[Dict]:
-        """Fetch shell descriptors from shell UUIDs in parallel."""
+    def _fetch_shell_descriptors(self, shells_response: Dict, dataplane_url: str, headers: Dict[str, str]) -> List[Dict]:
+        """
+        Fetch shell descriptors from shell UUIDs in parallel, in the order of the lookup response.
+        
+        Every fetch is sent with the same headers dict, requests does not modify it.
+        """
         shell_uuids = shells_response.get('result', []) if isinstance(shells_response, dict) else shells_response
         if not shell_uuids:
             return []
         
-        shells = []
-        threads = []
-        
-        # Use a thread-safe list to collect results
-        def fetch_single_shell(shell_uuid: str, results_list: List[Dict]):
+        if len(shell_uuids) == 1:
+            # Nothing to overlap, fetch on the calling thread instead of handing off to the pool
             try:
-                shell = self._fetch_shell_descriptor(shell_uuid, dataplane_url, access_token)
-                if shell:
-                    self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Trying to acquire lock (fetch_single_shell)")
-                    with self._list_lock:  # Thread-safe append
-                        self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Acquired lock (fetch_single_shell)")
-                        results_list.append(shell)
-                    self.logger.debug(f"[DTR Manager] [{threading.get_ident()}] Released lock (fetch_single_shell)")
+                shell = self._fetch_shell_descriptor(shell_uuids[0], dataplane_url, headers)
             except Exception:
-                # Silently continue on error
-                pass
+                return []
+            return [shell] if shell else []
         
-        # Start threads for parallel fetching
-        for shell_uuid in shell_uuids:
-            thread = threading.Thread(target=fetch_single_shell, args=(shell_uuid, shells))
-            thread.start()
-            threads.append(thread)
+        executor = self._get_fetch_executor()
+        futures = [
+            executor.submit(self._fetch_shell_descriptor, shell_uuid, dataplane_url, headers)
+            for shell_uuid in shell_uuids
+        ]
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        # Collect in submission order: the fetches still run concurrently, and no shared list is needed
+        shells = []
+        for future in futures:
+            try:
+                shell = future.result()
+            except Exception:
+                # Silently continue on error
+                continue
+            if shell:
+                shells.append(shell)
         
         return shells
         
@@ -813,7 +1348,28 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             return shells_response
         return []
 
-    def _delete_connection(self, connector_service:BaseConnectorConsumerService, counter_party_id: str, connector_url: str, policies: List, filter_expression: Dict, bpn: str, asset_id: str):
+    @staticmethod
+    def _connection_checksum(value: Any) -> str:
+        """
+        Checksum identifying the policies or filter expression of an EDR connection.
+        
+        Must match the checksums the SDK uses to store connections, so the
+        algorithm cannot be changed on this side alone.
+        
+        Args:
+            value (Any): The policies or filter expression
+            
+        Returns:
+            str: SHA3-256 hex digest of the string form of the value
+        """
+        return _sha3_checksum(str(value))
+
+    @cached_property
+    def _dtr_filter_checksum(self) -> str:
+        """Connection checksum of the DTR filter expression, which never changes for the manager."""
+        return self._connection_checksum(self._dtr_filter_expression)
+
+    def _delete_connection(self, connector_service:BaseConnectorConsumerService, counter_party_id: str, connector_url: str, policies_checksum: str, filter_checksum: str, asset_id: str):
         """Delete a failed EDR connection so the next retry negotiates a fresh one.
         
         Only the connection/EDR is removed — the DTR cache entry is intentionally
@@ -822,10 +1378,10 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         Both the in-memory SDK cache and the persistent edr_connections DB table
         are cleaned up so that a stale EDR is not reloaded after a restart.
+        
+        The checksums are computed by the caller with _connection_checksum, so
+        that retries against the same DTR do not hash the same inputs again.
         """
-        policies_checksum = hashlib.sha3_256(str(policies).encode('utf-8')).hexdigest()
-        filter_checksum = hashlib.sha3_256(str(filter_expression).encode('utf-8')).hexdigest()
-
         # 1. Remove from SDK in-memory cache
         connector_service.connection_manager.delete_connection(
             counter_party_id=counter_party_id,
@@ -857,45 +1413,76 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         
         connector_service = self.connector_consumer_manager.connector_service
         
-        # Try each DTR to find the shell
-        for dtr in dtrs:
-            connector_url = dtr.get(self.DTR_CONNECTOR_URL_KEY)
-            asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
-            
-            # Use provided policies or fall back to cached policies for automatic negotiation
-            policies_to_use = dtr_policies if dtr_policies else dtr.get(self.DTR_POLICIES_KEY, [])
-            
-            filter_expression = connector_service.get_filter_expression(
-                key=self.dct_type_key, operator=self.operator, value=self.dct_type
-            )
-            
+        if len(dtrs) == 1:
+            result = self._probe_dtr_for_shell(connector_service, counter_party_id, id, dtrs[0], dtr_policies)
+            if result:
+                return result
+        else:
+            # Probe all DTRs at once and answer with the first one holding the shell,
+            # instead of waiting for every failing DTR in turn
+            executor = self._get_dtr_executor()
+            probe_dtr = propagate_policy_log_capture(self._probe_dtr_for_shell)
+            futures = [
+                executor.submit(probe_dtr, connector_service, counter_party_id, id, dtr, dtr_policies)
+                for dtr in dtrs
+            ]
             try:
-                # Establish connection
-                dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
-                    bpnl=counter_party_id,
-                    counter_party_address=connector_url,
-                    policies=policies_to_use,
-                    filter_expression=filter_expression
-                )
-                
-                # Fetch specific shell descriptor
-                shell = self._fetch_shell_descriptor(id, dataplane_url, access_token)
-                if shell:
-                    return {
-                        "shell_descriptor": shell,
-                        "dtr": {
-                            "connectorUrl": connector_url,
-                            "assetId": asset_id,
-                        }
-                    }
-                    
-            except Exception as e:
-                if self.logger and self.verbose:
-                    self.logger.debug(f"[DTR Manager] [{counter_party_id}] Failed to fetch shell {id} from DTR {connector_url}: {e}")
-                continue
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result:
+                        return result
+            finally:
+                for future in futures:
+                    future.cancel()
 
         return {"status": 404, "error": "Shell not found in any DTR of this counterPartyId"}
 
+    def _probe_dtr_for_shell(self, connector_service, counter_party_id: str, id: str, dtr: Dict, dtr_policies: Optional[List[Dict]] = None) -> Optional[Dict]:
+        """
+        Look up a shell descriptor in a single DTR.
+        
+        Args:
+            connector_service: The connector consumer service used to negotiate access
+            counter_party_id (str): The Business Partner Number
+            id (str): The shell ID to discover
+            dtr (Dict): The cached DTR to query
+            dtr_policies (Optional[List[Dict]]): DTR policies to use, or None to use the cached ones
+            
+        Returns:
+            Optional[Dict]: The discover_shell response if the DTR holds the shell, None otherwise
+        """
+        connector_url = dtr.get(self.DTR_CONNECTOR_URL_KEY)
+        asset_id = dtr.get(self.DTR_ASSET_ID_KEY)
+        
+        # Use provided policies or fall back to cached policies for automatic negotiation
+        policies_to_use = dtr_policies if dtr_policies else dtr.get(self.DTR_POLICIES_KEY, [])
+        
+        try:
+            # Establish connection
+            dataplane_url, access_token = connector_service.do_dsp_with_bpnl(
+                bpnl=counter_party_id,
+                counter_party_address=connector_url,
+                policies=policies_to_use,
+                filter_expression=self._dtr_filter_expression
+            )
+            
+            # Fetch specific shell descriptor
+            shell = self._fetch_shell_descriptor(id, dataplane_url, {"Authorization": access_token})
+        except Exception as e:
+            if self.logger and self.verbose:
+                self.logger.debug("[DTR Manager] [%s] Failed to fetch shell %s from DTR %s: %s", counter_party_id, id, connector_url, e)
+            return None
+        
+        if not shell:
+            return None
+        return {
+            "shell_descriptor": shell,
+            "dtr": {
+                "connectorUrl": connector_url,
+                "assetId": asset_id,
+            }
+        }
+
     def discover_submodels(self, counter_party_id: str, id: str, dtr_policies: Optional[List[Dict]] = None, governance: Optional[Dict[str, List[Dict]]] = None) -> Dict:
         """
         Retrieve submodel data by first discovering the shell and then fetching all submodels in parallel.
@@ -946,37 +1533,21 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         submodels_to_fetch = []
         for submodel in submodel_descriptors:
             submodel_id = submodel.get("id", "unknown")
-            semantic_id = self._extract_semantic_id(submodel)
-            asset_id, connector_url, href = self._extract_submodel_endpoint_info(submodel)
-            semantic_ids_base64 = self._create_semantic_ids_base64(submodel)
-            
-            # Determine status and prepare descriptor
-            descriptor = {
-                "submodelId": submodel_id,
-                "semanticId": semantic_id,
-                "semanticIdKeys": semantic_ids_base64,
-                "assetId": asset_id,
-                "connectorUrl": connector_url,
-                "href": href,
-                "status": self._determine_submodel_status(semantic_id, governance)
-            }
-            
-            # Add error message if needed
-            if descriptor["status"] == "error" and not semantic_id:
-                descriptor["error"] = "No semantic ID found in submodel descriptor"
-            
+            descriptor = self._describe_submodel(submodel, submodel_id)
+            semantic_id = descriptor["semanticId"]
+            self._set_submodel_status(descriptor, self._determine_submodel_status(semantic_id, governance))
             response["submodelDescriptors"][submodel_id] = descriptor
             
             # Queue for data fetching if needed (only if governance is provided)
             if governance and descriptor["status"] == "pending":
-                submodels_to_fetch.append({
-                    "submodel_id": submodel_id,
-                    "semantic_id": semantic_id,
-                    "policies": governance[semantic_id],
-                    "assetId": asset_id,
-                    "connectorUrl": connector_url,
-                    "href": href
-                })
+                submodels_to_fetch.append(SubmodelFetch(
+                    submodel_id=submodel_id,
+                    semantic_id=semantic_id,
+                    policies=governance[semantic_id],
+                    asset_id=descriptor["assetId"],
+                    connector_url=descriptor["connectorUrl"],
+                    href=descriptor["href"]
+                ))
         
         # Fetch submodel data in parallel (only if governance policies are available)
         if submodels_to_fetch:
@@ -1018,8 +1589,8 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 "dtr": None
             }
         else:
-            self.logger.debug(f"[DTR Manager] [{counter_party_id}] Found {len(dtrs)} DTR(s) for submodel discovery")
-            self.logger.debug(f"[DTR Manager] [{counter_party_id}] DTRs: {dtrs}")
+            self.logger.debug("[DTR Manager] [%s] Found %d DTR(s) for submodel discovery", counter_party_id, len(dtrs))
+            self.logger.debug("[DTR Manager] [%s] DTRs: %s", counter_party_id, dtrs)
 
         connector_service: BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
 
@@ -1031,9 +1602,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             # Use provided policies or fall back to cached policies for automatic negotiation
             policies_to_use = dtr_policies if dtr_policies else dtr.get(self.DTR_POLICIES_KEY, [])
             
-            filter_expression = connector_service.get_filter_expression(
-                key=self.dct_type_key, operator=self.operator, value=self.dct_type
-            )
+            filter_expression = self._dtr_filter_expression
             
             try:
                 # Establish connection
@@ -1043,13 +1612,13 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                     policies=policies_to_use,
                     filter_expression=filter_expression
                 )
-                self.logger.debug(f"[DTR Manager] [{counter_party_id}] Connected to DTR at {connector_url} for submodel discovery")
-                self.logger.debug(f"[DTR Manager] [{counter_party_id}] Using policies: {policies_to_use}")
-                self.logger.debug(f"[DTR Manager] [{counter_party_id}] Dataplane URL: {dataplane_url}")
+                self.logger.debug("[DTR Manager] [%s] Connected to DTR at %s for submodel discovery", counter_party_id, connector_url)
+                self.logger.debug("[DTR Manager] [%s] Using policies: %s", counter_party_id, policies_to_use)
+                self.logger.debug("[DTR Manager] [%s] Dataplane URL: %s", counter_party_id, dataplane_url)
 
                 # Direct API call to fetch specific submodel descriptor
-                submodel_descriptor = self._fetch_submodel_descriptor(id, submodel_id, dataplane_url, access_token)
-                self.logger.debug(f"[DTR Manager] [{counter_party_id}] Fetched submodel descriptor for submodel ID {submodel_id} from DTR at {connector_url}: {submodel_descriptor}")
+                submodel_descriptor = self._fetch_submodel_descriptor(id, submodel_id, dataplane_url, {"Authorization": access_token})
+                self.logger.debug("[DTR Manager] [%s] Fetched submodel descriptor for submodel ID %s from DTR at %s: %s", counter_party_id, submodel_id, connector_url, submodel_descriptor)
                 
                 if submodel_descriptor is not None:
                     return self._process_submodel_descriptor(
@@ -1067,7 +1636,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                     
             except Exception as e:
                 if self.logger and self.verbose:
-                    self.logger.debug(f"[DTR Manager] [{counter_party_id}] Failed to fetch submodel {submodel_id} from DTR {connector_url}: {e}")
+                    self.logger.debug("[DTR Manager] [%s] Failed to fetch submodel %s from DTR %s: %s", counter_party_id, submodel_id, connector_url, e)
                 continue
         
         return {
@@ -1134,45 +1703,30 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         submodels_to_fetch = []
         found_submodels = []
         
+        # Build the searched semantic IDs once instead of once per submodel
+        target_set = frozenset(map(_semantic_key_pair, semantic_ids)) if semantic_ids else frozenset()
+        
         for submodel in submodel_descriptors:
-            current_submodel_id = submodel.get("id", "unknown")
-            current_semantic_id = self._extract_semantic_id(submodel)
-            current_all_semantic_ids = self._extract_all_semantic_ids(submodel)
-            
             # Check semantic_ids (all must match)
-            if semantic_ids and self._semantic_ids_match(current_all_semantic_ids, semantic_ids):
+            if target_set and self._has_semantic_ids(submodel, target_set):
                 # Found a matching submodel
                 found_submodels.append(submodel)
-                asset_id, connector_url, href = self._extract_submodel_endpoint_info(submodel)
-                semantic_ids_base64 = self._create_semantic_ids_base64(submodel)
-                
-                # Determine status and prepare descriptor
-                descriptor = {
-                    "submodelId": current_submodel_id,
-                    "semanticId": current_semantic_id,
-                    "semanticIdKeys": semantic_ids_base64,
-                    "assetId": asset_id,
-                    "connectorUrl": connector_url,
-                    "href": href,
-                    "status": self._determine_single_submodel_status(current_semantic_id, governance)
-                }
-                
-                # Add error message if needed
-                if descriptor["status"] == "error" and not current_semantic_id:
-                    descriptor["error"] = "No semantic ID found in submodel descriptor"
-                
+                current_submodel_id = submodel.get("id", "unknown")
+                descriptor = self._describe_submodel(submodel, current_submodel_id)
+                current_semantic_id = descriptor["semanticId"]
+                self._set_submodel_status(descriptor, self._determine_single_submodel_status(current_semantic_id, governance))
                 response["submodelDescriptors"][current_submodel_id] = descriptor
                 
                 # Queue for data fetching if needed (only if governance is provided)
                 if governance and descriptor["status"] == "pending":
-                    submodels_to_fetch.append({
-                        "submodel_id": current_submodel_id,
-                        "semantic_id": current_semantic_id,
-                        "policies": governance,  # governance is a list for single submodel
-                        "assetId": asset_id,
-                        "connectorUrl": connector_url,
-                        "href": href
-                    })
+                    submodels_to_fetch.append(SubmodelFetch(
+                        submodel_id=current_submodel_id,
+                        semantic_id=current_semantic_id,
+                        policies=governance,  # governance is a list for single submodel
+                        asset_id=descriptor["assetId"],
+                        connector_url=descriptor["connectorUrl"],
+                        href=descriptor["href"]
+                    ))
         
         # Set count of found submodels
         response["submodelsFound"] = len(found_submodels)
@@ -1210,30 +1764,33 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         else:
             return "pending"
     
-    def _fetch_submodels_data(self, counter_party_id: str, submodels_to_fetch: List[Dict], response: Dict) -> None:
+    def _fetch_submodels_data(self, counter_party_id: str, submodels_to_fetch: List[SubmodelFetch], response: Dict) -> None:
         """Fetch submodel data in parallel and update the response."""
         # Group by asset_id for optimization
         assets_to_negotiate = self._group_submodels_by_asset(submodels_to_fetch)
         
-        # Negotiate assets in parallel
-        asset_tokens, asset_errors = self._negotiate_assets_parallel(counter_party_id, assets_to_negotiate)
+        # Negotiate assets in parallel, fetching the submodels of each asset as soon as its negotiation is done
+        asset_tokens, asset_errors, failed_assets = self._negotiate_and_fetch_pipelined(
+            counter_party_id, assets_to_negotiate, response
+        )
         
         # Mark failed negotiations with specific error messages
         self._mark_failed_negotiations(assets_to_negotiate, asset_tokens, asset_errors, response)
         
-        # Fetch data in parallel
-        self._fetch_data_parallel(submodels_to_fetch, asset_tokens, response)
+        # Drop the EDRs the dataplane rejected, so the next request negotiates fresh ones
+        if failed_assets:
+            self._purge_edrs(counter_party_id, failed_assets)
         
         # Mark any remaining pending items as failed
         self._mark_remaining_pending_as_failed(submodels_to_fetch, response)
     
-    def _fetch_single_submodel_data(self, counter_party_id: str, submodel_info: Dict, response: Dict) -> Dict:
+    def _fetch_single_submodel_data(self, counter_party_id: str, submodel_info: SubmodelFetch, response: Dict) -> Dict:
         """Fetch data for a single submodel and update the response."""
-        submodel_id = submodel_info["submodel_id"]
-        asset_id = submodel_info["assetId"]
-        connector_url = submodel_info["connectorUrl"]
-        href = submodel_info["href"]
-        policies = submodel_info["policies"]
+        submodel_id = submodel_info.submodel_id
+        asset_id = submodel_info.asset_id
+        connector_url = submodel_info.connector_url
+        href = submodel_info.href
+        policies = submodel_info.policies
         
         # Update response structure for single submodel
         if asset_id == "unknown" or not asset_id:
@@ -1241,6 +1798,9 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             response["submodelDescriptor"]["error"] = "Invalid asset ID"
             return response
         
+        deadline = time.monotonic() + SUBMODEL_FETCH_DEADLINE
+        retry_attempt = 0
+        
         # --- Step 1: Contract negotiation (with one stale-EDR retry) ---
         access_token = None
         for _neg_attempt in range(2):  # attempt 0 = first try, attempt 1 = retry after purge
@@ -1262,15 +1822,17 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                     except Exception as purge_exc:
                         if self.logger:
                             self.logger.debug(
-                                f"[DTR Manager] [{counter_party_id}] Purge after failed negotiation raised: {purge_exc}"
+                                "[DTR Manager] [%s] Purge after failed negotiation raised: %s", counter_party_id, purge_exc
                             )
                     if purge_ok:
+                        delay = self._get_submodel_retry_delay(retry_attempt, deadline)
+                        retry_attempt += 1
                         if self.logger:
                             self.logger.info(
-                                f"[DTR Manager] [{counter_party_id}] Stale EDR purged for asset [{asset_id}]. "
-                                f"Waiting 5 s before retry negotiation..."
+                                "[DTR Manager] [%s] Stale EDR purged for asset [%s]. Waiting %.1fs before retry negotiation...",
+                                counter_party_id, asset_id, delay
                             )
-                        time.sleep(5)
+                        time.sleep(delay)
                         continue  # retry negotiation
                     else:
                         # Nothing was cached – not a stale-EDR problem; fail immediately.
@@ -1333,11 +1895,13 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                     f"[DTR Manager] [{counter_party_id}] Cache purge failed for asset [{asset_id}]: {purge_exc}"
                 )
 
+        delay = self._get_submodel_retry_delay(retry_attempt, deadline)
         if self.logger:
             self.logger.info(
-                f"[DTR Manager] [{counter_party_id}] Purged cached EDR for asset [{asset_id}]. Waiting 5s before retry..."
+                "[DTR Manager] [%s] Purged cached EDR for asset [%s]. Waiting %.1fs before retry...",
+                counter_party_id, asset_id, delay
             )
-        time.sleep(5)
+        time.sleep(delay)
 
         try:
             access_token = self._negotiate_asset(counter_party_id, asset_id, connector_url, policies)
@@ -1388,181 +1952,203 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 )
         return response    
     
-    def _group_submodels_by_asset(self, submodels_to_fetch: List[Dict]) -> Dict[str, Dict]:
+    def _group_submodels_by_asset(self, submodels_to_fetch: List[SubmodelFetch]) -> Dict[str, Dict]:
         """Group submodels by asset_id for optimization."""
         assets_to_negotiate = {}
         for item in submodels_to_fetch:
-            asset_id = item["assetId"]
-            if asset_id and asset_id != "unknown":
-                if asset_id not in assets_to_negotiate:
-                    assets_to_negotiate[asset_id] = {
-                        "connectorUrl": item["connectorUrl"],
-                        "policies": item["policies"],
-                        "submodels": []
-                    }
-                assets_to_negotiate[asset_id]["submodels"].append(item)
+            asset_id = item.asset_id
+            if not asset_id or asset_id == "unknown":
+                continue
+            # One lookup per item; the entry is only built for the first submodel of an asset
+            entry = assets_to_negotiate.get(asset_id)
+            if entry is None:
+                entry = assets_to_negotiate[asset_id] = {
+                    "connectorUrl": item.connector_url,
+                    "policies": item.policies,
+                    "submodels": []
+                }
+            entry["submodels"].append(item)
         return assets_to_negotiate
     
-    def _negotiate_assets_parallel(self, counter_party_id: str, assets_to_negotiate: Dict[str, Dict]) -> tuple[Dict[str, str], Dict[str, str]]:
-        """Negotiate assets in parallel and return successful tokens and error messages."""
-        asset_tokens = {}
-        asset_errors = {}
-        if not assets_to_negotiate:
-            return asset_tokens, asset_errors
-            
-        with ThreadPoolExecutor(max_workers=min(len(assets_to_negotiate), 10)) as executor:
-            future_to_asset = {
-                executor.submit(
-                    self._negotiate_asset,
-                    counter_party_id,
-                    asset_id,
-                    asset_info["connectorUrl"],
-                    asset_info["policies"]
-                ): asset_id
-                for asset_id, asset_info in assets_to_negotiate.items()
-            }
-            
-            for future in as_completed(future_to_asset):
-                asset_id = future_to_asset[future]
-                try:
-                    token = future.result()
-                    if token:
-                        asset_tokens[asset_id] = token
-                    else:
-                        asset_errors[asset_id] = "Asset negotiation failed. You may not have enough access permissions to this submodel."
-                except Exception as e:
-                    error_message = str(e)
-                    # Concatenate the specific error with the generic message
-                    combined_message = f"Asset negotiation failed. You may not have enough access permissions to this submodel. {error_message}"
-                    asset_errors[asset_id] = combined_message
-                    if self.logger and self.verbose:
-                        self.logger.error(f"[DTR Manager] [{counter_party_id}] Error negotiating asset {asset_id}: {e}")
-        
-        return asset_tokens, asset_errors
-    
     def _mark_failed_negotiations(self, assets_to_negotiate: Dict[str, Dict], asset_tokens: Dict[str, str], asset_errors: Dict[str, str], response: Dict) -> None:
         """Mark submodels with failed asset negotiations and include specific error messages."""
-        failed_assets = set(assets_to_negotiate.keys()) - set(asset_tokens.keys())
+        descriptors = response["submodelDescriptors"]
+        failed_assets = assets_to_negotiate.keys() - asset_tokens.keys()
         for asset_id in failed_assets:
             # Get the specific error message for this asset, or use a default
             error_message = asset_errors.get(asset_id, "Asset negotiation failed. You may not have enough access permissions to this submodel.")
             
             for submodel_item in assets_to_negotiate[asset_id]["submodels"]:
-                submodel_id = submodel_item["submodel_id"]
-                response["submodelDescriptors"][submodel_id]["status"] = "error"
-                response["submodelDescriptors"][submodel_id]["error"] = error_message
+                descriptor = descriptors[submodel_item.submodel_id]
+                descriptor["status"] = "error"
+                descriptor["error"] = error_message
     
-    def _fetch_data_parallel(self, submodels_to_fetch: List[Dict], asset_tokens: Dict[str, str], response: Dict) -> None:
-        """Fetch submodel data in parallel."""
-        fetch_tasks = [
-            item for item in submodels_to_fetch 
-            if item["assetId"] in asset_tokens
-        ]
+    def _negotiate_and_fetch_pipelined(self, counter_party_id: str, assets_to_negotiate: Dict[str, Dict], response: Dict) -> Tuple[Dict[str, str], Dict[str, str], Set[str]]:
+        """
+        Negotiate assets in parallel and fetch their submodels as the negotiations complete.
         
-        if not fetch_tasks:
-            return
-
-        with ThreadPoolExecutor(max_workers=min(len(fetch_tasks), 20)) as executor:
-            future_to_submodel = {
-                executor.submit(
-                    self._fetch_submodel_data_with_token,
-                    item["submodel_id"],
-                    item["href"],
-                    asset_tokens[item["assetId"]]
-                ): item["submodel_id"]
-                for item in fetch_tasks
-            }
-            
-            for future in as_completed(future_to_submodel):
-                submodel_id = future_to_submodel[future]
-                try:
-                    data = future.result()
-                    if data:
-                        response["submodels"][submodel_id] = data
-                        response["submodelDescriptors"][submodel_id]["status"] = "success"
-                    else:
-                        response["submodelDescriptors"][submodel_id]["status"] = "error"
-                        response["submodelDescriptors"][submodel_id]["error"] = (
-                            "Contract negotiation succeeded but the submodel endpoint returned no data. "
-                            "The provider may not have registered data for this submodel descriptor href."
-                        )
-                except RuntimeError as e:
-                    response["submodelDescriptors"][submodel_id]["status"] = "error"
-                    response["submodelDescriptors"][submodel_id]["error"] = (
-                        f"Contract negotiation succeeded, but the provider's dataplane returned an error. "
-                        f"The provider's administrator must verify the dataplane registration and backend "
-                        f"service configuration for this asset. Detail: {e}"
-                    )
-                    if self.logger:
-                        self.logger.error(f"[DTR Manager] Dataplane error fetching submodel {submodel_id}: {e}")
-                except Exception as e:
-                    response["submodelDescriptors"][submodel_id]["status"] = "error"
-                    response["submodelDescriptors"][submodel_id]["error"] = (
-                        f"Unexpected error during submodel data fetch: {e}"
+        The submodels of an asset are submitted to the fetch pool as soon as its own
+        negotiation is done, so fetching from the fastest connectors overlaps with the
+        negotiations still running against the slower ones. At most
+        MAX_NEGOTIATIONS_PER_CALL negotiations run at once; the next asset is submitted
+        when one of them completes. All results are handled on the calling thread,
+        which is the only one writing to the response.
+        
+        Returns:
+            Tuple of the successful tokens and the negotiation error messages per asset ID,
+            and the asset IDs whose dataplane returned an error for at least one submodel
+        """
+        asset_tokens = {}
+        asset_errors = {}
+        failed_assets = set()
+        if not assets_to_negotiate:
+            return asset_tokens, asset_errors, failed_assets
+        
+        if len(assets_to_negotiate) == 1:
+            # Nothing to overlap, negotiate on the calling thread instead of handing off to the pool
+            negotiate_asset = self._negotiate_asset
+            submit_negotiation = _run_inline
+        else:
+            # Negotiate on the shared negotiation pool, keeping the policy logs visible to the caller's log capture
+            negotiate_asset = propagate_policy_log_capture(self._negotiate_asset)
+            submit_negotiation = self._get_negotiation_executor().submit
+        waiting_assets = iter(assets_to_negotiate.items())
+        negotiations = {}
+        fetches = {}
+        pending = set()
+        
+        def submit_next_negotiation() -> None:
+            next_asset = next(waiting_assets, None)
+            if next_asset is None:
+                return
+            asset_id, asset_info = next_asset
+            future = submit_negotiation(
+                negotiate_asset,
+                counter_party_id,
+                asset_id,
+                asset_info["connectorUrl"],
+                asset_info["policies"]
+            )
+            negotiations[future] = asset_id
+            pending.add(future)
+        
+        for _ in range(min(len(assets_to_negotiate), MAX_NEGOTIATIONS_PER_CALL)):
+            submit_next_negotiation()
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetches:
+                    self._record_fetch_result(future, fetches.pop(future), response, failed_assets)
+                    continue
+                
+                asset_id = negotiations.pop(future)
+                submit_next_negotiation()
+                token = self._record_negotiation_result(counter_party_id, asset_id, future, asset_tokens, asset_errors)
+                if not token:
+                    continue
+                items = assets_to_negotiate[asset_id]["submodels"]
+                # A lone fetch with nothing else pending runs on the calling thread as well
+                if len(items) == 1 and len(done) == 1 and not pending:
+                    submit_fetch = _run_inline
+                else:
+                    submit_fetch = self._get_fetch_executor().submit
+                for item in items:
+                    fetch = submit_fetch(
+                        self._fetch_submodel_data_with_token,
+                        item.submodel_id,
+                        item.href,
+                        token
                     )
-                    if self.logger and self.verbose:
-                        self.logger.error(f"[DTR Manager] Unexpected error fetching submodel {submodel_id}: {e}")
+                    fetches[fetch] = item
+                    pending.add(fetch)
+        
+        return asset_tokens, asset_errors, failed_assets
+    
+    def _record_negotiation_result(self, counter_party_id: str, asset_id: str, future: Future, asset_tokens: Dict[str, str], asset_errors: Dict[str, str]) -> Optional[str]:
+        """Store the token or the error message of a completed asset negotiation and return the token."""
+        try:
+            token = future.result()
+        except Exception as e:
+            # Concatenate the specific error with the generic message
+            asset_errors[asset_id] = f"Asset negotiation failed. You may not have enough access permissions to this submodel. {e}"
+            if self.logger and self.verbose:
+                self.logger.error(f"[DTR Manager] [{counter_party_id}] Error negotiating asset {asset_id}: {e}")
+            return None
+        
+        if token:
+            asset_tokens[asset_id] = token
+        else:
+            asset_errors[asset_id] = "Asset negotiation failed. You may not have enough access permissions to this submodel."
+        return token
+    
+    def _record_fetch_result(self, future: Future, item: SubmodelFetch, response: Dict, failed_assets: Set[str]) -> None:
+        """Store the data or the error of a completed submodel fetch in the response."""
+        submodel_id = item.submodel_id
+        descriptor = response["submodelDescriptors"][submodel_id]
+        try:
+            data = future.result()
+            if data:
+                response["submodels"][submodel_id] = data
+                descriptor["status"] = "success"
+            else:
+                descriptor["status"] = "error"
+                descriptor["error"] = (
+                    "Contract negotiation succeeded but the submodel endpoint returned no data. "
+                    "The provider may not have registered data for this submodel descriptor href."
+                )
+        except RuntimeError as e:
+            failed_assets.add(item.asset_id)
+            descriptor["status"] = "error"
+            descriptor["error"] = (
+                f"Contract negotiation succeeded, but the provider's dataplane returned an error. "
+                f"The provider's administrator must verify the dataplane registration and backend "
+                f"service configuration for this asset. Detail: {e}"
+            )
+            if self.logger:
+                self.logger.error(f"[DTR Manager] Dataplane error fetching submodel {submodel_id}: {e}")
+        except Exception as e:
+            descriptor["status"] = "error"
+            descriptor["error"] = (
+                f"Unexpected error during submodel data fetch: {e}"
+            )
+            if self.logger and self.verbose:
+                self.logger.error(f"[DTR Manager] Unexpected error fetching submodel {submodel_id}: {e}")
     
-    def _mark_remaining_pending_as_failed(self, submodels_to_fetch: List[Dict], response: Dict) -> None:
+    def _mark_remaining_pending_as_failed(self, submodels_to_fetch: List[SubmodelFetch], response: Dict) -> None:
         """Mark any remaining pending submodels as failed."""
+        descriptors = response["submodelDescriptors"]
         for item in submodels_to_fetch:
-            submodel_id = item["submodel_id"]
-            if response["submodelDescriptors"][submodel_id]["status"] == "pending":
-                response["submodelDescriptors"][submodel_id]["status"] = "error"
-                response["submodelDescriptors"][submodel_id]["error"] = "Processing was not completed"
+            descriptor = descriptors[item.submodel_id]
+            if descriptor["status"] == "pending":
+                descriptor["status"] = "error"
+                descriptor["error"] = "Processing was not completed"
 
     def _extract_semantic_id(self, submodel_descriptor: Dict) -> Optional[str]:
         """Extract semantic ID value from submodel descriptor."""
         semantic_id = submodel_descriptor.get("semanticId", {})
         if isinstance(semantic_id, dict):
             keys = semantic_id.get("keys", [])
-            if keys and isinstance(keys, list) and len(keys) > 0:
-                first_key = keys[0]
-                if isinstance(first_key, dict):
-                    return first_key.get("value")
-        return None
-    
-    def _extract_semantic_id_with_type(self, submodel_descriptor: Dict) -> Optional[Dict[str, str]]:
-        """Extract semantic ID with both type and value from submodel descriptor."""
-        semantic_id = submodel_descriptor.get("semanticId", {})
-        if isinstance(semantic_id, dict):
-            keys = semantic_id.get("keys", [])
-            if keys and isinstance(keys, list) and len(keys) > 0:
-                first_key = keys[0]
-                if isinstance(first_key, dict):
-                    return {
-                        "type": first_key.get("type"),
-                        "value": first_key.get("value")
-                    }
+            if keys and isinstance(keys, list) and isinstance(keys[0], dict):
+                return keys[0].get("value")
         return None
     
-    def _extract_all_semantic_ids(self, submodel_descriptor: Dict) -> List[Dict[str, str]]:
-        """Extract all semantic IDs with both type and value from submodel descriptor."""
+    def _has_semantic_ids(self, submodel_descriptor: Dict, target_set: frozenset) -> bool:
+        """Check if all (type, value) pairs of target_set are keys of the submodel semantic ID."""
         semantic_id = submodel_descriptor.get("semanticId", {})
-        semantic_ids = []
-        
-        if isinstance(semantic_id, dict):
-            keys = semantic_id.get("keys", [])
-            if keys and isinstance(keys, list):
-                for key in keys:
-                    if isinstance(key, dict) and key.get("type") and key.get("value"):
-                        semantic_ids.append({
-                            "type": key.get("type"),
-                            "value": key.get("value")
-                        })
-        return semantic_ids
-    
-    def _semantic_ids_match(self, submodel_semantic_ids: List[Dict[str, str]], target_semantic_ids: List[Dict[str, str]]) -> bool:
-        """Check if all target semantic IDs are present in the submodel semantic IDs."""
-        if not target_semantic_ids:
+        if not isinstance(semantic_id, dict):
             return False
-        
-        # Convert to sets of tuples for easier comparison
-        submodel_set = {(sid["type"], sid["value"]) for sid in submodel_semantic_ids}
-        target_set = {(sid["type"], sid["value"]) for sid in target_semantic_ids}
-        
-        # All target semantic IDs must be present in the submodel
-        return target_set.issubset(submodel_set)
+        keys = semantic_id.get("keys", [])
+        # A submodel with fewer keys than searched IDs can never match
+        if not isinstance(keys, list) or len(keys) < len(target_set):
+            return False
+        try:
+            return target_set.issubset(map(_semantic_key_pair, keys))
+        except (KeyError, TypeError):
+            # Malformed keys: skip the ones without a type or value instead of failing
+            return target_set.issubset(
+                (key.get("type"), key.get("value")) for key in keys if isinstance(key, dict)
+            )
         
     def _extract_submodel_endpoint_info(self, submodel: Dict) -> tuple:
         """Extract asset_id, connector_url, and href from submodel descriptor."""
@@ -1571,23 +2157,25 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         href = "unknown"
         
         try:
-            endpoints = submodel.get("endpoints", [])
-            for endpoint in endpoints:
-                interface = endpoint.get("interface", "")
-                if "SUBMODEL-3.0" in interface:
-                    # Extract href
-                    href = endpoint.get("protocolInformation", {}).get("href", "unknown")
-                    if href and isinstance(href, str):
-                        href = href.replace("urn:uuid:", "")
-                    
-                    # Extract asset_id and connector_url from subprotocolBody
-                    subprotocol_body = endpoint.get("protocolInformation", {}).get("subprotocolBody", "")
-                    if subprotocol_body:
-                        parsed_body = self._parse_subprotocol_body(subprotocol_body)
-                        if parsed_body:
-                            asset_id = parsed_body.get("id", "unknown")
-                            connector_url = parsed_body.get("dspEndpoint", "unknown")
-                    break
+            endpoint = next(
+                (e for e in submodel.get("endpoints", []) if "SUBMODEL-3.0" in e.get("interface", "")),
+                None
+            )
+            if endpoint is not None:
+                protocol_information = endpoint.get("protocolInformation", {})
+                
+                # Extract href
+                href = protocol_information.get("href", "unknown")
+                if href and isinstance(href, str):
+                    href = href.replace("urn:uuid:", "")
+                
+                # Extract asset_id and connector_url from subprotocolBody
+                subprotocol_body = protocol_information.get("subprotocolBody", "")
+                if subprotocol_body:
+                    parsed_body = self._parse_subprotocol_body(subprotocol_body)
+                    if parsed_body:
+                        asset_id = parsed_body.get("id", "unknown")
+                        connector_url = parsed_body.get("dspEndpoint", "unknown")
                     
         except Exception as e:
             if self.logger and self.verbose:
@@ -1601,9 +2189,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             semantic_id_obj = submodel.get("semanticId", {})
             if semantic_id_obj:
                 # Convert semantic ID object to JSON string then encode to base64
-                semantic_id_json = json.dumps(semantic_id_obj, sort_keys=True)
-                semantic_id_bytes = semantic_id_json.encode('utf-8')
-                return base64.b64encode(semantic_id_bytes).decode('utf-8')
+                return _encode_semantic_id(_sorted_json_encoder.encode(semantic_id_obj))
             return ""
         except Exception as e:
             if self.logger and self.verbose:
@@ -1613,13 +2199,7 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     def _parse_subprotocol_body(self, subprotocol_body: str) -> Optional[Dict[str, str]]:
         """Parse subprotocol body to extract asset ID and DSP endpoint."""
         try:
-            parts = subprotocol_body.split(";")
-            result = {}
-            for part in parts:
-                if "=" in part:
-                    key, value = part.split("=", 1)
-                    result[key] = value
-            return result
+            return dict(_SUBPROTOCOL_PAIR_RE.findall(subprotocol_body))
         except Exception:
             return None
 
@@ -1628,13 +2208,25 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
     # ------------------------------------------------------------------
 
     def _purge_edr_from_db(self, counter_party_id: str, asset_id: str) -> int:
-        """Delete stale EDR rows from the persistent edr_connections table.
+        """Delete stale EDR rows of a single asset from the persistent edr_connections table.
 
         This is the low-level, DB-only primitive.  It is intentionally private
         so that callers go through ``purge_edr`` (the public API) unless they
         already handle the in-memory side themselves (as ``_delete_connection``
         and ``_purge_asset_cache`` do).
 
+        Args:
+            counter_party_id: BPNL or full DID of the data provider.
+            asset_id: EDC asset ID whose EDR rows should be deleted.
+
+        Returns:
+            int: Number of rows deleted (0 if no DB engine available or not found).
+        """
+        return self._purge_edrs_from_db(counter_party_id, [asset_id])
+
+    def _purge_edrs_from_db(self, counter_party_id: str, asset_ids: List[str]) -> int:
+        """Delete the stale EDR rows of several assets with a single DELETE.
+
         .. note::
             The ``counter_party_id`` column stores the full DID of the provider
             (e.g. ``did:web:...staticdata:did:BPNL00000003CRHK``), not the raw
@@ -1644,13 +2236,13 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
 
         Args:
             counter_party_id: BPNL or full DID of the data provider.
-            asset_id: EDC asset ID whose EDR rows should be deleted.
+            asset_ids: EDC asset IDs whose EDR rows should be deleted.
 
         Returns:
             int: Number of rows deleted (0 if no DB engine available or not found).
         """
         manager = self.connector_consumer_manager.connector_service.connection_manager
-        if not hasattr(manager, "engine"):
+        if not asset_ids or not hasattr(manager, "engine"):
             return 0  # In-memory-only SDK — nothing persistent to clean up
 
         try:
@@ -1660,29 +2252,29 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                     sa_text(
                         "DELETE FROM edr_connections "
                         "WHERE counter_party_id LIKE '%' || :cpid "
-                        "AND edr_data->>'assetId' = :asset_id"
+                        "AND edr_data->>'assetId' = ANY(:asset_ids)"
                     ),
-                    {"cpid": counter_party_id, "asset_id": asset_id},
+                    {"cpid": counter_party_id, "asset_ids": list(asset_ids)},
                 )
                 db_session.commit()
                 rowcount = result.rowcount
                 if self.logger:
                     if rowcount > 0:
                         self.logger.info(
-                            f"[DTR Manager] [{counter_party_id}] Removed {rowcount} stale EDR(s) "
-                            f"from DB for asset [{asset_id}]"
+                            "[DTR Manager] [%s] Removed %s stale EDR(s) from DB for asset(s) %s",
+                            counter_party_id, rowcount, asset_ids
                         )
                     else:
                         self.logger.debug(
-                            f"[DTR Manager] [{counter_party_id}] No stale EDR found in DB "
-                            f"for asset [{asset_id}] (already clean)"
+                            "[DTR Manager] [%s] No stale EDR found in DB "
+                            "for asset(s) %s (already clean)", counter_party_id, asset_ids
                         )
                 return rowcount
         except Exception as db_exc:
             if self.logger:
                 self.logger.warning(
-                    f"[DTR Manager] [{counter_party_id}] Could not remove stale EDR from DB "
-                    f"for asset [{asset_id}]: {db_exc}"
+                    "[DTR Manager] [%s] Could not remove stale EDR from DB for asset(s) %s: %s",
+                    counter_party_id, asset_ids, db_exc
                 )
             return 0
 
@@ -1719,6 +2311,40 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             )
 
         # Step 1 — Evict from SDK in-memory caches (best-effort; no checksums needed)
+        self._evict_edrs_from_memory(counter_party_id, {asset_id})
+        self._forget_failed_negotiations(counter_party_id, asset_id)
+
+        # Step 2 — Persist the deletion to the DB
+        return self._purge_edr_from_db(counter_party_id, asset_id)
+
+    def _purge_edrs(self, counter_party_id: str, asset_ids: Set[str]) -> int:
+        """Remove the EDRs of several assets from the in-memory caches and the DB at once.
+
+        Same as calling ``purge_edr`` for every asset, but with a single scan of
+        each SDK cache and a single DB transaction.
+
+        Args:
+            counter_party_id: Business Partner Number of the data provider.
+            asset_ids: EDC asset IDs whose EDRs should be evicted.
+
+        Returns:
+            int: Number of DB rows deleted (0 if not found or no DB backend).
+        """
+        if not asset_ids:
+            return 0
+        self._evict_edrs_from_memory(counter_party_id, asset_ids)
+        return self._purge_edrs_from_db(counter_party_id, sorted(asset_ids))
+
+    def _evict_edrs_from_memory(self, counter_party_id: str, asset_ids: Set[str]) -> int:
+        """Best-effort removal of the EDRs of the given assets from the SDK in-memory caches.
+        
+        The SDK caches are not indexed by asset, so each one is scanned once for the
+        whole set of assets; batches purge together instead of scanning per asset.
+        
+        Returns:
+            int: Number of cache entries removed
+        """
+        removed = 0
         manager = self.connector_consumer_manager.connector_service.connection_manager
         for cache_attr in ("_edr_tracked", "_connection_cache"):
             if not hasattr(manager, cache_attr):
@@ -1728,24 +2354,22 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 keys_to_remove = [
                     k for k, v in cache.items()
                     if isinstance(v, dict)
-                    and (v.get("edr_data") or v).get("assetId") == asset_id
+                    and (v.get("edr_data") or v).get("assetId") in asset_ids
                 ]
                 for key in keys_to_remove:
                     del cache[key]
+                    removed += 1
                     if self.logger:
                         self.logger.info(
-                            f"[DTR Manager] [{counter_party_id}] Evicted EDR from "
-                            f"{cache_attr} for asset [{asset_id}] (key: {key})"
+                            "[DTR Manager] [%s] Evicted EDR from %s (key: %s)", counter_party_id, cache_attr, key
                         )
             except Exception as mem_exc:
                 if self.logger:
                     self.logger.warning(
-                        f"[DTR Manager] [{counter_party_id}] Could not evict from "
-                        f"{cache_attr} for asset [{asset_id}]: {mem_exc}"
+                        "[DTR Manager] [%s] Could not evict from %s for asset(s) %s: %s",
+                        counter_party_id, cache_attr, asset_ids, mem_exc
                     )
-
-        # Step 2 — Persist the deletion to the DB
-        return self._purge_edr_from_db(counter_party_id, asset_id)
+        return removed
 
     def purge_edrs_matching(self, counter_party_id: str, asset_id_pattern: str) -> int:
         """Remove all stale EDRs whose asset ID matches a SQL LIKE pattern.
@@ -1826,8 +2450,8 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                         )
                     else:
                         self.logger.debug(
-                            f"[DTR Manager] [{counter_party_id}] No stale EDRs found in DB "
-                            f"matching pattern [{asset_id_pattern}] (already clean)"
+                            "[DTR Manager] [%s] No stale EDRs found in DB "
+                            "matching pattern [%s] (already clean)", counter_party_id, asset_id_pattern
                         )
                 return rowcount
         except Exception as db_exc:
@@ -1839,7 +2463,77 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             return 0
 
     def _negotiate_asset(self, counter_party_id: str, asset_id: str, dsp_endpoint_url: str, policies: List[Dict]) -> Optional[str]:
-        """Negotiate access to a single asset and return the access token."""
+        """
+        Negotiate access to a single asset and return the access token.
+        
+        Concurrent calls for the same asset and policies wait for the negotiation
+        already in progress and share its token (or its error) instead of starting
+        their own. A refused negotiation is answered with the same outcome for
+        FAILED_NEGOTIATION_TTL seconds, or until the EDRs of the asset are purged.
+        """
+        # Only used within the manager, so a faster digest than the SDK's SHA3 connection checksum will do
+        policies_digest = hashlib.blake2b(str(policies).encode('utf-8'), digest_size=16).hexdigest()
+        key = (counter_party_id, dsp_endpoint_url, asset_id, policies_digest)
+        with self._negotiations_lock:
+            failure = self._failed_negotiations.get(key)
+            if failure is not None:
+                expires_at, error = failure
+                if expires_at > time.monotonic():
+                    if error is not None:
+                        raise self._rebuild_negotiation_error(*error)
+                    return None
+                del self._failed_negotiations[key]
+            future = self._inflight_negotiations.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight_negotiations[key] = future
+        if not owner:
+            return future.result()
+        
+        try:
+            access_token = self._do_negotiate_asset(counter_party_id, asset_id, dsp_endpoint_url, policies)
+        except BaseException as e:
+            if isinstance(e, Exception) and not isinstance(e, RECOVERABLE_DTR_ERRORS):
+                self._remember_failed_negotiation(key, e)
+            future.set_exception(e)
+            raise
+        else:
+            if not access_token:
+                self._remember_failed_negotiation(key, None)
+            future.set_result(access_token)
+            return access_token
+        finally:
+            with self._negotiations_lock:
+                self._inflight_negotiations.pop(key, None)
+
+    def _remember_failed_negotiation(self, key: Tuple[str, str, str, str], error: Optional[Exception]) -> None:
+        """Answer further negotiations of key with the same refusal until FAILED_NEGOTIATION_TTL has passed."""
+        now = time.monotonic()
+        with self._negotiations_lock:
+            # Refusals are rare next to a DSP round trip, so expired entries are simply swept here
+            for expired in [k for k, (expires_at, _) in self._failed_negotiations.items() if expires_at <= now]:
+                del self._failed_negotiations[expired]
+            # Keep only the type and message: re-raising the stored exception would grow its
+            # traceback on every hit and keep the frames of the original negotiation alive
+            self._failed_negotiations[key] = (now + FAILED_NEGOTIATION_TTL, None if error is None else (type(error), str(error)))
+
+    @staticmethod
+    def _rebuild_negotiation_error(error_type: type, message: str) -> Exception:
+        """Create a fresh exception for a remembered refusal, falling back to RuntimeError for types that need other arguments."""
+        try:
+            return error_type(message)
+        except Exception:
+            return RuntimeError(message)
+
+    def _forget_failed_negotiations(self, counter_party_id: str, asset_id: str) -> None:
+        """Drop the remembered refusals of an asset, so its next negotiation goes to the connector again."""
+        with self._negotiations_lock:
+            for key in [key for key in self._failed_negotiations if key[0] == counter_party_id and key[2] == asset_id]:
+                del self._failed_negotiations[key]
+
+    def _do_negotiate_asset(self, counter_party_id: str, asset_id: str, dsp_endpoint_url: str, policies: List[Dict]) -> Optional[str]:
+        """Run the DSP negotiation of a single asset and return the access token."""
         connector_service: BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
         filter_expression = connector_service.get_filter_expression(
             key="https://w3id.org/edc/v0.0.1/ns/id", value=asset_id
@@ -1858,8 +2552,8 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             self.logger.info(f"[DTR Manager] [{counter_party_id}] PURGE: Starting purge for asset [{asset_id}]")
         
         connector_service: BaseConnectorConsumerService = self.connector_consumer_manager.connector_service
-        policies_checksum = hashlib.sha3_256(str(policies).encode('utf-8')).hexdigest()
-        filter_checksum = hashlib.sha3_256(str(connector_service.get_filter_expression(key="https://w3id.org/edc/v0.0.1/ns/id", value=asset_id)).encode('utf-8')).hexdigest()
+        policies_checksum = self._connection_checksum(policies)
+        filter_checksum = self._connection_checksum(connector_service.get_filter_expression(key="https://w3id.org/edc/v0.0.1/ns/id", value=asset_id))
 
         # Try to delete from memory cache (may fail if checksums don't match)
         deleted_from_memory = connector_service.connection_manager.delete_connection(
@@ -1875,50 +2569,9 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
             else:
                 self.logger.info(f"[DTR Manager] [{counter_party_id}] PURGE: Standard deletion failed (checksum mismatch), trying force-removal for asset [{asset_id}]")
         
-        # If memory deletion failed, try to force-remove from SDK's internal cache
+        # If memory deletion failed, force-remove the asset's EDRs from the SDK's internal caches
         if not deleted_from_memory:
-            try:
-                # Try to access the SDK's _edr_tracked dictionary
-                if hasattr(connector_service.connection_manager, '_edr_tracked'):
-                    edr_tracked = connector_service.connection_manager._edr_tracked
-                    keys_to_remove = []
-                    
-                    # Find keys matching the asset_id
-                    for key, edr_entry in edr_tracked.items():
-                        if isinstance(edr_entry, dict):
-                            edr_data = edr_entry.get('edr_data') or edr_entry
-                            if edr_data.get('assetId') == asset_id:
-                                keys_to_remove.append(key)
-                    
-                    # Remove matched keys
-                    for key in keys_to_remove:
-                        del edr_tracked[key]
-                        deleted_from_memory = True
-                        if self.logger:
-                            self.logger.info(
-                                f"[DTR Manager] [{counter_party_id}] PURGE: Force-removed EDR from SDK _edr_tracked for asset [{asset_id}], key: {key}"
-                            )
-                
-                # Also try _connection_cache if it exists
-                if hasattr(connector_service.connection_manager, '_connection_cache') and not deleted_from_memory:
-                    cache = connector_service.connection_manager._connection_cache
-                    keys_to_remove = []
-                    for key, value in cache.items():
-                        if isinstance(value, dict) and value.get('assetId') == asset_id:
-                            keys_to_remove.append(key)
-                    
-                    for key in keys_to_remove:
-                        del cache[key]
-                        deleted_from_memory = True
-                        if self.logger:
-                            self.logger.info(
-                                f"[DTR Manager] [{counter_party_id}] PURGE: Force-removed EDR from SDK _connection_cache for asset [{asset_id}]"
-                            )
-            except Exception as exc:
-                if self.logger:
-                    self.logger.warning(
-                        f"[DTR Manager] [{counter_party_id}] PURGE: Could not force-remove from memory cache: {exc}"
-                    )
+            deleted_from_memory = self._evict_edrs_from_memory(counter_party_id, {asset_id}) > 0
         
         # Always attempt database deletion, even if memory deletion failed.
         # Delegate to the shared helper so the logic lives in one place.
@@ -1931,6 +2584,10 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 f"(memory: {deleted_from_memory}) for asset [{asset_id}]"
             )
 
+        # A purged EDR may have been the cause of a refusal, negotiate the asset again next time
+        if deleted_from_memory or deleted_from_db:
+            self._forget_failed_negotiations(counter_party_id, asset_id)
+
         # Return True if deleted from either location
         return deleted_from_memory or deleted_from_db
             
@@ -1941,11 +2598,13 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         so callers can distinguish dataplane configuration errors from empty responses.
         """
         try:
-            headers = {"Authorization": f"{access_token}"}
-            response = HttpTools.do_get(href, headers=headers)
+            headers = {"Authorization": access_token}
+            response = HttpTools.do_get_with_session(
+                href, session=self._session, headers=headers, timeout=DATAPLANE_REQUEST_TIMEOUT
+            )
             
             if response.status_code == 200:
-                return response.json()
+                return _response_json(response)
             else:
                 # Try to extract a meaningful body snippet for the error
                 try:
@@ -1969,6 +2628,30 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
                 self.logger.error(f"[DTR Manager] Error fetching submodel {submodel_id}: {e}")
             raise RuntimeError(f"Network or connection error while fetching submodel [{submodel_id}] from [{href}]: {e}") from e
 
+    def _iter_dtr_datasets(self, bpn: str, connector_url: str, catalog: Dict) -> Iterator[Tuple[str, List]]:
+        """
+        Stream the DTR assets of a catalog, skipping every other dataset.
+        
+        Args:
+            bpn (str): The Business Partner Number the catalog belongs to
+            connector_url (str): URL of the connector that returned the catalog
+            catalog (Dict): The catalog, in Jupiter ("dcat:dataset") or Saturn ("dataset") format
+            
+        Yields:
+            Tuple[str, List]: (asset_id, policies) of each DTR asset
+        """
+        for dataset in self._get_catalog_datasets(catalog):
+            if not self._is_dtr_asset(dataset):
+                continue
+            
+            asset_id = dataset.get(self.ID_KEY, "")
+            if not asset_id:
+                continue
+            
+            if(self.logger and self.verbose):
+                self.logger.info(f"[DTR Manager] [{bpn}] Found DTR asset [{asset_id}] in connector [{connector_url}] added to cache")
+            yield asset_id, self._extract_policies(dataset)
+
     def _is_dtr_asset(self, dataset: Dict) -> bool:
         """
         Check if a dataset from a catalog is a DTR asset.
@@ -1979,33 +2662,20 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             bool: True if this is a DTR asset, False otherwise
         """
-        # Look for DTR-specific properties in the dataset
-        # This can be customized based on your DTR asset identification logic
-        dct_type_property = dataset.get(self.dct_type_id, {})
-        
-        # Remove .'@id' from dct_type_key if it exists to get the base property name
-        dct_type_key_base = self.dct_type_key.replace(f".'{self.ID_KEY}'", "") if f".'{self.ID_KEY}'" in self.dct_type_key else self.dct_type_key
-        dct_type_expanded_property = dataset.get(dct_type_key_base, {})
-    
         # Format 1: "dct:type": {"@id": "https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"}
-        if isinstance(dct_type_property, dict):
-            type_id = dct_type_property.get(self.ID_KEY, "")
-            if type_id == self.dct_type:
-                return True
-        elif isinstance(dct_type_property, str):
-            if dct_type_property == self.dct_type:
-                return True
-            
         # Format 2: "http://purl.org/dc/terms/type": {"@id": "https://w3id.org/catenax/taxonomy#DigitalTwinRegistry"}
-        if isinstance(dct_type_expanded_property, dict):
-            type_id = dct_type_expanded_property.get(self.ID_KEY, "")
-            if type_id == self.dct_type:
-                return True
-        elif isinstance(dct_type_expanded_property, str):
-            if dct_type_expanded_property == self.dct_type:
-                return True
-        
-        return False
+        # Either may also hold the type as a plain string
+        dct_type_property = dataset.get(self.dct_type_id)
+        dct_type_expanded_property = dataset.get(self._dct_type_key_base)
+        return self.dct_type in (
+            dct_type_property.get(self.ID_KEY) if isinstance(dct_type_property, dict) else dct_type_property,
+            dct_type_expanded_property.get(self.ID_KEY) if isinstance(dct_type_expanded_property, dict) else dct_type_expanded_property,
+        )
+
+    @cached_property
+    def _dct_type_key_base(self) -> str:
+        """Property name of dct_type_key without its .'@id' suffix, as used in expanded catalogs."""
+        return self.dct_type_key.replace(f".'{self.ID_KEY}'", "")
 
     def _extract_policies(self, dataset: Dict) -> List[Union[str, Dict[str, Any]]]:
         """
@@ -2017,17 +2687,18 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             List[Union[str, Dict[str, Any]]]: List of clean policy identifiers without @id and @type
         """
-        policies = []
-        
         # Extract policies — supports both Jupiter ("odrl:hasPolicy") and
         # Saturn ("hasPolicy") key formats via the base-class helper.
         has_policy = self._get_dataset_policies(dataset)
+        if not has_policy:
+            return []
 
+        policies = []
         # Clean policies by removing @id and @type metadata
         for policy in has_policy:
             if isinstance(policy, dict):
-                # Create a clean copy without @id and @type
-                clean_policy = {k: v for k, v in policy.items() if k not in ["@id", "@type"]}
+                # Create a clean copy without @id and @type, the catalog itself is left untouched
+                clean_policy = {k: v for k, v in policy.items() if k not in POLICY_METADATA_KEYS}
                 if clean_policy:  # Only add if there's actual content after cleaning
                     policies.append(clean_policy)
             elif isinstance(policy, str):
@@ -2049,13 +2720,10 @@ class DtrConsumerMemoryManager(BaseDtrConsumerManager):
         Returns:
             bool: True if cache is expired or doesn't exist, False otherwise
         """
-        # If BPN is not in cache, consider it expired
-        if bpn not in self.known_dtrs:
-            return True
-        
-        # If no refresh interval is set, consider it expired
-        if self.REFRESH_INTERVAL_KEY not in self.known_dtrs[bpn]:
+        # If BPN is not in cache (no refresh deadline set), consider it expired
+        refresh_deadline = self._refresh_deadlines.get(bpn)
+        if refresh_deadline is None:
             return True
         
-        # Check if the refresh interval has been reached
-        return op.is_interval_reached(self.known_dtrs[bpn][self.REFRESH_INTERVAL_KEY])
+        # Check if the refresh deadline has been reached
+        return time.monotonic() >= refresh_deadline
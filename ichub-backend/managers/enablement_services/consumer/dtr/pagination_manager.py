@@ -27,13 +27,13 @@ import base64
 from typing import Dict, Optional
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class DtrPaginationState:
     asset_id: str
     cursor: Optional[str] = None
     exhausted: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class PageState:
     dtr_states: Dict[str, DtrPaginationState]
     page_number: int = 0
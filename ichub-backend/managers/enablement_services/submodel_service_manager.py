@@ -22,8 +22,9 @@
 #################################################################################
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Callable, Dict, Any
 from uuid import UUID
 from hashlib import sha256
 from enum import Enum
@@ -38,6 +39,16 @@ from tractusx_sdk.industry.adapters.submodel_adapters.file_system_adapter import
 from managers.enablement_services.adapters.http_submodel_adapter import HttpSubmodelAdapter
 
 
+@lru_cache(maxsize=1024)
+def _semantic_id_directory(semantic_id: str) -> str:
+    """SHA256 hex digest of a semantic ID, the name of its directory in the filesystem storage.
+    
+    Only a handful of semantic IDs are in use, so the digest is computed once per ID.
+    The digest only names a directory, it is not used for security.
+    """
+    return sha256(semantic_id.encode(), usedforsecurity=False).hexdigest()
+
+
 class OperationType(Enum):
     """Enumeration of supported submodel operations."""
     READ = "read"
@@ -79,6 +90,9 @@ class SubmodelServiceManager:
         else:
             raise ValueError(f"Unsupported adapter mode: {self.adapter_mode}")
         
+        # Resolve the handler of every operation once, instead of branching on each call
+        self._operations = self._build_operation_table()
+        
         self.logger.info(f"SubmodelServiceManager initialized with mode: {self.adapter_mode}")
     
     def _initialize_filesystem_adapter(self) -> FileSystemAdapter:
@@ -200,6 +214,11 @@ class SubmodelServiceManager:
             verify_ssl=verify_ssl
         )
 
+    def close(self) -> None:
+        """Release the resources held by the adapter (e.g. the HTTP client of the HTTP adapter)."""
+        if isinstance(self.adapter, HttpSubmodelAdapter):
+            self.adapter.close()
+
     def _validate_uuid(self, value: Any) -> UUID:
         """Validate and convert value to UUID.
         
@@ -228,11 +247,37 @@ class SubmodelServiceManager:
         
         Returns:
             Tuple of (directory_hash, file_path).
+        
+        Note:
+            The SHA256 digest is the persisted directory layout of the filesystem
+            storage, so it must not be swapped for a cheaper hash without migrating
+            existing submodels. The HTTP adapter never reaches this method, it
+            addresses submodels by their original semantic ID.
         """
-        sha256_semantic_id = sha256(semantic_id.encode()).hexdigest()
+        sha256_semantic_id = _semantic_id_directory(semantic_id)
         file_path = f"{sha256_semantic_id}/{submodel_id}.json"
         return sha256_semantic_id, file_path
 
+    def _build_operation_table(self) -> Dict[OperationType, Callable[[UUID, str, Dict[str, Any] | None], Dict[str, Any] | None]]:
+        """Map every operation type to its handler for the configured adapter.
+        
+        Returns:
+            Dictionary of handlers taking (submodel_id, semantic_id, payload).
+        """
+        # Use HTTP adapter with semantic IDs
+        if self.adapter_mode == "http" and isinstance(self.adapter, HttpSubmodelAdapter):
+            return {
+                OperationType.READ: self._http_read,
+                OperationType.WRITE: self._http_write,
+                OperationType.DELETE: self._http_delete,
+            }
+        # Filesystem adapter with hashed paths
+        return {
+            OperationType.READ: self._filesystem_read,
+            OperationType.WRITE: self._filesystem_write,
+            OperationType.DELETE: self._filesystem_delete,
+        }
+
     def _execute_submodel_operation(
         self,
         operation: OperationType,
@@ -242,8 +287,8 @@ class SubmodelServiceManager:
     ) -> Dict[str, Any] | None:
         """Execute a submodel operation (read, write, delete) in a generalized manner.
         
-        This method handles the branching logic between HTTP and filesystem adapters,
-        reducing code duplication across read/write/delete operations.
+        The operation is dispatched to the handler of the adapter selected at
+        initialization, so read/write/delete share the validation and logging.
         
         Args:
             operation: Type of operation to perform.
@@ -263,46 +308,63 @@ class SubmodelServiceManager:
         # Log operation
         self.logger.info(f"{operation.value.capitalize()}ing submodel with id=[{submodel_id}], semanticId=[{semantic_id}]")
         
-        # Use HTTP adapter with semantic IDs
-        if self.adapter_mode == "http" and isinstance(self.adapter, HttpSubmodelAdapter):
-            if operation == OperationType.READ:
-                return self.adapter.read_submodel(semantic_id, submodel_id)
-            elif operation == OperationType.WRITE:
-                self.adapter.write_submodel(semantic_id, submodel_id, payload)
-                self.logger.info(f"Submodel uploaded successfully to external service.")
-                return None
-            elif operation == OperationType.DELETE:
-                self.adapter.delete_submodel(semantic_id, submodel_id)
-                self.logger.info("Submodel deleted successfully from external service.")
-                return None
-        
-        # Filesystem adapter with hashed paths
+        return self._operations[operation](submodel_id, semantic_id, payload)
+
+    def _http_read(self, submodel_id: UUID, semantic_id: str, payload: Dict[str, Any] | None) -> Dict[str, Any]:
+        """Read a submodel from the external service."""
+        return self.adapter.read_submodel(semantic_id, submodel_id)
+
+    def _http_write(self, submodel_id: UUID, semantic_id: str, payload: Dict[str, Any] | None) -> None:
+        """Upload a submodel to the external service."""
+        self.adapter.write_submodel(semantic_id, submodel_id, payload)
+        self.logger.info(f"Submodel uploaded successfully to external service.")
+
+    def _http_delete(self, submodel_id: UUID, semantic_id: str, payload: Dict[str, Any] | None) -> None:
+        """Delete a submodel from the external service."""
+        self.adapter.delete_submodel(semantic_id, submodel_id)
+        self.logger.info("Submodel deleted successfully from external service.")
+
+    def _resolve_filesystem_path(self, semantic_id: str, submodel_id: UUID) -> tuple[str, str]:
+        """Get the filesystem path components of a submodel, registering its semantic ID with an HTTP adapter."""
         sha256_id, file_path = self._get_filesystem_path(semantic_id, submodel_id)
         
         # Cache semantic_id if using HTTP adapter
         if isinstance(self.adapter, HttpSubmodelAdapter):
             self.adapter.cache_semantic_id(sha256_id, semantic_id)
-        
-        if operation == OperationType.READ:
-            if not self.adapter.exists(file_path):
-                self.logger.error(f"Submodel file not found: {file_path}")
-                raise NotFoundError(f"Submodel file not found: {file_path}")
+        return sha256_id, file_path
+
+    def _filesystem_read(self, submodel_id: UUID, semantic_id: str, payload: Dict[str, Any] | None) -> Dict[str, Any]:
+        """Read a submodel from its hashed path."""
+        _, file_path = self._resolve_filesystem_path(semantic_id, submodel_id)
+        # Read straight away instead of checking for the file first
+        try:
             return self.adapter.read(file_path)
-        
-        elif operation == OperationType.WRITE:
-            if not self.adapter.exists(sha256_id):
+        except FileNotFoundError as e:
+            self.logger.error(f"Submodel file not found: {file_path}")
+            raise NotFoundError(f"Submodel file not found: {file_path}") from e
+
+    def _filesystem_write(self, submodel_id: UUID, semantic_id: str, payload: Dict[str, Any] | None) -> None:
+        """Write a submodel to its hashed path, creating the semantic ID directory if needed."""
+        sha256_id, file_path = self._resolve_filesystem_path(semantic_id, submodel_id)
+        # The directory almost always exists already, so only create it when the write says it is missing
+        try:
+            self.adapter.write(file_path, payload)
+        except FileNotFoundError:
+            try:
                 self.adapter.create_directory(sha256_id)
+            except FileExistsError:
+                pass  # Created by a concurrent write of the same semantic ID
             self.adapter.write(file_path, payload)
-            self.logger.info("Submodel uploaded successfully.")
-            return None
-        
-        elif operation == OperationType.DELETE:
-            if not self.adapter.exists(file_path):
-                self.logger.error(f"Submodel file not found: {file_path}")
-                raise NotFoundError(f"Submodel file not found: {file_path}")
-            self.adapter.delete(file_path)
-            self.logger.info("Submodel deleted successfully.")
-            return None
+        self.logger.info("Submodel uploaded successfully.")
+
+    def _filesystem_delete(self, submodel_id: UUID, semantic_id: str, payload: Dict[str, Any] | None) -> None:
+        """Delete a submodel from its hashed path."""
+        _, file_path = self._resolve_filesystem_path(semantic_id, submodel_id)
+        if not self.adapter.exists(file_path):
+            self.logger.error(f"Submodel file not found: {file_path}")
+            raise NotFoundError(f"Submodel file not found: {file_path}")
+        self.adapter.delete(file_path)
+        self.logger.info("Submodel deleted successfully.")
 
     def upload_twin_aspect_document(
         self,
@@ -21,7 +21,7 @@
 #################################################################################
 
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DiscoverDppRequest(BaseModel):
@@ -43,8 +43,7 @@ class DiscoverDppRequest(BaseModel):
         description="Governance policies for submodel consumption (passport data access)"
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class DiscoveryStatus(BaseModel):
@@ -62,8 +61,7 @@ class DiscoveryStatus(BaseModel):
         description="Progress percentage (0-100)"
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class DiscoverDppResponse(BaseModel):
@@ -85,5 +83,4 @@ class DiscoverDppResponse(BaseModel):
         description="The consumed DPP data"
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
@@ -21,7 +21,7 @@
 #################################################################################
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TwinAssociation(BaseModel):
@@ -33,8 +33,7 @@ class TwinAssociation(BaseModel):
     twin_name: Optional[str] = Field(alias="twinName", default=None)
     asset_id: Optional[str] = Field(alias="assetId", default=None)
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class DigitalProductPassport(BaseModel):
@@ -55,5 +54,4 @@ class DigitalProductPassport(BaseModel):
     created_at: str = Field(alias="createdAt")
     updated_at: str = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
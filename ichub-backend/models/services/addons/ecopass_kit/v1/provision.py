@@ -20,7 +20,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ShareDppRequest(BaseModel):
@@ -34,8 +34,7 @@ class ShareDppRequest(BaseModel):
         description="The BPNL of the business partner to share the DPP with"
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ShareDppResponse(BaseModel):
@@ -50,5 +49,4 @@ class ShareDppResponse(BaseModel):
         description="Whether the manufacturer part ID was successfully registered in BPN Discovery"
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
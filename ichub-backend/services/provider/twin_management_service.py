@@ -23,6 +23,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #################################################################################
 
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
@@ -991,7 +992,18 @@ class TwinManagementService:
 
 def _create_submodel_service_manager(connection_settings: Optional[Dict[str, Any]]) -> SubmodelServiceManager:
     """
-    Create a new instance of the SubmodelServiceManager class.
+    Get the SubmodelServiceManager for the given connection settings.
     """
     # TODO: later we can configure the manager via the connection settings from the DB here
+    return _get_default_submodel_service_manager()
+
+
+@lru_cache(maxsize=1)
+def _get_default_submodel_service_manager() -> SubmodelServiceManager:
+    """
+    Create the SubmodelServiceManager configured from the application settings.
+
+    The manager is built once and shared, so uploads do not repeat the config
+    lookups, env var substitution, directory checks and HTTP client setup.
+    """
     return SubmodelServiceManager()
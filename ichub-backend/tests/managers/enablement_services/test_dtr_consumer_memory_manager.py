@@ -0,0 +1,732 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import hashlib
+import logging
+import threading
+import time
+import traceback
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager import DtrConsumerMemoryManager, SubmodelFetch
+from tools.log_capture import run_with_policy_log_capture
+
+BPN = "BPNL00000003AYRE"
+CONNECTOR_URL = "https://connector.example.com/api/v1/dsp"
+
+
+class TestDtrConsumerMemoryManager(unittest.TestCase):
+    """Tests for the in-memory DTR consumer manager."""
+
+    def setUp(self):
+        self.manager = DtrConsumerMemoryManager(
+            connector_consumer_manager=MagicMock(),
+            logger=logging.getLogger(__name__),
+            verbose=True
+        )
+
+    def tearDown(self):
+        self.manager.close()
+
+    def test_add_and_get_dtr(self):
+        policies = [{"odrl:permission": []}]
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", policies)
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", [])
+
+        self.assertTrue(self.manager.is_dtr_known(BPN, "dtr-1"))
+        self.assertFalse(self.manager.is_dtr_known(BPN, "dtr-2"))
+        self.assertEqual(self.manager.get_dtr_count(BPN), 1)
+        self.assertEqual(
+            self.manager.get_dtr_by_asset_id(BPN, "dtr-1"),
+            {"connector_url": CONNECTOR_URL, "asset_id": "dtr-1", "policies": policies}
+        )
+        self.assertIsNone(self.manager.get_dtr_by_asset_id("BPNL-UNKNOWN", "dtr-1"))
+
+    def test_returned_dtrs_do_not_alias_the_cache(self):
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", ["policy"])
+
+        self.manager.get_dtr_by_asset_id(BPN, "dtr-1")["connector_url"] = "changed"
+        self.manager.get_dtrs(BPN)[0]["asset_id"] = "changed"
+        self.manager.get_known_dtrs()[BPN]["dtr_data"]["dtr-1"]["policies"] = []
+
+        self.assertEqual(
+            self.manager.get_dtr_by_asset_id(BPN, "dtr-1"),
+            {"connector_url": CONNECTOR_URL, "asset_id": "dtr-1", "policies": ["policy"]}
+        )
+
+    def test_get_dtrs_served_from_cache(self):
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", [])
+        self.manager.add_dtr(BPN, "https://other.example.com", "dtr-2", [])
+
+        self.assertEqual([dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)], ["dtr-1", "dtr-2"])
+        self.manager.connector_consumer_manager.get_connectors.assert_not_called()
+        self.assertEqual([dtr["asset_id"] for dtr in self.manager.get_dtrs_by_connector(BPN, CONNECTOR_URL)], ["dtr-1"])
+        self.assertCountEqual(self.manager.get_all_connector_urls(BPN), [CONNECTOR_URL, "https://other.example.com"])
+        self.assertEqual(self.manager.get_all_asset_ids(BPN), ["dtr-1", "dtr-2"])
+
+    def test_cache_expiry_ignores_wall_clock_changes(self):
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", [])
+
+        module = "managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager"
+        with patch(f"{module}.time.time", return_value=0):
+            self.assertFalse(self.manager._is_cache_expired(BPN))
+
+        self.manager._refresh_deadlines[BPN] -= self.manager.expiration_time * 60 + 1
+        self.assertTrue(self.manager._is_cache_expired(BPN))
+
+    def test_expired_dtrs_are_served_while_refreshed_in_background(self):
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", [])
+        self.manager._refresh_deadlines[BPN] -= self.manager.expiration_time * 60 + 1
+        release = threading.Event()
+        refreshed = threading.Event()
+
+        def discover(bpn, timeout):
+            release.wait(timeout=5)
+            self.manager.add_dtr(bpn, CONNECTOR_URL, "dtr-2", [])
+            refreshed.set()
+            return []
+
+        with patch.object(self.manager, "_discover_dtrs", side_effect=discover) as discover_dtrs:
+            for _ in range(3):
+                self.assertEqual([dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)], ["dtr-1"])
+            release.set()
+            self.assertTrue(refreshed.wait(timeout=5))
+
+        discover_dtrs.assert_called_once_with(BPN, 30)
+        self.assertFalse(self.manager._is_cache_expired(BPN))
+        self.assertEqual([dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)], ["dtr-1", "dtr-2"])
+
+    def test_failed_background_refresh_is_retried_after_an_interval(self):
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", [])
+        self.manager._refresh_deadlines[BPN] -= self.manager.expiration_time * 60 + 1
+        refreshed = threading.Event()
+
+        def discover(bpn, timeout):
+            refreshed.set()
+            return []
+
+        with patch.object(self.manager, "_discover_dtrs", side_effect=discover) as discover_dtrs:
+            self.assertEqual([dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)], ["dtr-1"])
+            self.assertTrue(refreshed.wait(timeout=5))
+            for _ in range(50):
+                if BPN not in self.manager._refreshing_bpns:
+                    break
+                time.sleep(0.01)
+            for _ in range(3):
+                self.assertEqual([dtr["asset_id"] for dtr in self.manager.get_dtrs(BPN)], ["dtr-1"])
+            discover_dtrs.assert_called_once()
+
+            refreshed.clear()
+            # Once the retry interval has passed, the next call refreshes again
+            self.manager._refresh_retry_deadlines[BPN] = 0.0
+            self.manager.get_dtrs(BPN)
+            self.assertTrue(refreshed.wait(timeout=5))
+            self.assertEqual(discover_dtrs.call_count, 2)
+
+    def test_dtrs_are_not_served_past_the_maximum_stale_age(self):
+        module = "managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager"
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", [])
+        self.manager._refresh_deadlines[BPN] -= self.manager.expiration_time * 60 + 120
+
+        with patch(f"{module}.MAX_STALE_DTR_AGE", 60.0), \
+                patch.object(self.manager, "_discover_dtrs", return_value=[]) as discover_dtrs:
+            self.assertEqual(self.manager.get_dtrs(BPN), [])
+
+        discover_dtrs.assert_called_once_with(BPN, 30)
+        self.assertEqual(self.manager.get_all_asset_ids(BPN), [])
+
+    def test_delete_and_purge(self):
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", [])
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-2", [])
+        self.manager.add_dtr("BPNL-OTHER", CONNECTOR_URL, "dtr-3", [])
+
+        known = self.manager.delete_dtr(BPN, "dtr-1")
+        self.assertEqual(list(known[BPN]["dtr_data"]), ["dtr-2"])
+        self.assertEqual(self.manager.get_dtrs_by_connector(BPN, CONNECTOR_URL)[0]["asset_id"], "dtr-2")
+
+        self.manager.purge_bpn(BPN)
+        self.assertEqual(self.manager.get_dtr_count(BPN), 0)
+        self.assertEqual(self.manager.get_all_connector_urls(BPN), [])
+        self.assertTrue(self.manager.is_dtr_known("BPNL-OTHER", "dtr-3"))
+
+        self.manager.purge_cache()
+        self.assertEqual(self.manager.get_known_dtrs(), {})
+
+    def test_connector_index_follows_deletes(self):
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-1", [])
+        self.manager.add_dtr(BPN, CONNECTOR_URL, "dtr-2", [])
+        self.manager.add_dtr(BPN, "https://other.example.com", "dtr-3", [])
+
+        self.manager.delete_dtr(BPN, "dtr-1")
+        self.assertCountEqual(self.manager.get_all_connector_urls(BPN), [CONNECTOR_URL, "https://other.example.com"])
+
+        self.manager.delete_dtr(BPN, "dtr-3")
+        self.assertEqual(self.manager.get_all_connector_urls(BPN), [CONNECTOR_URL])
+        self.assertEqual(self.manager.get_dtrs_by_connector(BPN, "https://other.example.com"), [])
+
+    def test_reads_do_not_fail_during_concurrent_writes(self):
+        self.manager.logger = logging.getLogger("dtr-concurrency-test")
+        self.manager.logger.setLevel(logging.WARNING)
+        self.manager.verbose = False
+        errors = []
+
+        def write():
+            for index in range(2000):
+                self.manager.add_dtr(f"BPNL{index % 20}", CONNECTOR_URL, f"dtr-{index}", [])
+                if index % 3 == 0:
+                    self.manager.delete_dtr(f"BPNL{index % 20}", f"dtr-{index}")
+
+        def read():
+            try:
+                for _ in range(200):
+                    self.manager.get_known_dtrs()
+                    self.manager.get_dtrs_by_connector("BPNL1", CONNECTOR_URL)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.manager.get_dtr_count("BPNL1"), 67)
+
+    def test_writers_for_other_bpns_are_not_blocked(self):
+        with self.manager._lock_for(BPN):
+            writer = threading.Thread(target=self.manager.add_dtr, args=("BPNL-OTHER", CONNECTOR_URL, "dtr-1", []))
+            writer.start()
+            writer.join(timeout=5)
+
+            self.assertFalse(writer.is_alive())
+            self.assertTrue(self.manager.is_dtr_known("BPNL-OTHER", "dtr-1"))
+
+    def test_get_dtrs_discovers_from_catalogs(self):
+        connector_manager = self.manager.connector_consumer_manager
+        connector_manager.get_connectors.return_value = [CONNECTOR_URL]
+        connector_manager.connector_service.get_catalogs_by_dct_type_with_bpnl.return_value = {
+            CONNECTOR_URL: {
+                "dcat:dataset": [
+                    {
+                        "@id": "dtr-1",
+                        "dct:type": {"@id": self.manager.dct_type},
+                        "odrl:hasPolicy": {"@id": "offer-1", "@type": "odrl:Offer", "odrl:permission": []}
+                    },
+                    {"@id": "other-asset", "dct:type": {"@id": "https://w3id.org/catenax/taxonomy#Other"}}
+                ]
+            }
+        }
+
+        dtrs = self.manager.get_dtrs(BPN)
+
+        self.assertEqual(dtrs, [{"connector_url": CONNECTOR_URL, "asset_id": "dtr-1", "policies": [{"odrl:permission": []}]}])
+        self.assertTrue(self.manager.is_dtr_known(BPN, "dtr-1"))
+        self.assertFalse(self.manager.is_dtr_known(BPN, "other-asset"))
+
+    def test_dtr_assets_are_recognized_in_compact_and_expanded_catalogs(self):
+        dtr_type = self.manager.dct_type
+
+        self.assertTrue(self.manager._is_dtr_asset({"dct:type": {"@id": dtr_type}}))
+        self.assertTrue(self.manager._is_dtr_asset({"dct:type": dtr_type}))
+        self.assertTrue(self.manager._is_dtr_asset({"'http://purl.org/dc/terms/type'": {"@id": dtr_type}}))
+        self.assertFalse(self.manager._is_dtr_asset({"dct:type": {"@id": "https://w3id.org/catenax/taxonomy#Submodel"}}))
+        self.assertFalse(self.manager._is_dtr_asset({"dct:type": [dtr_type]}))
+        self.assertFalse(self.manager._is_dtr_asset({}))
+
+    def test_get_dtrs_adds_each_catalog_in_one_batch(self):
+        connector_manager = self.manager.connector_consumer_manager
+        connector_manager.get_connectors.return_value = [CONNECTOR_URL]
+        connector_manager.connector_service.get_catalogs_by_dct_type_with_bpnl.return_value = {
+            CONNECTOR_URL: {
+                "dataset": [
+                    {"@id": f"dtr-{index}", "dct:type": self.manager.dct_type, "hasPolicy": []}
+                    for index in range(3)
+                ]
+            }
+        }
+
+        with patch.object(self.manager, "add_dtrs_batch", wraps=self.manager.add_dtrs_batch) as add_dtrs_batch:
+            dtrs = self.manager.get_dtrs(BPN)
+
+        add_dtrs_batch.assert_called_once()
+        self.assertEqual([dtr["asset_id"] for dtr in dtrs], ["dtr-0", "dtr-1", "dtr-2"])
+
+    def test_fetch_shell_descriptors_skips_failures(self):
+        def fetch(shell_uuid, dataplane_url, headers):
+            if shell_uuid == "broken":
+                raise RuntimeError("boom")
+            if shell_uuid == "missing":
+                return None
+            return {"id": shell_uuid}
+
+        with patch.object(self.manager, "_fetch_shell_descriptor", side_effect=fetch):
+            shells = self.manager._fetch_shell_descriptors({"result": ["a", "broken", "missing", "b"]}, "https://dataplane", {"Authorization": "token"})
+
+        self.assertEqual([shell["id"] for shell in shells], ["a", "b"])
+
+    def test_single_shell_descriptor_is_fetched_without_the_pool(self):
+        with patch.object(self.manager, "_fetch_shell_descriptor", return_value={"id": "a"}), \
+                patch.object(self.manager, "_get_fetch_executor") as mock_executor:
+            shells = self.manager._fetch_shell_descriptors({"result": ["a"]}, "https://dataplane", {"Authorization": "token"})
+
+        self.assertEqual(shells, [{"id": "a"}])
+        mock_executor.assert_not_called()
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.HttpTools.do_get_with_session")
+    def test_dataplane_requests_share_the_session_and_headers(self, mock_get):
+        mock_get.return_value = MagicMock(status_code=200, content=b'{"id": "shell-1"}')
+
+        headers = {"Authorization": "token"}
+        self.manager._fetch_shell_descriptors({"result": ["shell-1", "shell-2"]}, "https://dataplane", headers)
+
+        sessions = {call.kwargs["session"] for call in mock_get.call_args_list}
+        self.assertEqual(sessions, {self.manager._session})
+        self.assertTrue(all(call.kwargs["headers"] is headers for call in mock_get.call_args_list))
+
+    def test_discover_shells_queries_dtrs_in_parallel(self):
+        dtrs = [{"connector_url": CONNECTOR_URL, "asset_id": f"dtr-{index}", "policies": []} for index in range(3)]
+        # Every DTR query waits for the others, which only completes if they run concurrently
+        barrier = threading.Barrier(len(dtrs), timeout=5)
+
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=None, cursor=None):
+            barrier.wait()
+            shell_id = f"{dtr['asset_id']}-shell"
+            return {"assetId": dtr["asset_id"], "shells": [shell_id], "paging_metadata": {}}, {shell_id: {"id": shell_id}}
+
+        with patch.object(self.manager, "get_dtrs", return_value=dtrs), \
+                patch.object(self.manager, "_process_dtr_with_retry", side_effect=process):
+            result = self.manager.discover_shells(BPN, [{"name": "partInstanceId", "value": "X"}])
+
+        self.assertEqual([dtr["assetId"] for dtr in result["dtrs"]], ["dtr-0", "dtr-1", "dtr-2"])
+        self.assertEqual([shell["id"] for shell in result["shellDescriptors"]], ["dtr-0-shell", "dtr-1-shell", "dtr-2-shell"])
+
+    def test_discover_shells_keeps_policy_logs_of_parallel_queries(self):
+        dsp_logger = logging.getLogger("tractusx_sdk.dataspace.tools.dsp_tools")
+        previous_level = dsp_logger.level
+        dsp_logger.setLevel(logging.DEBUG)
+        self.addCleanup(dsp_logger.setLevel, previous_level)
+        dtrs = [{"connector_url": CONNECTOR_URL, "asset_id": f"dtr-{index}", "policies": []} for index in range(2)]
+
+        def process(connector_service, counter_party_id, dtr, query_spec, dtr_policies, limit=None, cursor=None):
+            dsp_logger.debug("policy mismatch for %s", dtr["asset_id"])
+            return {"assetId": dtr["asset_id"], "shells": [], "paging_metadata": {}}, {}
+
+        captured = []
+        with patch.object(self.manager, "get_dtrs", return_value=dtrs), \
+                patch.object(self.manager, "_process_dtr_with_retry", side_effect=process):
+            run_with_policy_log_capture(self.manager.discover_shells, captured)(BPN, [])
+
+        self.assertCountEqual(captured, ["policy mismatch for dtr-0", "policy mismatch for dtr-1"])
+
+    def test_discover_shell_answers_without_waiting_for_slow_dtrs(self):
+        dtrs = [{"connector_url": CONNECTOR_URL, "asset_id": f"dtr-{index}", "policies": []} for index in range(3)]
+        release = threading.Event()
+
+        def probe(connector_service, counter_party_id, id, dtr, dtr_policies=None):
+            if dtr["asset_id"] != "dtr-2":
+                # The DTRs without the shell hang until the test finishes
+                release.wait(timeout=5)
+                return None
+            return {"shell_descriptor": {"id": id}, "dtr": {"connectorUrl": CONNECTOR_URL, "assetId": dtr["asset_id"]}}
+
+        with patch.object(self.manager, "get_dtrs", return_value=dtrs), \
+                patch.object(self.manager, "_probe_dtr_for_shell", side_effect=probe):
+            result = self.manager.discover_shell(BPN, "shell-1")
+            answered_early = not release.is_set()
+            release.set()
+
+        self.assertTrue(answered_early)
+        self.assertEqual(result["dtr"]["assetId"], "dtr-2")
+        self.assertEqual(result["shell_descriptor"], {"id": "shell-1"})
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.time.sleep")
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.HttpTools.do_post_with_session")
+    def test_dtr_retries_back_off_on_transient_errors(self, mock_post, mock_sleep):
+        connector_service = MagicMock()
+        connector_service.do_dsp_with_bpnl.return_value = ("https://dataplane", "token")
+        mock_post.return_value = MagicMock(status_code=503)
+        dtr = {"connector_url": CONNECTOR_URL, "asset_id": "dtr-1", "policies": ["policy"]}
+
+        with patch.object(self.manager, "_purge_edr_from_db"):
+            result, shells = self.manager._process_dtr_with_retry(connector_service, BPN, dtr, [], max_retries=2)
+
+        self.assertEqual(result["error"], "HTTP 503 after 3 attempts")
+        self.assertEqual(shells, {})
+        self.assertEqual(mock_post.call_count, 3)
+        # One backoff between each pair of attempts, growing exponentially within the jitter bounds
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0.5 <= delays[0] <= 1.5)
+        self.assertTrue(1.0 <= delays[1] <= 3.0)
+        # Every failed attempt deletes the connection under the checksums the SDK stored it with
+        expected_checksum = hashlib.sha3_256(str(["policy"]).encode("utf-8")).hexdigest()
+        deletes = connector_service.connection_manager.delete_connection.call_args_list
+        self.assertEqual(len(deletes), 3)
+        self.assertEqual({call.kwargs["policy_checksum"] for call in deletes}, {expected_checksum})
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.time.sleep")
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.HttpTools.do_post_with_session")
+    def test_dtr_client_errors_are_not_retried(self, mock_post, mock_sleep):
+        connector_service = MagicMock()
+        connector_service.do_dsp_with_bpnl.return_value = ("https://dataplane", "token")
+        mock_post.return_value = MagicMock(status_code=403)
+        dtr = {"connector_url": CONNECTOR_URL, "asset_id": "dtr-1", "policies": ["policy"]}
+
+        with patch.object(self.manager, "_purge_edr_from_db"):
+            result, _ = self.manager._process_dtr_with_retry(connector_service, BPN, dtr, [], max_retries=2)
+
+        self.assertEqual(result["error"], "HTTP 403")
+        self.assertEqual(mock_post.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.HttpTools.do_post_with_session")
+    def test_lookup_paging_parameters_are_url_encoded(self, mock_post):
+        connector_service = MagicMock()
+        connector_service.do_dsp_with_bpnl.return_value = ("https://dataplane", "token")
+        mock_post.return_value = MagicMock(status_code=200, content=b'{"result": []}')
+        dtr = {"connector_url": CONNECTOR_URL, "asset_id": "dtr-1", "policies": ["policy"]}
+
+        self.manager._process_dtr_with_retry(connector_service, BPN, dtr, [], limit=10, cursor="a=b&c")
+
+        self.assertEqual(
+            mock_post.call_args.kwargs["url"],
+            "https://dataplane/lookup/shellsByAssetLink?limit=10&cursor=a%3Db%26c"
+        )
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.time.sleep")
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.HttpTools.do_post_with_session")
+    def test_only_network_errors_are_retried(self, mock_post, mock_sleep):
+        connector_service = MagicMock()
+        connector_service.do_dsp_with_bpnl.return_value = ("https://dataplane", "token")
+        dtr = {"connector_url": CONNECTOR_URL, "asset_id": "dtr-1", "policies": ["policy"]}
+
+        mock_post.side_effect = [requests.exceptions.Timeout("read timed out"), MagicMock(status_code=200, content=b'{"result": []}')]
+        with patch.object(self.manager, "_purge_edr_from_db"):
+            result, _ = self.manager._process_dtr_with_retry(connector_service, BPN, dtr, [], max_retries=2)
+        self.assertEqual(result["status"], "connected")
+        self.assertEqual(mock_post.call_count, 2)
+
+        mock_post.reset_mock()
+        connector_service.do_dsp_with_bpnl.side_effect = RuntimeError("no valid policy in the catalog")
+        with patch.object(self.manager, "_purge_edr_from_db"):
+            result, _ = self.manager._process_dtr_with_retry(connector_service, BPN, dtr, [], max_retries=2)
+        self.assertEqual(result["error"], "no valid policy in the catalog")
+        self.assertEqual(connector_service.do_dsp_with_bpnl.call_count, 3)
+        mock_post.assert_not_called()
+        self.assertEqual(mock_sleep.call_count, 1)
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.time.sleep")
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.HttpTools.do_post_with_session")
+    def test_failing_connector_is_skipped_once_its_breaker_opens(self, mock_post, mock_sleep):
+        connector_service = MagicMock()
+        connector_service.do_dsp_with_bpnl.side_effect = ConnectionError("unreachable")
+        dtr = {"connector_url": CONNECTOR_URL, "asset_id": "dtr-1", "policies": ["policy"]}
+
+        with patch.object(self.manager, "_purge_edr_from_db"):
+            self.manager._process_dtr_with_retry(connector_service, BPN, dtr, [], max_retries=2)
+            result, _ = self.manager._process_dtr_with_retry(connector_service, BPN, dtr, [], max_retries=2)
+
+        self.assertIn("is open", result["error"])
+        self.assertEqual(connector_service.do_dsp_with_bpnl.call_count, 3)
+        # Other connectors of the same counter party are not affected
+        self.assertEqual(self.manager._breaker_for(BPN, "https://other.example.com").state, "closed")
+
+    def test_discover_submodel_by_semantic_ids_requires_all_ids(self):
+        part_type = {"type": "GlobalReference", "value": "urn:samm:io.catenax.part_type_information:1.0.0#PartTypeInformation"}
+        extra = {"type": "GlobalReference", "value": "urn:samm:io.catenax.extra:1.0.0#Extra"}
+        shell = {
+            "id": "shell-1",
+            "submodelDescriptors": [
+                {"id": "sm-1", "semanticId": {"type": "ExternalReference", "keys": [part_type]}},
+                {"id": "sm-2", "semanticId": {"type": "ExternalReference", "keys": [part_type, extra]}},
+                {"id": "sm-3", "semanticId": {"type": "ExternalReference", "keys": [extra]}},
+                {"id": "sm-4", "semanticId": {"type": "ExternalReference", "keys": [{"value": part_type["value"]}, part_type]}},
+            ],
+        }
+        shell_result = {"shell_descriptor": shell, "dtr": {"connectorUrl": CONNECTOR_URL, "assetId": "dtr-1"}}
+
+        with patch.object(self.manager, "discover_shell", return_value=shell_result):
+            result = self.manager.discover_submodel_by_semantic_ids(BPN, "shell-1", semantic_ids=[part_type])
+            both = self.manager.discover_submodel_by_semantic_ids(BPN, "shell-1", semantic_ids=[extra, part_type])
+
+        self.assertEqual(list(result["submodelDescriptors"]), ["sm-1", "sm-2", "sm-4"])
+        self.assertEqual(list(both["submodelDescriptors"]), ["sm-2"])
+        self.assertEqual(
+            result["submodelDescriptors"]["sm-1"]["semanticIdKeys"],
+            self.manager._create_semantic_ids_base64(shell["submodelDescriptors"][0])
+        )
+
+    @patch("managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager.time.sleep")
+    def test_submodel_renegotiation_backs_off_until_the_deadline(self, mock_sleep):
+        submodel_info = SubmodelFetch(submodel_id="sm-1", semantic_id=None, policies=["policy"], asset_id="asset-1", connector_url=CONNECTOR_URL, href="https://dataplane/sm-1")
+        response = {"submodelDescriptor": {"status": "pending"}, "submodel": {}}
+
+        with patch.object(self.manager, "_negotiate_asset", side_effect=[ConnectionError("stale EDR"), "token"]), \
+                patch.object(self.manager, "_purge_asset_cache", return_value=True), \
+                patch.object(self.manager, "_fetch_submodel_data_with_token", return_value={"value": 1}):
+            result = self.manager._fetch_single_submodel_data(BPN, submodel_info, response)
+
+        self.assertEqual(result["submodelDescriptor"]["status"], "success")
+        delay = mock_sleep.call_args.args[0]
+        self.assertTrue(0.5 <= delay <= 1.0)
+        self.assertLessEqual(self.manager._get_submodel_retry_delay(10, float("inf")), 5.5)
+        self.assertEqual(self.manager._get_submodel_retry_delay(0, 0.0), 0.0)
+
+    def test_concurrent_negotiations_of_an_asset_are_shared(self):
+        release = threading.Event()
+        calls = []
+
+        def negotiate(counter_party_id, asset_id, dsp_endpoint_url, policies):
+            calls.append(asset_id)
+            release.wait(timeout=5)
+            return "token"
+
+        results = []
+        with patch.object(self.manager, "_do_negotiate_asset", side_effect=negotiate):
+            threads = [
+                threading.Thread(target=lambda: results.append(self.manager._negotiate_asset(BPN, "asset-1", CONNECTOR_URL, ["policy"])))
+                for _ in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            while len(self.manager._inflight_negotiations) == 0:
+                time.sleep(0.001)
+            time.sleep(0.05)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(calls, ["asset-1"])
+        self.assertEqual(results, ["token"] * 3)
+        self.assertEqual(self.manager._inflight_negotiations, {})
+
+    def test_refused_negotiations_are_remembered_until_purged(self):
+        refusal = RuntimeError("No valid policy found")
+        with patch.object(self.manager, "_do_negotiate_asset", side_effect=[refusal, None, "token"]) as negotiate, \
+                patch.object(self.manager, "_purge_edr_from_db", return_value=0):
+            for _ in range(2):
+                with self.assertRaises(RuntimeError):
+                    self.manager._negotiate_asset(BPN, "asset-1", CONNECTOR_URL, ["policy"])
+            self.assertIsNone(self.manager._negotiate_asset(BPN, "asset-2", CONNECTOR_URL, ["policy"]))
+            self.assertIsNone(self.manager._negotiate_asset(BPN, "asset-2", CONNECTOR_URL, ["policy"]))
+            self.assertEqual(negotiate.call_count, 2)
+
+            self.manager.purge_edr(BPN, "asset-1")
+            self.assertEqual(self.manager._negotiate_asset(BPN, "asset-1", CONNECTOR_URL, ["policy"]), "token")
+
+    def test_remembered_refusals_are_raised_as_fresh_exceptions(self):
+        refusal = ValueError("No valid policy found")
+        with patch.object(self.manager, "_do_negotiate_asset", side_effect=[refusal]):
+            with self.assertRaises(ValueError):
+                self.manager._negotiate_asset(BPN, "asset-1", CONNECTOR_URL, ["policy"])
+            raised = []
+            for _ in range(2):
+                # Caught directly, because assertRaises drops the traceback
+                try:
+                    self.manager._negotiate_asset(BPN, "asset-1", CONNECTOR_URL, ["policy"])
+                except ValueError as e:
+                    raised.append(e)
+
+        first, second = raised
+        self.assertIsNot(first, refusal)
+        self.assertIsNot(second, first)
+        self.assertEqual(str(second), "No valid policy found")
+        # Only this test and _negotiate_asset, however often the refusal was answered from memory
+        self.assertEqual(len(traceback.extract_tb(second.__traceback__)), 2)
+
+    def test_network_failures_of_a_negotiation_are_not_remembered(self):
+        with patch.object(self.manager, "_do_negotiate_asset", side_effect=[ConnectionError("unreachable"), "token"]):
+            with self.assertRaises(ConnectionError):
+                self.manager._negotiate_asset(BPN, "asset-1", CONNECTOR_URL, ["policy"])
+            self.assertEqual(self.manager._negotiate_asset(BPN, "asset-1", CONNECTOR_URL, ["policy"]), "token")
+
+        self.assertEqual(self.manager._failed_negotiations, {})
+
+    def test_dataplane_failures_of_a_batch_are_purged_together(self):
+        submodels = [
+            SubmodelFetch(submodel_id=f"sm-{index}", semantic_id=None, policies=["policy"], asset_id=f"asset-{index}", connector_url=CONNECTOR_URL, href=f"https://dataplane/sm-{index}")
+            for index in range(3)
+        ]
+        response = {"submodelDescriptors": {item.submodel_id: {"status": "pending"} for item in submodels}, "submodels": {}}
+        connection_manager = self.manager.connector_consumer_manager.connector_service.connection_manager
+        connection_manager._edr_tracked = {
+            "edr-0": {"edr_data": {"assetId": "asset-0"}},
+            "edr-2": {"edr_data": {"assetId": "asset-2"}},
+        }
+
+        def fetch(submodel_id, href, access_token):
+            if submodel_id == "sm-1":
+                return {"value": 1}
+            raise RuntimeError("HTTP 502")
+
+        with patch.object(self.manager, "_negotiate_asset", return_value="token"), \
+                patch.object(self.manager, "_fetch_submodel_data_with_token", side_effect=fetch), \
+                patch.object(self.manager, "_purge_edrs_from_db") as purge_from_db:
+            self.manager._fetch_submodels_data(BPN, submodels, response)
+
+        purge_from_db.assert_called_once_with(BPN, ["asset-0", "asset-2"])
+        self.assertEqual(connection_manager._edr_tracked, {})
+        self.assertEqual(response["submodelDescriptors"]["sm-1"]["status"], "success")
+
+    def test_submodels_are_fetched_while_other_assets_still_negotiate(self):
+        submodels = [
+            SubmodelFetch(submodel_id=f"sm-{asset}", semantic_id=None, policies=["policy"], asset_id=asset, connector_url=CONNECTOR_URL, href=f"https://dataplane/{asset}")
+            for asset in ("fast", "slow")
+        ]
+        response = {"submodelDescriptors": {item.submodel_id: {"status": "pending"} for item in submodels}, "submodels": {}}
+        fast_fetched = threading.Event()
+
+        def negotiate(counter_party_id, asset_id, dsp_endpoint_url, policies):
+            # The slow negotiation only succeeds if the fast asset was fetched in the meantime
+            if asset_id == "slow" and not fast_fetched.wait(timeout=5):
+                return None
+            return f"token-{asset_id}"
+
+        def fetch(submodel_id, href, access_token):
+            if submodel_id == "sm-fast":
+                fast_fetched.set()
+            return {"token": access_token}
+
+        with patch.object(self.manager, "_negotiate_asset", side_effect=negotiate), \
+                patch.object(self.manager, "_fetch_submodel_data_with_token", side_effect=fetch):
+            self.manager._fetch_submodels_data(BPN, submodels, response)
+
+        self.assertEqual(response["submodels"], {"sm-fast": {"token": "token-fast"}, "sm-slow": {"token": "token-slow"}})
+        self.assertEqual({descriptor["status"] for descriptor in response["submodelDescriptors"].values()}, {"success"})
+
+    def test_negotiations_of_a_request_are_bounded_and_use_their_own_pool(self):
+        module = "managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager"
+        submodels = [
+            SubmodelFetch(submodel_id=f"sm-{index}", semantic_id=None, policies=["policy"], asset_id=f"asset-{index}", connector_url=CONNECTOR_URL, href=f"https://dataplane/{index}")
+            for index in range(5)
+        ]
+        response = {"submodelDescriptors": {item.submodel_id: {"status": "pending"} for item in submodels}, "submodels": {}}
+        lock = threading.Lock()
+        in_flight = []
+        max_in_flight = []
+        thread_names = set()
+
+        def negotiate(counter_party_id, asset_id, dsp_endpoint_url, policies):
+            with lock:
+                in_flight.append(asset_id)
+                max_in_flight.append(len(in_flight))
+                thread_names.add(threading.current_thread().name)
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(asset_id)
+            return f"token-{asset_id}"
+
+        with patch(f"{module}.MAX_NEGOTIATIONS_PER_CALL", 2), \
+                patch.object(self.manager, "_negotiate_asset", side_effect=negotiate), \
+                patch.object(self.manager, "_fetch_submodel_data_with_token", return_value={"value": 1}):
+            self.manager._fetch_submodels_data(BPN, submodels, response)
+
+        self.assertEqual(len(response["submodels"]), 5)
+        self.assertLessEqual(max(max_in_flight), 2)
+        self.assertTrue(all(name.startswith("dtr-negotiation") for name in thread_names))
+        self.assertIsNone(self.manager._dtr_executor)
+
+    def test_a_single_submodel_is_negotiated_and_fetched_on_the_calling_thread(self):
+        item = SubmodelFetch(submodel_id="sm-1", semantic_id=None, policies=["policy"], asset_id="asset-1", connector_url=CONNECTOR_URL, href="https://dataplane/sm-1")
+        response = {"submodelDescriptors": {"sm-1": {"status": "pending"}}, "submodels": {}}
+        threads = []
+
+        def negotiate(counter_party_id, asset_id, dsp_endpoint_url, policies):
+            threads.append(threading.current_thread())
+            return "token"
+
+        def fetch(submodel_id, href, access_token):
+            threads.append(threading.current_thread())
+            return {"value": 1}
+
+        with patch.object(self.manager, "_negotiate_asset", side_effect=negotiate), \
+                patch.object(self.manager, "_fetch_submodel_data_with_token", side_effect=fetch):
+            self.manager._fetch_submodels_data(BPN, [item], response)
+
+        self.assertEqual(threads, [threading.current_thread()] * 2)
+        self.assertEqual(response["submodels"], {"sm-1": {"value": 1}})
+        self.assertIsNone(self.manager._negotiation_executor)
+        self.assertIsNone(self.manager._fetch_executor)
+
+    def test_asset_purge_falls_back_to_evicting_by_asset_id(self):
+        connection_manager = self.manager.connector_consumer_manager.connector_service.connection_manager
+        connection_manager.delete_connection.return_value = False
+        connection_manager._edr_tracked = {
+            "edr-1": {"edr_data": {"assetId": "asset-1"}},
+            "edr-2": {"edr_data": {"assetId": "asset-2"}},
+        }
+        connection_manager._connection_cache = {"conn-1": {"assetId": "asset-1"}}
+
+        with patch.object(self.manager, "_purge_edr_from_db", return_value=0):
+            self.assertTrue(self.manager._purge_asset_cache(BPN, "asset-1", CONNECTOR_URL, ["policy"]))
+            self.assertFalse(self.manager._purge_asset_cache(BPN, "asset-3", CONNECTOR_URL, ["policy"]))
+
+        self.assertEqual(list(connection_manager._edr_tracked), ["edr-2"])
+        self.assertEqual(connection_manager._connection_cache, {})
+
+    def test_shell_descriptor_cache_is_bounded(self):
+        module = "managers.enablement_services.consumer.dtr.memory.dtr_consumer_memory_manager"
+        with patch(f"{module}.SHELL_DESCRIPTORS_CACHE_SIZE", 3):
+            self.manager._cache_shell_descriptors({f"shell-{index}": {"id": f"shell-{index}"} for index in range(3)})
+            self.manager._cache_shell_descriptors({"shell-0": {"id": "shell-0"}, "shell-3": {"id": "shell-3"}})
+
+        self.assertEqual(list(self.manager.shell_descriptors), ["shell-2", "shell-0", "shell-3"])
+
+    def test_submodel_endpoint_info_is_read_from_the_submodel_endpoint(self):
+        submodel = {
+            "endpoints": [
+                {"interface": "AAS-3.0", "protocolInformation": {"href": "https://other.example.com"}},
+                {
+                    "interface": "SUBMODEL-3.0",
+                    "protocolInformation": {
+                        "href": "https://dataplane.example.com/submodels/urn:uuid:sm-1",
+                        "subprotocolBody": "id=asset-1;dspEndpoint=https://connector.example.com/api/v1/dsp?a=b;malformed",
+                    },
+                },
+            ]
+        }
+
+        self.assertEqual(
+            self.manager._extract_submodel_endpoint_info(submodel),
+            ("asset-1", "https://connector.example.com/api/v1/dsp?a=b", "https://dataplane.example.com/submodels/sm-1")
+        )
+        self.assertEqual(
+            self.manager._extract_submodel_endpoint_info({"endpoints": submodel["endpoints"][:1]}),
+            ("unknown", "unknown", "unknown")
+        )
+
+    def test_fetch_executor_is_reused_until_closed(self):
+        executor = self.manager._get_fetch_executor()
+        self.assertIs(self.manager._get_fetch_executor(), executor)
+
+        self.manager.close()
+        self.manager.close()
+        self.assertIsNot(self.manager._get_fetch_executor(), executor)
+
+
+if __name__ == "__main__":
+    unittest.main()
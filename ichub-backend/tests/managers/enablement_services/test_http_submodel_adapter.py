@@ -0,0 +1,312 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 LKS Next
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import asyncio
+import unittest
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+
+from managers.enablement_services.adapters import AsyncHttpSubmodelAdapter, HttpSubmodelAdapter
+from tools.exceptions import InvalidError, NotFoundError, ServiceUnavailableError
+
+SEMANTIC_ID = "urn:samm:io.catenax.part_type_information:1.0.0#PartTypeInformation"
+BASE_URL = "http://external-ichub"
+
+
+class TestHttpSubmodelAdapter(unittest.TestCase):
+    """Tests for the synchronous HTTP submodel adapter."""
+
+    def setUp(self):
+        self.requests = []
+        self.adapter = HttpSubmodelAdapter(base_url=BASE_URL, api_path="/api/v1", auth_type="bearer", auth_token="token")
+        self.adapter.client = httpx.Client(headers=self.adapter.client.headers, transport=httpx.MockTransport(self._handler))
+
+    def _handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, json={"id": "part"})
+        if request.method == "HEAD":
+            return httpx.Response(404)
+        return httpx.Response(204)
+
+    def test_read_submodel_builds_encoded_url_and_headers(self):
+        submodel_id = uuid4()
+        result = self.adapter.read_submodel(SEMANTIC_ID, submodel_id)
+
+        self.assertEqual(result, {"id": "part"})
+        request = self.requests[0]
+        self.assertTrue(str(request.url).startswith(f"{BASE_URL}/api/v1/urn%3Asamm"))
+        self.assertTrue(str(request.url).endswith(f"/{submodel_id}/submodel"))
+        self.assertEqual(request.headers["Authorization"], "Bearer token")
+
+    def test_client_options_cap_connect_timeout(self):
+        options = HttpSubmodelAdapter(base_url=BASE_URL, auth_type="none", timeout=2)._get_client_options()
+
+        self.assertEqual(options["timeout"].connect, 2)
+        self.assertEqual(options["timeout"].read, 2)
+        self.assertEqual(HttpSubmodelAdapter(base_url=BASE_URL, auth_type="none")._get_client_options()["timeout"].connect, 5.0)
+
+    def test_exists_submodel_false_on_404(self):
+        self.assertFalse(self.adapter.exists_submodel(SEMANTIC_ID, uuid4()))
+
+    def test_not_found_maps_to_not_found_error(self):
+        self.adapter.client = httpx.Client(headers=self.adapter.client.headers, transport=httpx.MockTransport(lambda request: httpx.Response(404)))
+        with self.assertRaises(NotFoundError):
+            self.adapter.read_submodel(SEMANTIC_ID, uuid4())
+
+    @patch("managers.enablement_services.adapters.http_submodel_adapter.time.sleep")
+    def test_read_retries_transient_status(self, mock_sleep):
+        responses = iter([httpx.Response(503, headers={"Retry-After": "1"}), httpx.Response(502), httpx.Response(200, json={})])
+        self.adapter.client = httpx.Client(headers=self.adapter.client.headers, transport=httpx.MockTransport(lambda request: next(responses)))
+
+        self.assertEqual(self.adapter.read_submodel(SEMANTIC_ID, uuid4()), {})
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(mock_sleep.call_args_list[0].args[0], 1.0)
+
+    @patch("managers.enablement_services.adapters.http_submodel_adapter.time.sleep")
+    def test_write_does_not_retry_after_response(self, mock_sleep):
+        self.adapter.client = httpx.Client(headers=self.adapter.client.headers, transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+
+        with self.assertRaises(RuntimeError):
+            self.adapter.write_submodel(SEMANTIC_ID, uuid4(), {"id": "part"})
+        mock_sleep.assert_not_called()
+
+    @patch("managers.enablement_services.adapters.http_submodel_adapter.time.sleep")
+    def test_write_retries_connect_error(self, mock_sleep):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("connection refused", request=request)
+            return httpx.Response(201)
+
+        self.adapter.client = httpx.Client(headers=self.adapter.client.headers, transport=httpx.MockTransport(handler))
+
+        self.adapter.write_submodel(SEMANTIC_ID, uuid4(), {"id": "part"})
+        self.assertEqual(len(attempts), 2)
+        mock_sleep.assert_called_once()
+
+    def test_write_invalidates_existence_checked_while_in_flight(self):
+        submodel_id = uuid4()
+        heads = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "HEAD":
+                heads.append(request)
+                return httpx.Response(404)
+            # A concurrent existence check lands while the upload is in flight
+            self.adapter.exists_submodel(SEMANTIC_ID, submodel_id)
+            return httpx.Response(201)
+
+        self.adapter.client = httpx.Client(headers=self.adapter.client.headers, transport=httpx.MockTransport(handler))
+
+        self.adapter.write_submodel(SEMANTIC_ID, submodel_id, {"id": "part"})
+        self.adapter.exists_submodel(SEMANTIC_ID, submodel_id)
+        self.assertEqual(len(heads), 2)
+
+    def test_circuit_breaker_fails_fast_after_consecutive_failures(self):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(500)
+
+        self.adapter.max_retries = 0
+        self.adapter.client = httpx.Client(headers=self.adapter.client.headers, transport=httpx.MockTransport(handler))
+
+        for _ in range(5):
+            with self.assertRaises(RuntimeError):
+                self.adapter.read_submodel(SEMANTIC_ID, uuid4())
+        with self.assertRaises(ServiceUnavailableError):
+            self.adapter.read_submodel(SEMANTIC_ID, uuid4())
+        self.assertEqual(len(attempts), 5)
+
+    def test_semantic_id_cache_evicts_least_recently_used(self):
+        adapter = HttpSubmodelAdapter(base_url=BASE_URL, auth_type="none", semantic_id_cache_size=2)
+        adapter.cache_semantic_id("hash-a", "semantic-a")
+        adapter.cache_semantic_id("hash-b", "semantic-b")
+        adapter._resolve_semantic_id("hash-a")
+        adapter.cache_semantic_id("hash-c", "semantic-c")
+
+        self.assertEqual(adapter._resolve_semantic_id("hash-a"), "semantic-a")
+        self.assertIsNone(adapter._resolve_semantic_id("hash-b"))
+        self.assertEqual(adapter._resolve_semantic_id("hash-c"), "semantic-c")
+
+    def test_path_based_read_resolves_cached_semantic_id(self):
+        submodel_id = uuid4()
+        self.adapter.cache_semantic_id("hash", SEMANTIC_ID)
+
+        self.assertEqual(self.adapter.read(f"hash/{submodel_id}.json"), {"id": "part"})
+        self.assertTrue(str(self.requests[0].url).endswith(f"/{submodel_id}/submodel"))
+
+    def test_path_based_operations_reject_unresolvable_paths(self):
+        with self.assertRaises(InvalidError):
+            self.adapter.read(f"unknown-hash/{uuid4()}.json")
+        with self.assertRaises(InvalidError):
+            self.adapter.delete("hash/not-a-uuid.json")
+        self.assertFalse(self.adapter.exists("hash-only"))
+        self.assertEqual(self.requests, [])
+
+    def test_write_submodel_sends_compact_json(self):
+        self.adapter.write_submodel(SEMANTIC_ID, uuid4(), {"id": "part", "name": "Bremse"})
+
+        request = self.requests[0]
+        self.assertEqual(request.content, b'{"id":"part","name":"Bremse"}')
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+
+    def test_context_manager_closes_client(self):
+        with HttpSubmodelAdapter(base_url=BASE_URL, auth_type="none") as adapter:
+            self.assertFalse(adapter.client.is_closed)
+        self.assertTrue(adapter.client.is_closed)
+        adapter.close()
+
+    def test_read_submodel_revalidates_with_etag(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"id": "part"}, headers={"ETag": '"v1"'})
+
+        self.adapter.client = httpx.Client(headers=self.adapter.client.headers, transport=httpx.MockTransport(handler))
+        submodel_id = uuid4()
+
+        first = self.adapter.read_submodel(SEMANTIC_ID, submodel_id)
+        first["id"] = "mutated"
+        second = self.adapter.read_submodel(SEMANTIC_ID, submodel_id)
+
+        self.assertEqual(second, {"id": "part"})
+        self.assertNotIn("If-None-Match", self.requests[0].headers)
+        self.assertEqual(self.requests[1].headers["If-None-Match"], '"v1"')
+
+    def test_exists_submodel_is_cached_until_modified(self):
+        submodel_id = uuid4()
+
+        self.assertFalse(self.adapter.exists_submodel(SEMANTIC_ID, submodel_id))
+        self.assertFalse(self.adapter.exists_submodel(SEMANTIC_ID, submodel_id))
+        self.assertEqual(len(self.requests), 1)
+
+        self.adapter.write_submodel(SEMANTIC_ID, submodel_id, {"id": "part"})
+        self.adapter.exists_submodel(SEMANTIC_ID, submodel_id)
+        self.assertEqual([request.method for request in self.requests], ["HEAD", "POST", "HEAD"])
+
+    def test_error_message_includes_bounded_body_preview(self):
+        body = "<html>" + "ä" * 1000 + "</html>"
+        self.adapter.client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(400, text=body)))
+
+        with self.assertRaises(InvalidError) as context:
+            self.adapter.read_submodel(SEMANTIC_ID, uuid4())
+        self.assertIn("<html>ää", str(context.exception))
+        self.assertLess(len(str(context.exception)), 400)
+
+    def test_invalid_base_url_is_rejected(self):
+        with self.assertRaises(ValueError):
+            HttpSubmodelAdapter(base_url="external-ichub/api", auth_type="none")
+
+
+class TestAsyncHttpSubmodelAdapter(unittest.TestCase):
+    """Tests for the asynchronous HTTP submodel adapter."""
+
+    def _create_adapter(self, handler) -> AsyncHttpSubmodelAdapter:
+        adapter = AsyncHttpSubmodelAdapter(base_url=BASE_URL, auth_type="apikey", auth_token="secret", auth_key_name="X-Api-Key")
+        adapter.client = httpx.AsyncClient(headers=adapter.client.headers, transport=httpx.MockTransport(handler))
+        return adapter
+
+    def test_concurrent_reads(self):
+        seen_keys = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_keys.append(request.headers["X-Api-Key"])
+            return httpx.Response(200, json={"path": request.url.path})
+
+        async def run():
+            async with self._create_adapter(handler) as adapter:
+                return await asyncio.gather(*(adapter.read_submodel(SEMANTIC_ID, uuid4()) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(results), 5)
+        self.assertEqual(seen_keys, ["secret"] * 5)
+
+    def test_exists_submodel(self):
+        async def run():
+            async with self._create_adapter(lambda request: httpx.Response(200)) as adapter:
+                return await adapter.exists_submodel(SEMANTIC_ID, uuid4())
+
+        self.assertTrue(asyncio.run(run()))
+
+    def test_exists_many_preserves_order_and_bounds_concurrency(self):
+        existing = {uuid4() for _ in range(3)}
+        missing = [uuid4() for _ in range(3)]
+        pairs = [(SEMANTIC_ID, submodel_id) for submodel_id in [*existing, *missing]]
+        in_flight = []
+        max_in_flight = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            in_flight.append(request)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(request)
+            submodel_id = request.url.path.split("/")[-2]
+            return httpx.Response(200 if any(str(e) == submodel_id for e in existing) else 404)
+
+        async def run():
+            async with self._create_adapter(handler) as adapter:
+                return await adapter.exists_many(pairs, concurrency=2)
+
+        self.assertEqual(asyncio.run(run()), [True] * 3 + [False] * 3)
+        self.assertLessEqual(max(max_in_flight), 2)
+
+    def test_cancelled_probe_does_not_leave_breaker_half_open(self):
+        probe_started = asyncio.Event()
+        responses = {"mode": "fail"}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if responses["mode"] == "fail":
+                return httpx.Response(500)
+            if responses["mode"] == "hang":
+                probe_started.set()
+                await asyncio.Event().wait()
+            return httpx.Response(200, json={})
+
+        async def run():
+            async with self._create_adapter(handler) as adapter:
+                adapter.max_retries = 0
+                for _ in range(adapter._breaker.fail_max):
+                    with self.assertRaises(RuntimeError):
+                        await adapter.read_submodel(SEMANTIC_ID, uuid4())
+                adapter._breaker.reset_timeout = 0
+
+                responses["mode"] = "hang"
+                probe = asyncio.create_task(adapter.read_submodel(SEMANTIC_ID, uuid4()))
+                await probe_started.wait()
+                probe.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await probe
+
+                responses["mode"] = "ok"
+                return await adapter.read_submodel(SEMANTIC_ID, uuid4())
+
+        self.assertEqual(asyncio.run(run()), {})
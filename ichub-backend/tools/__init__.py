@@ -39,5 +39,6 @@ from .exceptions import (
     ExternalAPIError,
     SubmodelNotSharedWithBusinessPartnerError,
     DppNotFoundError,
-    DppShareError
+    DppShareError,
+    ServiceUnavailableError
 )
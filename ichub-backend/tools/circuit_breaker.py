@@ -0,0 +1,110 @@
+#################################################################################
+# Eclipse Tractus-X - Industry Core Hub Backend
+#
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License, Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND,
+# either express or implied. See the
+# License for the specific language govern in permissions and limitations
+# under the License.
+#
+# SPDX-License-Identifier: Apache-2.0
+#################################################################################
+
+import threading
+import time
+
+from tools.exceptions import ServiceUnavailableError
+
+
+class CircuitBreaker:
+    """
+    Minimal thread-safe circuit breaker for calls to external services.
+
+    The breaker opens after ``fail_max`` consecutive failures and rejects calls
+    with ServiceUnavailableError for ``reset_timeout`` seconds. After that, a
+    single probe call is let through (half-open): a success closes the breaker
+    again, a failure re-opens it for another ``reset_timeout``.
+
+    Usage:
+        breaker.before_call()
+        try:
+            result = do_call()
+        except Exception:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.record_abort()
+            raise
+        breaker.record_success()
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may be issued.
+
+        Raises:
+            ServiceUnavailableError: If the breaker is open, or half-open with a probe already in flight.
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Let exactly one probe call through
+                self._state = self.HALF_OPEN
+                return
+        raise ServiceUnavailableError(
+            f"Circuit breaker for [{self.name}] is open. Please retry later."
+        )
+
+    def record_success(self) -> None:
+        """Close the breaker and reset the failure counter."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker when the threshold is reached or a probe fails."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.fail_max:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_abort(self) -> None:
+        """
+        Report a call that ended without an outcome (e.g. it was cancelled).
+
+        Only matters for the half-open probe: the breaker re-opens, so that a new
+        probe is let through after ``reset_timeout`` instead of staying half-open.
+        """
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
@@ -205,3 +205,12 @@ class PolicyMismatchError(BaseError):
 
     def __init__(self, message: str, details: Optional[list[str]] = None) -> None:
         super().__init__(status_code=403, message=message, details=details)
+
+
+class ServiceUnavailableError(NotAvailableError):
+    """
+    Exception raised when a call is rejected without being sent because the
+    circuit breaker protecting an external service is open.
+    """
+    def __init__(self, message: str = "External service temporarily unavailable. Please retry later."):
+        super().__init__(message=message)
@@ -147,3 +147,35 @@ def run_with_policy_log_capture(fn: Callable, log_sink: list[str]) -> Callable[.
             log_sink.extend(_dsp_handler.deactivate())
 
     return _wrapper
+
+
+def propagate_policy_log_capture(fn: Callable) -> Callable[..., Any]:
+    """
+    Wrap *fn* so that, when run in another thread, its DSP policy-mismatch logs
+    are captured for the **calling** thread.
+
+    Must be called in the thread whose capture should receive the logs, typically
+    right before handing *fn* to a thread pool::
+
+        executor.submit(propagate_policy_log_capture(negotiate), dtr)
+
+    If capture is not active in the calling thread, *fn* is returned unchanged.
+
+    Args:
+        fn: The function to execute in a worker thread.
+
+    Returns:
+        A wrapper callable that captures the logs of *fn* into the calling thread's buffer.
+    """
+    bucket: list[str] | None = getattr(_dsp_handler._local, "records", None)
+    if bucket is None:
+        return fn
+
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        _dsp_handler.activate()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            bucket.extend(_dsp_handler.deactivate())
+
+    return _wrapper